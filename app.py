@@ -1,6 +1,9 @@
 import streamlit as st
 from pawpal_system import Owner, Pet, Task, Scheduler
-from datetime import date, datetime
+from pawpal_planner import plan_day
+from pawpal_concurrent import ThreadSafeScheduler
+import pawpal_profiling
+from datetime import date, datetime, time
 
 
 
@@ -40,6 +43,31 @@ At minimum, your system should:
 """
     )
 
+# Instrumentation must be switched on before the scheduler work below runs.
+# It patches the classes for the whole server process, so only this
+# session's own clicks switch it; ordinary reruns leave it alone.
+with st.sidebar:
+    profile = st.checkbox("Profile scheduler calls", value=pawpal_profiling.is_enabled(),
+                          help="Profiling is process-wide: it records and slows down "
+                               "every open session, not just this one.")
+    if st.session_state.get("profile", profile) != profile:
+        if profile:
+            pawpal_profiling.enable()
+        else:
+            pawpal_profiling.disable()
+    st.session_state.profile = profile
+    if profile:
+        st.caption("Profiling is on for every session of this server.")
+    shared = st.checkbox("Shared kennel schedule", value=False,
+                         help="Work on one schedule shared by every open session.")
+
+
+@st.cache_resource
+def kennel_scheduler():
+    """Return the one scheduler shared by all sessions of this server."""
+    return ThreadSafeScheduler()
+
+
 st.divider()
 
 st.subheader("Quick Demo Inputs (UI only)")
@@ -48,8 +76,11 @@ pet_name = st.text_input("Pet name", value="Mochi")
 species = st.selectbox("Species", ["dog", "cat", "other"])
 
 st.markdown("### Tasks")
-st.caption("Add a few tasks. In your final version, these should feed into your scheduler.")
+st.caption("Add, edit or remove tasks. Changes are applied to a long-lived scheduler.")
 
+# The owner, pet and scheduler live for the whole session. Each widget event
+# is applied as a delta (add, edit or remove one task) instead of rebuilding
+# everything on every rerun.
 if "owner" not in st.session_state:
     st.session_state.owner = Owner(
         name="",
@@ -57,8 +88,43 @@ if "owner" not in st.session_state:
         phone="0000000000"
     )
 
-if "tasks" not in st.session_state:
-    st.session_state.tasks = []
+if "pet" not in st.session_state:
+    st.session_state.pet = Pet(
+        name=pet_name,
+        species=species,
+        breed="Unknown",
+        date_of_birth=date(2020, 1, 1)
+    )
+    st.session_state.owner.add_pet(st.session_state.pet)
+
+if st.session_state.get("shared") != shared:
+    # Move this session's tasks (and only those) out of the schedule it leaves
+    if "scheduler" in st.session_state:
+        st.session_state.scheduler.unregister_owner(st.session_state.owner)
+    st.session_state.shared = shared
+    st.session_state.scheduler = kennel_scheduler() if shared else Scheduler()
+    st.session_state.scheduler.register_owner(st.session_state.owner)
+    # view name -> (key, value); see cached_view()
+    st.session_state.views = {}
+
+owner = st.session_state.owner
+pet = st.session_state.pet
+scheduler = st.session_state.scheduler
+owner.name = owner_name
+if pet.name != pet_name:
+    owner.rename_pet(pet.name, pet_name)
+pet.species = species
+
+
+def cached_view(name, compute, *key):
+    """Return a derived view, recomputing it only when the scheduler (or key) changed."""
+    full_key = (scheduler.version,) + key
+    cached = st.session_state.views.get(name)
+    if cached is None or cached[0] != full_key:
+        cached = (full_key, compute())
+        st.session_state.views[name] = cached
+    return cached[1]
+
 
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -69,79 +135,103 @@ with col3:
     priority = st.selectbox("Priority", ["low", "medium", "high"], index=2)
 
 if st.button("Add task"):
-    st.session_state.tasks.append(
-        {"title": task_title, "duration_minutes": int(duration), "priority": priority}
+    new_task = Task(
+        title=task_title,
+        description="Generated from UI",
+        category="general",
+        scheduled_time=datetime.combine(date.today(), time(8, 0)),
+        priority=priority,
+        duration_minutes=int(duration)
     )
+    pet.add_task(new_task)
+    scheduler.add_task(new_task)
 
-if st.session_state.tasks:
+tasks = cached_view("tasks", lambda: scheduler.sort_by_time())
+if tasks:
     st.write("Current tasks:")
-    st.table(st.session_state.tasks)
+    st.table(cached_view("table", lambda: [
+        {"title": t.title, "duration_minutes": t.duration_minutes, "priority": t.priority}
+        for t in scheduler.all_tasks
+    ]))
+
+    with st.expander("Edit or remove a task"):
+        labels = {t.task_id: f"{t.title} ({t.priority}, {t.duration_minutes} min)" for t in tasks}
+        selected_id = st.selectbox("Task", list(labels), format_func=labels.get)
+        selected = scheduler.get_task(selected_id)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            edit_title = st.text_input("New title", value=selected.title)
+        with col2:
+            edit_duration = st.number_input(
+                "New duration", min_value=1, max_value=240, value=max(1, selected.duration_minutes)
+            )
+        with col3:
+            edit_priority = st.selectbox(
+                "New priority", ["low", "medium", "high"],
+                index=["low", "medium", "high"].index(selected.priority)
+            )
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Save changes"):
+                scheduler.update_task(
+                    selected_id, title=edit_title,
+                    duration_minutes=int(edit_duration), priority=edit_priority
+                )
+                st.rerun()
+        with col2:
+            # In the shared kennel, other sessions' tasks are listed but not ours to remove
+            own_task = owner.find_pet_for_task(selected_id) is not None
+            if st.button("Remove task", disabled=not own_task,
+                         help=None if own_task else "This task belongs to another session."):
+                scheduler.remove_task(selected_id)
+                pet.remove_task(selected_id)
+                st.rerun()
 else:
     st.info("No tasks yet. Add one above.")
 
 st.divider()
 
 st.subheader("Build Schedule")
-st.caption("This button should call your scheduling logic once you implement it.")
-
-if st.button("Generate schedule"):
-
-    # Use persistent owner from session_state
-    st.session_state.owner.name = owner_name
-
-    # Clear previous pets to avoid duplicates on rerun
-    st.session_state.owner.pets = []
-
-    # Create pet object
-    pet = Pet(
-        name=pet_name,
-        species=species,
-        breed="Unknown",
-        date_of_birth=date(2020, 1, 1)
-    )
-
-    st.session_state.owner.add_pet(pet)
-
-    # Create scheduler (acts as the "brain")
-    scheduler = Scheduler()
+st.caption("Tasks are chosen and ordered to fit the time you have free today.")
 
-    # Convert UI tasks into Task objects
-    for index, t in enumerate(st.session_state.tasks):
+col1, col2 = st.columns(2)
+with col1:
+    window_start = st.time_input("Free from", value=time(8, 0))
+with col2:
+    window_end = st.time_input("Free until", value=time(12, 0))
 
-        scheduled_time = datetime.now().replace(
-            hour=8 + index,
-            minute=0,
-            second=0,
-            microsecond=0
-        )
+if st.button("Generate schedule"):
+    st.session_state.show_plan = True
 
-        new_task = Task(
-            title=t["title"],
-            description="Generated from UI",
-            category="general",
-            scheduled_time=scheduled_time,
-            priority=t["priority"]
-        )
+if st.session_state.get("show_plan") and tasks:
+    today = date.today()
+    window = (datetime.combine(today, window_start), datetime.combine(today, window_end))
 
-        pet.add_task(new_task)
-        scheduler.add_task(new_task)
+    if window[1] <= window[0]:
+        st.error("The free time must end after it starts.")
+        st.stop()
 
-    sorted_tasks = scheduler.sort_by_priority()
-    conflicts = scheduler.detect_conflicts()
+    plan = cached_view("plan", lambda: plan_day(owner, [window]), window)
+    # Only tasks whose planned time differs are moved; once the plan has been
+    # applied, later reruns find nothing to move and reuse the cached views.
+    plan.apply(scheduler)
+    conflicts = cached_view("conflicts", scheduler.detect_conflicts)
 
-    st.success("Schedule Generated!")
+    st.success(f"Schedule Generated! ({plan.elapsed_ms:.1f} ms)")
 
-    st.subheader("Sorted Tasks (by priority)")
-    for task in sorted_tasks:
+    st.subheader("Today's Plan")
+    for entry in plan.entries:
         st.write(
-            f"{task.scheduled_time.strftime('%H:%M')} — "
-            f"{task.title} ({task.priority})"
+            f"{entry.start.strftime('%H:%M')}–{entry.end.strftime('%H:%M')} — "
+            f"{entry.task.title} ({entry.task.priority}): {entry.reason}"
         )
+    for task, reason in plan.skipped:
+        st.write(f"Skipped {task.title}: {reason}")
 
     if conflicts:
         st.warning("Conflicts detected:")
-        for warning in conflicts:
-            st.write(warning)
+        for conflict in conflicts:
+            st.write(conflict.message)
 
 
     st.markdown(
@@ -153,3 +243,14 @@ Suggested approach:
 4. Connect your scheduler here and display results.
 """
     )
+
+if pawpal_profiling.is_enabled():
+    with st.expander("Debug: scheduler profile"):
+        rows = pawpal_profiling.snapshot_rows()
+        if rows:
+            st.dataframe(rows)
+        else:
+            st.caption("No scheduler calls recorded yet.")
+        if st.button("Reset profile"):
+            pawpal_profiling.reset()
+            st.rerun()
@@ -0,0 +1,70 @@
+"""Measure plan_owners() speedup as worker processes are added.
+
+Usage:
+    python benchmarks/bench_batch_planner.py --owners 2000 --tasks-per-owner 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task
+from pawpal_batch import plan_owners
+
+
+def build_owners(owner_count: int, tasks_per_owner: int, seed: int = 0):
+    """Build owners with three pets each and a mix of recurring and one-off tasks."""
+    rng = random.Random(seed)
+    start = datetime(2026, 2, 1)
+    owners = []
+    for o in range(owner_count):
+        owner = Owner(name=f"Owner {o}", email=f"owner{o}@example.com", phone="0")
+        pets = [
+            Pet(name=f"Pet {p}", species="dog", breed="Mixed", date_of_birth=date(2020, 1, 1))
+            for p in range(3)
+        ]
+        for pet in pets:
+            owner.add_pet(pet)
+        for t in range(tasks_per_owner):
+            rng.choice(pets).add_task(Task(
+                title=f"Task {t}",
+                description="",
+                category=rng.choice(["walk", "feeding", "medication"]),
+                scheduled_time=start + timedelta(minutes=15 * rng.randrange(4 * 24 * 30)),
+                task_id=f"{o}-{t}",
+                is_completed=rng.random() < 0.3,
+                recurrence_days=rng.choice([0, 0, 0, 1, 7]),
+                duration_minutes=rng.choice([10, 20, 30, 60]),
+            ))
+        owners.append(owner)
+    return owners
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owners", type=int, default=2000)
+    parser.add_argument("--tasks-per-owner", type=int, default=200)
+    parser.add_argument("--shard-size", type=int, default=64)
+    args = parser.parse_args()
+
+    owners = build_owners(args.owners, args.tasks_per_owner)
+    now = datetime(2026, 3, 1)
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1)))
+
+    print(f"{args.owners} owners x {args.tasks_per_owner} tasks, {cpus} CPUs")
+    baseline = None
+    for workers in worker_counts:
+        started = time.perf_counter()
+        plan_owners(owners, now=now, max_workers=workers, shard_size=args.shard_size)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"{workers:>3} workers {elapsed:8.2f} s   speedup {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
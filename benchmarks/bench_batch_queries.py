@@ -0,0 +1,93 @@
+"""Compare per-question loops against batched dashboard summaries.
+
+Usage:
+    python benchmarks/bench_batch_queries.py --tasks 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task, Scheduler
+
+
+def build_owner(task_count: int, pet_count: int = 20, seed: int = 0) -> Owner:
+    """Build an owner whose pets share `task_count` random tasks over ~60 days."""
+    rng = random.Random(seed)
+    owner = Owner(name="Bench", email="bench@example.com", phone="0")
+    pets = [
+        Pet(name=f"Pet {i}", species="dog", breed="Mixed", date_of_birth=date(2020, 1, 1))
+        for i in range(pet_count)
+    ]
+    for pet in pets:
+        owner.add_pet(pet)
+    start = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(days=30)
+    for i in range(task_count):
+        rng.choice(pets).add_task(Task(
+            title=f"Task {i}",
+            description="",
+            category=rng.choice(["walk", "feeding", "medication", "grooming"]),
+            scheduled_time=start + timedelta(minutes=rng.randrange(60 * 24 * 60)),
+            priority=rng.choice(["low", "medium", "high"]),
+            is_completed=rng.random() < 0.5,
+            task_id=f"t{i}",
+        ))
+    return owner
+
+
+def loop_queries(scheduler: Scheduler, owner: Owner, days: int):
+    """Answer each dashboard question with its own pass, as callers did before."""
+    tasks = scheduler.all_tasks
+    overdue_high = [t for t in tasks if t.priority == "high" and t.is_overdue()]
+    daily_counts = {}
+    for pet in owner.pets:
+        counts = {}
+        for offset in range(days):
+            day = date.today() + timedelta(days=offset)
+            n = len([t for t in pet.tasks if t.scheduled_time.date() == day])
+            if n:
+                counts[day] = n
+        daily_counts[pet.name] = counts
+    completion_rate = {}
+    for category in {t.category for t in tasks}:
+        in_category = [t for t in tasks if t.category == category]
+        completion_rate[category] = len([t for t in in_category if t.is_completed]) / len(in_category)
+    return overdue_high, daily_counts, completion_rate
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    fn()
+    print(f"{label:<28} {1000 * (time.perf_counter() - start):10.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=14)
+    args = parser.parse_args()
+
+    owner = build_owner(args.tasks)
+    scheduler = Scheduler()
+    for task in owner.get_all_tasks():
+        scheduler.add_task(task)
+
+    print(f"{args.tasks} tasks, {len(owner.pets)} pets, {args.days}-day window")
+    timed("separate loops", lambda: loop_queries(scheduler, owner, args.days))
+    timed("Scheduler.summarize", lambda: scheduler.summarize(owner, args.days))
+
+    from pawpal_columnar import ColumnarScheduler
+    try:
+        columnar = ColumnarScheduler.from_owner(owner)
+    except ImportError:
+        print("numpy not installed; skipping ColumnarScheduler")
+        return
+    timed("ColumnarScheduler.summarize", lambda: columnar.summarize(days=args.days))
+
+
+if __name__ == "__main__":
+    main()
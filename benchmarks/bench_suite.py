@@ -0,0 +1,345 @@
+"""Time and memory benchmarks for the core scheduler operations, with a baseline check.
+
+Each operation runs against seeded synthetic owners at every requested
+size. Results are written as JSON and, if a baseline file is given,
+compared against it; the exit status is 1 when any operation got slower
+(or used more memory) than the allowed ratio.
+
+Usage:
+    python benchmarks/bench_suite.py --sizes 1000 10000 100000 1000000 --output results.json
+    python benchmarks/bench_suite.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+
+Baselines are machine-specific: regenerate benchmarks/baseline.json on the
+machine that runs the check before relying on it. Timings are medians, and
+an operation only fails the check if it is still too slow when measured
+again with more repeats, so one noisy run does not fail it.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, date, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task, Scheduler, find_conflicts
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+NOW = datetime(2026, 3, 1, 12, 0)
+# Tasks touched by the per-task operations (remove, complete)
+SAMPLE_SIZE = 1_000
+
+
+@dataclass
+class Workload:
+    """Seeded synthetic data for one benchmark size."""
+    size: int
+    owners: List[Owner]
+    tasks: List[Task]
+    # IDs of the tasks the per-task operations act on
+    sample_ids: List[str] = field(default_factory=list)
+
+    def scheduler(self) -> Scheduler:
+        """Return a fresh scheduler holding every task, with the fixed clock."""
+        scheduler = Scheduler(clock=lambda: NOW)
+        scheduler.add_tasks(self.tasks)
+        return scheduler
+
+
+def build_workload(size: int, seed: int = 0, tasks_per_owner: int = 200,
+                   pets_per_owner: int = 3, recurring_share: float = 0.2) -> Workload:
+    """Build `size` tasks spread over owners and pets, centred on NOW.
+
+    Tasks land on a 5-minute grid at an average of one per 30 minutes, so the
+    time span grows with `size` and the number of overlapping pairs stays
+    proportional to the task count instead of growing quadratically.
+
+    Args:
+        size: Total number of tasks.
+        seed: Random seed; the same seed always produces the same workload.
+        tasks_per_owner: Tasks per owner, which sets the owner count.
+        pets_per_owner: Pets per owner.
+        recurring_share: Fraction of tasks that recur daily or weekly.
+    """
+    rng = random.Random(seed)
+    slots = 6 * size
+    start = NOW - timedelta(minutes=5 * slots // 2)
+    owners, tasks = [], []
+    for o in range(max(1, size // tasks_per_owner)):
+        owner = Owner(name=f"Owner {o}", email=f"owner{o}@example.com", phone="0")
+        for p in range(pets_per_owner):
+            owner.add_pet(Pet(name=f"Pet {p}", species=rng.choice(["dog", "cat"]),
+                              breed="Mixed", date_of_birth=date(2020, 1, 1)))
+        owners.append(owner)
+    for i in range(size):
+        task = Task(
+            title=f"Task {i}",
+            description="",
+            category=rng.choice(["walk", "feeding", "medication", "grooming", "appointment"]),
+            scheduled_time=start + timedelta(minutes=5 * rng.randrange(slots)),
+            task_id=f"t{i}",
+            is_completed=rng.random() < 0.3,
+            recurrence_days=rng.choice([1, 7]) if rng.random() < recurring_share else 0,
+            priority=rng.choice(["low", "medium", "high"]),
+            duration_minutes=rng.choice([5, 10, 15, 30, 60]),
+        )
+        rng.choice(owners[i * len(owners) // size].pets).add_task(task)
+        tasks.append(task)
+    sample = rng.sample(tasks, min(SAMPLE_SIZE, size))
+    return Workload(size, owners, tasks, [t.task_id for t in sample])
+
+
+def _prepare_add_tasks(w: Workload) -> Callable[[], object]:
+    return w.scheduler
+
+
+def _prepare_sort_by_time(w: Workload) -> Callable[[], object]:
+    return w.scheduler().sort_by_time
+
+
+def _prepare_detect_conflicts(w: Workload) -> Callable[[], object]:
+    scheduler = w.scheduler()
+
+    def run():
+        # Drop the cached list so each run rebuilds it from the conflict index
+        scheduler._conflict_list = None
+        return scheduler.detect_conflicts()
+    return run
+
+
+def _prepare_find_conflicts(w: Workload) -> Callable[[], object]:
+    # find_conflicts expects its input in time order; sorting is setup, not timed
+    tasks = sorted(w.tasks, key=lambda t: t.scheduled_time)
+    return lambda: find_conflicts(tasks)
+
+
+def _prepare_get_tasks_by_priority(w: Workload) -> Callable[[], object]:
+    return w.scheduler().get_tasks_by_priority
+
+
+def _prepare_remove_task(w: Workload) -> Callable[[], object]:
+    scheduler = w.scheduler()
+
+    def run():
+        for task_id in w.sample_ids:
+            scheduler.remove_task(task_id)
+    return run
+
+
+def _prepare_get_all_tasks(w: Workload) -> Callable[[], object]:
+    return lambda: [owner.get_all_tasks() for owner in w.owners]
+
+
+def _copied_scheduler(w: Workload) -> Scheduler:
+    """Return a fresh scheduler over copies of the tasks, for operations that mutate them."""
+    copies = Workload(w.size, [], [
+        Task(title=t.title, description=t.description, category=t.category,
+             scheduled_time=t.scheduled_time, task_id=t.task_id, is_completed=t.is_completed,
+             recurrence_days=t.recurrence_days, priority=t.priority,
+             duration_minutes=t.duration_minutes)
+        for t in w.tasks
+    ])
+    return copies.scheduler()
+
+
+def _prepare_complete_task_and_reschedule(w: Workload) -> Callable[[], object]:
+    scheduler = _copied_scheduler(w)
+
+    def run():
+        for task_id in w.sample_ids:
+            scheduler.complete_task_and_reschedule(task_id)
+    return run
+
+
+def _prepare_complete_many(w: Workload) -> Callable[[], object]:
+    # All sample tasks are completed in one call
+    scheduler = _copied_scheduler(w)
+    return lambda: scheduler.complete_many(w.sample_ids, now=NOW)
+
+
+# Operation name -> function that sets up state and returns the callable to time.
+# Destructive operations get fresh state from each call to their setup.
+OPERATIONS: Dict[str, Callable[[Workload], Callable[[], object]]] = {
+    "Scheduler.add_tasks": _prepare_add_tasks,
+    "Scheduler.sort_by_time": _prepare_sort_by_time,
+    "Scheduler.detect_conflicts": _prepare_detect_conflicts,
+    "find_conflicts": _prepare_find_conflicts,
+    "Scheduler.get_tasks_by_priority": _prepare_get_tasks_by_priority,
+    "Scheduler.remove_task": _prepare_remove_task,
+    "Owner.get_all_tasks": _prepare_get_all_tasks,
+    "Scheduler.complete_task_and_reschedule": _prepare_complete_task_and_reschedule,
+    "Scheduler.complete_many": _prepare_complete_many,
+}
+
+
+def measure(prepare: Callable[[Workload], Callable[[], object]], workload: Workload,
+            repeat: int = 7, memory_repeat: int = 1) -> Dict[str, float]:
+    """Time an operation (median of `repeat` runs) and record its peak traced memory.
+
+    The median ignores the occasional run slowed down by the rest of the
+    machine, in either direction. Memory is measured in separate runs
+    because tracemalloc slows allocation-heavy code and would distort the
+    timing; the smallest peak of `memory_repeat` runs is kept.
+    """
+    timings = []
+    for _ in range(repeat):
+        fn = prepare(workload)
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    peaks = []
+    for _ in range(memory_repeat):
+        fn = prepare(workload)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            fn()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+    return {"seconds": statistics.median(timings), "peak_bytes": max(0, min(peaks))}
+
+
+def run_suite(sizes: Sequence[int], operations: Optional[Sequence[str]] = None,
+              seed: int = 0, repeat: int = 7) -> dict:
+    """Run every operation at every size and return the JSON-ready results."""
+    names = list(operations or OPERATIONS)
+    results = []
+    for size in sizes:
+        workload = build_workload(size, seed=seed)
+        for name in names:
+            entry = {"operation": name, "size": size}
+            entry.update(measure(OPERATIONS[name], workload, repeat))
+            results.append(entry)
+            print(f"{name:<42} {size:>9} {1000 * entry['seconds']:10.2f} ms "
+                  f"{entry['peak_bytes'] / 2 ** 20:9.2f} MiB", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "created": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def _too_slow(current: dict, old: dict, max_ratio: float, min_seconds: float) -> bool:
+    return max(current["seconds"], old["seconds"]) >= min_seconds \
+        and current["seconds"] > old["seconds"] * max_ratio
+
+
+def _too_big(current: dict, old: dict, max_ratio: float) -> bool:
+    return bool(old["peak_bytes"]) and current["peak_bytes"] > old["peak_bytes"] * max_ratio
+
+
+def compare(results: dict, baseline: dict, max_ratio: float = 1.5,
+            min_seconds: float = 0.005) -> List[str]:
+    """Return one message per operation that regressed against the baseline.
+
+    Args:
+        results: Output of run_suite().
+        baseline: A previously saved run_suite() output.
+        max_ratio: Allowed slowdown (and memory growth) before flagging.
+        min_seconds: Timings below this are too noisy to compare.
+    """
+    previous = {(r["operation"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for current in results["results"]:
+        old = previous.get((current["operation"], current["size"]))
+        if old is None:
+            continue
+        label = f"{current['operation']} @ {current['size']}"
+        if _too_slow(current, old, max_ratio, min_seconds):
+            regressions.append(
+                f"{label}: {1000 * old['seconds']:.2f} ms -> {1000 * current['seconds']:.2f} ms"
+            )
+        if _too_big(current, old, max_ratio):
+            regressions.append(
+                f"{label}: peak {old['peak_bytes']} -> {current['peak_bytes']} bytes"
+            )
+    return regressions
+
+
+def remeasure_slow(results: dict, baseline: dict, max_ratio: float = 1.5,
+                   min_seconds: float = 0.005, repeat: int = 21) -> dict:
+    """Measure every operation that looks slower or bigger than the baseline again.
+
+    Time regressions are re-timed with `repeat` runs; memory regressions
+    keep the smallest peak of three fresh runs.
+
+    Returns:
+        dict: A copy of `results` with the new measurements for those operations.
+    """
+    previous = {(r["operation"], r["size"]): r for r in baseline["results"]}
+    workloads: Dict[int, Workload] = {}
+    updated = []
+    for entry in results["results"]:
+        old = previous.get((entry["operation"], entry["size"]))
+        if old is None:
+            updated.append(entry)
+            continue
+        slow = _too_slow(entry, old, max_ratio, min_seconds)
+        big = _too_big(entry, old, max_ratio)
+        if slow or big:
+            size = entry["size"]
+            if size not in workloads:
+                workloads[size] = build_workload(size, seed=results["meta"]["seed"])
+            again = measure(OPERATIONS[entry["operation"]], workloads[size],
+                            repeat if slow else 1, memory_repeat=3 if big else 1)
+            entry = dict(entry)
+            if slow:
+                entry["seconds"] = again["seconds"]
+            if big:
+                entry["peak_bytes"] = again["peak_bytes"]
+        updated.append(entry)
+    return dict(results, results=updated)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--save-baseline", help="write results JSON here as the new baseline")
+    parser.add_argument("--max-ratio", type=float, default=1.5)
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.operations, args.seed, args.repeat)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    elif not args.save_baseline:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        results = remeasure_slow(results, baseline, args.max_ratio, repeat=3 * args.repeat)
+        regressions = compare(results, baseline, args.max_ratio)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Nightly batch planning across many owners with a process pool.
+
+Owners never share pets or tasks, so each one can be planned on its own.
+plan_owners() packs owners into plain tuples, ships them to worker
+processes in shards, and each worker rebuilds a Scheduler per owner to sort
+the schedule, detect conflicts and roll completed recurring tasks forward.
+
+Each worker issues task IDs with its own snowflake node number, distinct
+from the other workers' and the parent's, so the IDs merge_plans() brings
+back cannot collide.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pawpal_ids import SnowflakeIdAllocator, get_id_allocator, set_id_allocator
+from pawpal_system import Owner, Pet, Scheduler, Task
+
+# Compact, picklable forms used to ship owners to workers
+PackedTask = Tuple[str, str, str, str, datetime, int, int, str, bool, Optional[str]]
+PackedPet = Tuple[str, str, str, object, List[PackedTask]]
+PackedOwner = Tuple[str, str, str, List[PackedPet]]
+
+
+@dataclass
+class OwnerPlan:
+    """Nightly planning results for one owner."""
+    owner_name: str
+    # All task IDs in scheduled-time order
+    schedule: List[str] = field(default_factory=list)
+    # (first_task_id, second_task_id) for each overlapping pair
+    conflicts: List[Tuple[str, str]] = field(default_factory=list)
+    # (pet name, packed task) for each next occurrence created by rollover
+    rolled_over: List[Tuple[str, PackedTask]] = field(default_factory=list)
+
+
+def pack_task(task: Task) -> PackedTask:
+    """Return a task as a plain tuple."""
+    return (
+        task.task_id, task.title, task.description, task.category, task.scheduled_time,
+        task.duration_minutes, task.recurrence_days, task.priority, task.is_completed,
+        task.series_id
+    )
+
+
+def unpack_task(packed: PackedTask) -> Task:
+    """Rebuild a Task from pack_task() output."""
+    (task_id, title, description, category, scheduled_time,
+     duration, recurrence, priority, completed, series_id) = packed
+    return Task(
+        title=title,
+        description=description,
+        category=category,
+        scheduled_time=scheduled_time,
+        task_id=task_id,
+        is_completed=completed,
+        recurrence_days=recurrence,
+        priority=priority,
+        duration_minutes=duration,
+        series_id=series_id
+    )
+
+
+def pack_owner(owner: Owner) -> PackedOwner:
+    """Return an owner, their pets and tasks as nested plain tuples."""
+    return (
+        owner.name, owner.email, owner.phone,
+        [
+            (pet.name, pet.species, pet.breed, pet.date_of_birth,
+             [pack_task(task) for task in pet.tasks])
+            for pet in owner.pets
+        ]
+    )
+
+
+def unpack_owner(packed: PackedOwner) -> Owner:
+    """Rebuild an Owner graph from pack_owner() output."""
+    name, email, phone, pets = packed
+    owner = Owner(name=name, email=email, phone=phone)
+    for pet_name, species, breed, date_of_birth, tasks in pets:
+        pet = Pet(name=pet_name, species=species, breed=breed, date_of_birth=date_of_birth)
+        for packed_task in tasks:
+            pet.add_task(unpack_task(packed_task))
+        owner.add_pet(pet)
+    return owner
+
+
+def roll_over_recurring(pet: Pet, scheduler: Scheduler) -> List[Task]:
+    """Create the missing next occurrence of each recurring series that ended.
+
+    Covers tasks that were marked complete directly on the Task, which does
+    not add the next occurrence anywhere. Tasks are grouped into series by
+    Task.series_key, so same-title tasks of different series never mix and a
+    successor that was moved to another time still counts. Only a series with
+    no pending task left is rolled over, from its latest completed task.
+    """
+    pending = set()
+    latest: Dict[str, Task] = {}
+    for task in pet.tasks:
+        if task.recurrence_days <= 0:
+            continue
+        series = task.series_key
+        if not task.is_completed:
+            pending.add(series)
+        elif series not in latest or task.scheduled_time > latest[series].scheduled_time:
+            latest[series] = task
+    created = []
+    for series, task in latest.items():
+        if series in pending:
+            continue
+        new_task = task.mark_complete()
+        pet.add_task(new_task)
+        scheduler.add_task(new_task)
+        created.append(new_task)
+    return created
+
+
+def plan_owner(packed: PackedOwner, now: datetime) -> OwnerPlan:
+    """Plan a single packed owner: rollover, time-ordered schedule and conflicts."""
+    owner = unpack_owner(packed)
+    scheduler = Scheduler(clock=lambda: now)
+    scheduler.add_tasks(owner.get_all_tasks())
+
+    plan = OwnerPlan(owner_name=owner.name)
+    for pet in owner.pets:
+        plan.rolled_over.extend(
+            (pet.name, pack_task(task)) for task in roll_over_recurring(pet, scheduler)
+        )
+    plan.schedule = [task.task_id for task in scheduler.sort_by_time()]
+    plan.conflicts = [(c.first.task_id, c.second.task_id) for c in scheduler.detect_conflicts()]
+    return plan
+
+
+def _init_worker(next_node):
+    """Give this worker process a snowflake node no other worker has."""
+    allocator = get_id_allocator()
+    if not isinstance(allocator, SnowflakeIdAllocator):
+        return
+    with next_node.get_lock():
+        node = next_node.value
+        next_node.value += 1
+    set_id_allocator(SnowflakeIdAllocator(node % (1 << SnowflakeIdAllocator.NODE_BITS), allocator.clock))
+
+
+def _plan_shard(shard: Sequence[PackedOwner], now: datetime) -> List[OwnerPlan]:
+    return [plan_owner(packed, now) for packed in shard]
+
+
+def _shards(owners: Iterable[Owner], size: int) -> Iterator[List[PackedOwner]]:
+    owners = iter(owners)
+    while True:
+        shard = [pack_owner(owner) for owner in islice(owners, size)]
+        if not shard:
+            return
+        yield shard
+
+
+def plan_owners(owners: Iterable[Owner], now: Optional[datetime] = None,
+                max_workers: Optional[int] = None, shard_size: int = 64) -> List[OwnerPlan]:
+    """Plan every owner, sharding the work across a process pool.
+
+    Args:
+        owners: Owners to plan.
+        now: Reference time shared by every worker; defaults to the current time.
+        max_workers: Pool size; None uses every CPU, 1 plans in-process.
+        shard_size: Owners per task sent to a worker. Larger shards amortize
+            inter-process overhead; smaller ones balance load better.
+
+    Returns:
+        List[OwnerPlan]: One plan per owner, in input order.
+    """
+    if now is None:
+        now = datetime.now()
+    shards = _shards(owners, shard_size)
+    if max_workers == 1:
+        results = map(_plan_shard, shards, repeat(now))
+        return [plan for shard in results for plan in shard]
+    # Worker nodes count up from the one after the parent's
+    allocator = get_id_allocator()
+    first_node = allocator.node + 1 if isinstance(allocator, SnowflakeIdAllocator) else 0
+    next_node = multiprocessing.Value("i", first_node)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(next_node,)) as pool:
+        results = pool.map(_plan_shard, shards, repeat(now))
+        return [plan for shard in results for plan in shard]
+
+
+def merge_plans(owners: Iterable[Owner], plans: Iterable[OwnerPlan],
+                scheduler: Optional[Scheduler] = None) -> int:
+    """Apply the rollover results of plan_owners() to the in-memory owners.
+
+    The next occurrences created by the workers are added to the matching
+    pets (and scheduler, if given); everything else in a plan is read-only.
+    Occurrences for owners or pets that no longer exist are skipped.
+
+    Returns:
+        int: Number of new tasks attached.
+    """
+    by_name = {owner.name: owner for owner in owners}
+    attached = 0
+    for plan in plans:
+        owner = by_name.get(plan.owner_name)
+        if owner is None:
+            continue
+        for pet_name, packed in plan.rolled_over:
+            pet = owner.get_pet(pet_name)
+            if pet is None:
+                continue
+            task = unpack_task(packed)
+            pet.add_task(task)
+            if scheduler is not None:
+                scheduler.add_task(task)
+            attached += 1
+    return attached
@@ -0,0 +1,761 @@
+"""Columnar, NumPy-backed task storage for very large schedules.
+
+ColumnarScheduler offers the same methods as Scheduler (apart from owner
+registration) but keeps task fields in parallel arrays instead of one Task
+object per task. Task objects are only built when a method returns them,
+so they are detached snapshots: mutate tasks through the scheduler's
+methods, not the returned objects. Without registered owners, pets are
+passed explicitly, and each task remembers the pet it was stored with.
+
+NumPy is an optional dependency and only needed for this module.
+"""
+import warnings
+from dataclasses import replace
+from datetime import datetime, date, time, timedelta
+from heapq import merge
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from pawpal_ids import new_task_id
+from pawpal_system import (
+    EDITABLE_FIELDS, PRIORITY_RANK, CompletionBatch, Conflict, Occurrence, Owner, Pet,
+    ScheduleSummary, Scheduler, SkippedOccurrences, Task, _coerce_fields, find_conflicts,
+)
+
+_MIN_CAPACITY = 1024
+_MINUTE = np.timedelta64(1, "m") if np is not None else None
+_DAY = np.timedelta64(1, "D") if np is not None else None
+_COLUMNS = ("_times", "_durations", "_recurrence", "_priority",
+            "_category", "_pet", "_completed", "_alive")
+
+
+class ColumnarScheduler:
+    """Scheduler variant that stores tasks column-wise in NumPy arrays.
+
+    Times are datetime64 values, priority and category are small integer
+    codes into lookup tables, and completion/liveness are boolean masks.
+    Removed rows are tombstoned and compacted once they make up half the store.
+    """
+
+    def __init__(self, clock=datetime.now, capacity: int = _MIN_CAPACITY):
+        """Initialize empty columns.
+
+        Args:
+            clock: Returns the current time, as for Scheduler.
+            capacity: Initial number of rows to allocate.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("ColumnarScheduler requires numpy (pip install numpy)")
+        self.clock = clock
+        self._size = 0
+        self._live = 0
+        self._alloc(max(capacity, 1))
+        self._titles: List[str] = []
+        self._descriptions: List[str] = []
+        self._series: List[Optional[str]] = []
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # Interned lookup tables for the small-int code columns
+        self._priorities: List[str] = []
+        self._priority_codes: Dict[str, int] = {}
+        self._priority_ranks = np.zeros(0, dtype=np.int8)
+        self._categories: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self._pets: List[str] = []
+        self._pet_codes: Dict[str, int] = {}
+        # Occurrences materialized ahead of time, as on Scheduler
+        self._materialized: Dict[str, Dict[datetime, str]] = {}
+        # Change listeners and version counter, as on Scheduler
+        self._listeners: List[Callable[[str, Task], None]] = []
+        self._version = 0
+
+    def _alloc(self, capacity: int):
+        """Allocate (or grow) every column to hold `capacity` rows."""
+        n = self._size
+        old = getattr(self, "_times", None)
+
+        def grow(dtype, name):
+            column = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                column[:n] = getattr(self, name)[:n]
+            return column
+
+        self._times = grow("datetime64[us]", "_times")
+        self._durations = grow(np.int32, "_durations")
+        self._recurrence = grow(np.int32, "_recurrence")
+        self._priority = grow(np.int8, "_priority")
+        self._category = grow(np.int16, "_category")
+        self._pet = grow(np.int32, "_pet")  # -1 = not attached to a pet
+        self._completed = grow(np.bool_, "_completed")
+        self._alive = grow(np.bool_, "_alive")
+
+    @staticmethod
+    def _code(value: str, table: List[str], codes: Dict[str, int]) -> int:
+        """Return the interned code for a string, adding it to the table if new."""
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+        return code
+
+    def _priority_code(self, priority: str) -> int:
+        code = self._code(priority, self._priorities, self._priority_codes)
+        if code == len(self._priority_ranks):
+            self._priority_ranks = np.append(self._priority_ranks, PRIORITY_RANK.get(priority, 0))
+        return code
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return the number of live tasks."""
+        return self._live
+
+    def add_task(self, task: Task, pet: Optional[Pet] = None):
+        """Store a task's fields as a new row.
+
+        Args:
+            task: The task to store.
+            pet: Optional Pet the task belongs to, recorded for per-pet summaries.
+
+        Raises:
+            ValueError: If a task with the same task_id is already stored.
+        """
+        self.add_tasks([task], pet)
+
+    def add_tasks(self, tasks: Iterable[Task], pet: Optional[Pet] = None):
+        """Store many tasks, growing the columns at most once per doubling.
+
+        Raises:
+            ValueError: If a task_id is already stored.
+        """
+        pet_code = -1 if pet is None else self._code(pet.name, self._pets, self._pet_codes)
+        added = []
+        for task in tasks:
+            if task.task_id in self._rows:
+                raise ValueError(f"Duplicate task_id '{task.task_id}'")
+            if self._size == len(self._times):
+                self._alloc(2 * len(self._times))
+            row = self._size
+            self._times[row] = task.scheduled_time
+            self._durations[row] = task.duration_minutes
+            self._recurrence[row] = task.recurrence_days
+            self._priority[row] = self._priority_code(task.priority)
+            self._category[row] = self._code(task.category, self._categories, self._category_codes)
+            self._completed[row] = task.is_completed
+            self._pet[row] = pet_code
+            self._alive[row] = True
+            self._titles.append(task.title)
+            self._descriptions.append(task.description)
+            self._series.append(task.series_id)
+            self._ids.append(task.task_id)
+            self._rows[task.task_id] = row
+            self._size += 1
+            self._live += 1
+            added.append(task)
+        if self._listeners:
+            for task in added:
+                self._notify("add", task)
+        elif added:
+            self._version += 1
+
+    def remove_task(self, task_id: str):
+        """Remove a task by task ID."""
+        row = self._rows.pop(task_id, None)
+        if row is None:
+            return
+        task = self._task(row) if self._listeners else None
+        self._materialized.pop(task_id, None)
+        self._alive[row] = False
+        self._live -= 1
+        if self._live < self._size // 2 and self._size > _MIN_CAPACITY:
+            self._compact()
+        self._notify("remove", task)
+
+    def _compact(self):
+        """Drop tombstoned rows and renumber the row index."""
+        keep = np.flatnonzero(self._alive[:self._size])
+        for name in _COLUMNS:
+            column = getattr(self, name)
+            column[:len(keep)] = column[keep]
+        self._titles = [self._titles[i] for i in keep]
+        self._descriptions = [self._descriptions[i] for i in keep]
+        self._series = [self._series[i] for i in keep]
+        self._ids = [self._ids[i] for i in keep]
+        self._rows = {task_id: row for row, task_id in enumerate(self._ids)}
+        self._size = len(keep)
+
+    def _task(self, row: int) -> Task:
+        """Materialize the Task stored in a row."""
+        return Task(
+            title=self._titles[row],
+            description=self._descriptions[row],
+            category=self._categories[self._category[row]],
+            scheduled_time=self._times[row].item(),
+            task_id=self._ids[row],
+            is_completed=bool(self._completed[row]),
+            recurrence_days=int(self._recurrence[row]),
+            priority=self._priorities[self._priority[row]],
+            duration_minutes=int(self._durations[row]),
+            series_id=self._series[row]
+        )
+
+    def _tasks(self, rows) -> List[Task]:
+        return [self._task(row) for row in rows.tolist()]
+
+    def _live_rows(self):
+        return np.flatnonzero(self._alive[:self._size])
+
+    @property
+    def all_tasks(self) -> List[Task]:
+        """Return all tasks in the order they were added."""
+        return self._tasks(self._live_rows())
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return the task with the given ID, or None if it is not stored."""
+        row = self._rows.get(task_id)
+        return None if row is None else self._task(row)
+
+    def reschedule_task(self, task_id: str, new_time: datetime) -> Optional[Task]:
+        """Move a stored task to a new time."""
+        return self._set_fields(task_id, {"scheduled_time": new_time}, "reschedule")
+
+    def update_task(self, task_id: str, **changes) -> Optional[Task]:
+        """Edit fields of a stored task; see Scheduler.update_task.
+
+        Returns:
+            Optional[Task]: The updated task, or None if the ID is unknown.
+
+        Raises:
+            ValueError: If a field cannot be edited this way.
+        """
+        unknown = set(changes) - EDITABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update field(s): {', '.join(sorted(unknown))}")
+        return self._set_fields(task_id, _coerce_fields(changes), event="update")
+
+    def _set_fields(self, task_id: str, changes: dict, event: str) -> Optional[Task]:
+        """Write field changes into a task's row and notify listeners."""
+        row = self._rows.get(task_id)
+        if row is None:
+            return None
+        for name, value in changes.items():
+            if name == "scheduled_time":
+                self._times[row] = value
+            elif name == "duration_minutes":
+                self._durations[row] = value
+            elif name == "recurrence_days":
+                self._recurrence[row] = value
+            elif name == "priority":
+                self._priority[row] = self._priority_code(value)
+            elif name == "category":
+                self._category[row] = self._code(value, self._categories, self._category_codes)
+            elif name == "title":
+                self._titles[row] = value
+            elif name == "series_id":
+                self._series[row] = value
+            else:
+                self._descriptions[row] = value
+        task = self._task(row)
+        self._notify(event, task)
+        return task
+
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the stored tasks change."""
+        return self._version
+
+    def subscribe(self, listener: Callable[[str, Task], None]) -> Callable[[], None]:
+        """Register a callback for changes; see Scheduler.subscribe.
+
+        Listeners receive detached Task snapshots.
+
+        Returns:
+            Callable[[], None]: A function that unsubscribes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self, event: str, task: Optional[Task]):
+        """Bump the version and send a change event to every listener."""
+        self._version += 1
+        for listener in self._listeners:
+            listener(event, task)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _rows_by_time(self, rows):
+        return rows[np.argsort(self._times[rows], kind="stable")]
+
+    def sort_by_time(self) -> List[Task]:
+        """Return tasks sorted by scheduled time."""
+        return self._tasks(self._rows_by_time(self._live_rows()))
+
+    def _rows_between(self, start: datetime, end: datetime, pet: Optional[Pet] = None):
+        """Return the live rows scheduled in [start, end), in time order."""
+        times = self._times[:self._size]
+        mask = self._alive[:self._size] & (times >= np.datetime64(start)) & (times < np.datetime64(end))
+        rows = self._rows_by_time(np.flatnonzero(mask))
+        if pet is not None:
+            # A pet's tasks are those recorded with it or added to it directly
+            owned, ids = pet._tasks_by_id, self._ids
+            recorded = self._pet[rows] == self._pet_codes.get(pet.name, -2)
+            rows = rows[recorded | np.array([ids[row] in owned for row in rows.tolist()], dtype=bool)]
+        return rows
+
+    def tasks_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return tasks scheduled in the half-open range [start, end), in time order."""
+        return self._tasks(self._rows_between(start, end))
+
+    def sort_by_priority(self) -> List[Task]:
+        """Sort tasks by priority (high > medium > low)."""
+        rows = self._live_rows()
+        ranks = self._priority_ranks[self._priority[rows]]
+        return self._tasks(rows[np.argsort(-ranks, kind="stable")])
+
+    def _overdue_mask(self, rows, now: datetime):
+        return ~self._completed[rows] & (self._times[rows] < np.datetime64(now))
+
+    def get_tasks_by_priority(self, now: Optional[datetime] = None) -> List[Task]:
+        """Return tasks ordered by (overdue first, priority, scheduled time)."""
+        if now is None:
+            now = self.clock()
+        rows = self._live_rows()
+        ranks = self._priority_ranks[self._priority[rows]]
+        order = np.lexsort((self._times[rows], -ranks, ~self._overdue_mask(rows, now)))
+        return self._tasks(rows[order])
+
+    def peek_next(self, k: int = 1, now: Optional[datetime] = None) -> List[Task]:
+        """Return the next k pending tasks in get_tasks_by_priority() order."""
+        if now is None:
+            now = self.clock()
+        rows = self._live_rows()
+        rows = rows[~self._completed[rows]]
+        ranks = self._priority_ranks[self._priority[rows]]
+        order = np.lexsort((self._times[rows], -ranks, ~self._overdue_mask(rows, now)))
+        return self._tasks(rows[order[:k]])
+
+    def pop_next(self, now: Optional[datetime] = None, pet: Optional[Pet] = None) -> Optional[Task]:
+        """Complete the most urgent pending task and return it; see Scheduler.pop_next."""
+        upcoming = self.peek_next(1, now)
+        if not upcoming:
+            return None
+        task_id = upcoming[0].task_id
+        self.complete_task_and_reschedule(task_id, pet)
+        return self.get_task(task_id)
+
+    def get_day_tasks(self, day: date, pet: Optional[Pet] = None) -> List[Task]:
+        """Return the tasks scheduled on a given day, in time order, optionally only one pet's."""
+        start = datetime.combine(day, time.min)
+        return self._tasks(self._rows_between(start, start + timedelta(days=1), pet))
+
+    get_today_tasks = Scheduler.get_today_tasks
+    get_week = Scheduler.get_week
+
+    def get_upcoming_tasks(self, days: int, pet: Optional[Pet] = None) -> List[Task]:
+        """Get all tasks scheduled from today through the next N days, optionally only one pet's."""
+        start = datetime.combine(self.clock().date(), time.min)
+        return self._tasks(self._rows_between(start, start + timedelta(days=days + 1), pet))
+
+    def detect_conflicts(self, scope: Union[Pet, Owner, None] = None) -> List[Conflict]:
+        """Detect tasks whose scheduled intervals overlap.
+
+        Vectorized form of find_conflicts(): after sorting by start, task i
+        overlaps every later task j that starts before i ends (or at the same
+        instant), so each i's partners are one contiguous run found with
+        searchsorted.
+        """
+        rows = self._live_rows()
+        if scope is not None:
+            scoped_tasks = scope.get_all_tasks() if isinstance(scope, Owner) else scope.get_tasks()
+            scoped = [self._rows[t.task_id] for t in scoped_tasks if t.task_id in self._rows]
+            rows = np.array(sorted(scoped), dtype=np.intp)
+        rows = self._rows_by_time(rows)
+        starts = self._times[rows]
+        ends = starts + self._durations[rows] * _MINUTE
+        hi = np.maximum(
+            np.searchsorted(starts, ends, side="left"),
+            np.searchsorted(starts, starts, side="right")
+        )
+        counts = hi - np.arange(1, len(rows) + 1)
+        firsts = np.repeat(np.arange(len(rows)), counts)
+        # Offset of each pair within its run, added to first + 1
+        offsets = np.arange(len(firsts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        seconds = firsts + 1 + offsets
+        order = np.lexsort((firsts, seconds))
+
+        cache: Dict[int, Task] = {}
+
+        def task_at(i: int) -> Task:
+            if i not in cache:
+                cache[i] = self._task(int(rows[i]))
+            return cache[i]
+
+        return [
+            Conflict(task_at(int(firsts[p])), task_at(int(seconds[p])))
+            for p in order.tolist()
+        ]
+
+    def rebuild_conflicts(self) -> bool:
+        """Check the vectorized conflict search against a find_conflicts() sweep.
+
+        Conflicts are computed on demand here, so there is no incremental
+        set to rebuild; this only confirms that both methods agree.
+
+        Returns:
+            bool: True if both found the same pairs.
+        """
+        def pairs(conflicts: Iterable[Conflict]):
+            return sorted((c.first.task_id, c.second.task_id) for c in conflicts)
+        return pairs(self.detect_conflicts()) == pairs(find_conflicts(self.sort_by_time()))
+
+    # ------------------------------------------------------------------
+    # Occurrences
+    # ------------------------------------------------------------------
+
+    def iter_occurrences(self, start: datetime, end: datetime) -> Iterator[Occurrence]:
+        """Yield every occurrence in [start, end) in time order; see Scheduler.iter_occurrences."""
+        concrete = self.tasks_between(start, end)
+        live = self._alive[:self._size]
+        recurring = np.flatnonzero(live & (self._recurrence[:self._size] > 0) & ~self._completed[:self._size])
+        virtual = [Scheduler._project(task, start, end) for task in self._tasks(recurring)]
+        for occurrence in merge((Occurrence(t, t.scheduled_time) for t in concrete), *virtual,
+                                key=lambda o: o.scheduled_time):
+            if occurrence.is_virtual and \
+                    self._stand_in(occurrence.task.task_id, occurrence.scheduled_time) is not None:
+                continue
+            yield occurrence
+
+    get_upcoming_occurrences = Scheduler.get_upcoming_occurrences
+
+    _links = Scheduler._links
+    _stand_in = Scheduler._stand_in
+    _link = Scheduler._link
+    _hand_over = Scheduler._hand_over
+    _skip_materialized = Scheduler._skip_materialized
+
+    def materialize(self, occurrence: Occurrence, pet: Optional[Pet] = None) -> Task:
+        """Store a virtual occurrence as a one-off task; see Scheduler.materialize.
+
+        Without a pet, the new task keeps the recurring task's recorded pet.
+        """
+        if not occurrence.is_virtual:
+            return occurrence.task
+        source = occurrence.task
+        task = Task(
+            title=source.title,
+            description=source.description,
+            category=source.category,
+            scheduled_time=occurrence.scheduled_time,
+            priority=source.priority,
+            duration_minutes=source.duration_minutes
+        )
+        if pet:
+            pet.add_task(task)
+        self.add_tasks([task], pet)
+        source_row = self._rows.get(source.task_id)
+        if pet is None and source_row is not None:
+            self._pet[self._rows[task.task_id]] = self._pet[source_row]
+        self._link(source.task_id, {**self._links(source.task_id), occurrence.scheduled_time: task.task_id})
+        return task
+
+    def complete_occurrence(self, occurrence: Occurrence, pet: Optional[Pet] = None) -> Task:
+        """Materialize an occurrence if needed and mark it complete.
+
+        Returns:
+            Task: The completed task.
+        """
+        task = self.materialize(occurrence, pet)
+        self.complete_task_and_reschedule(task.task_id, pet)
+        return self.get_task(task.task_id)
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def schedule_recurring_task(self, task: Task, recurrence_days: int):
+        """Schedule a recurring task with a specified interval."""
+        task.recurrence_days = recurrence_days
+        self.add_task(task)
+
+    def complete_task_and_reschedule(self, task_id: str, pet: Optional[Pet] = None) -> Optional[Task]:
+        """Mark a task complete and store its next occurrence if recurring.
+
+        As in Scheduler, an occurrence that was already materialized becomes
+        the new recurring task instead of being duplicated.
+
+        Returns:
+            Optional[Task]: The new recurring task if created, None otherwise.
+        """
+        row = self._rows.get(task_id)
+        if row is None:
+            return None
+        task = self._task(row)
+        new_task = task.mark_complete()
+        self._completed[row] = True
+        self._notify("complete", task)
+        if new_task:
+            new_task.scheduled_time, adopted = self._skip_materialized(task, new_task.scheduled_time)
+            if adopted is not None:
+                self._hand_over(task_id, adopted.task_id, new_task.scheduled_time)
+                return self.update_task(adopted.task_id, recurrence_days=task.recurrence_days,
+                                        series_id=task.series_key)
+            if pet:
+                pet.add_task(new_task)
+            self.add_task(new_task)
+            self._hand_over(task_id, new_task.task_id, new_task.scheduled_time)
+            # The next occurrence belongs to the same pet as the original
+            self._pet[self._rows[new_task.task_id]] = self._pet[row]
+        return new_task
+
+    def complete_task(self, task_id: str) -> Optional[Task]:
+        """Mark a task complete without storing its next occurrence; see Scheduler.complete_task."""
+        row = self._rows.get(task_id)
+        if row is None:
+            return None
+        if not self._completed[row]:
+            self._completed[row] = True
+            self._notify("complete", self._task(row))
+        return self._task(row)
+
+    def complete_many(self, task_ids: Iterable[str], now: Optional[datetime] = None,
+                      log_skipped: bool = False) -> CompletionBatch:
+        """Complete many tasks at once, catching recurring ones up to the present.
+
+        See Scheduler.complete_many. The next occurrence times are computed
+        for all recurring tasks in one vectorized step, and the new tasks are
+        stored in one batch, keeping the pet recorded for the task they replace.
+        """
+        if now is None:
+            now = self.clock()
+        rows = np.array([
+            row for row in (self._rows.get(task_id) for task_id in dict.fromkeys(task_ids))
+            if row is not None
+        ], dtype=np.intp)
+        rows = rows[~self._completed[rows]]
+        self._completed[rows] = True
+        batch = CompletionBatch(self._tasks(rows), [])
+
+        # First repeat strictly after `now`, at least one interval on: see Task.next_occurrence_after
+        recurring = self._recurrence[rows] > 0
+        starts = self._times[rows][recurring]
+        intervals = self._recurrence[rows][recurring].astype(np.int64) * _DAY
+        steps = np.maximum(1, (np.datetime64(now) - starts) // intervals + 1)
+        next_times = (starts + steps * intervals).astype("datetime64[us]")
+
+        created_rows, new_tasks = [], []
+        tasks = [task for task, flag in zip(batch.completed, recurring.tolist()) if flag]
+        for task, row, next_time in zip(tasks, rows[recurring].tolist(), next_times.tolist()):
+            adopted = None
+            # Only series with materialized occurrences need the check
+            if task.task_id in self._materialized:
+                next_time, adopted = self._skip_materialized(task, next_time)
+            skipped = (next_time - task.scheduled_time).days // task.recurrence_days - 1
+            if skipped:
+                batch.skipped_count += skipped
+                if log_skipped:
+                    batch.skipped.append(SkippedOccurrences(
+                        task.task_id, task.scheduled_time + timedelta(days=task.recurrence_days),
+                        task.recurrence_days, skipped
+                    ))
+            if adopted is not None:
+                self._hand_over(task.task_id, adopted.task_id, next_time)
+                batch.created.append(self.update_task(adopted.task_id, recurrence_days=task.recurrence_days,
+                                                      series_id=task.series_key))
+                continue
+            new_tasks.append(replace(task, scheduled_time=next_time, task_id=new_task_id(),
+                                     is_completed=False, series_id=task.series_key))
+            self._hand_over(task.task_id, new_tasks[-1].task_id, next_time)
+            batch.created.append(new_tasks[-1])
+            created_rows.append(row)
+
+        for task in batch.completed:
+            self._notify("complete", task)
+        self.add_tasks(new_tasks)
+        for task, row in zip(new_tasks, created_rows):
+            self._pet[self._rows[task.task_id]] = self._pet[row]
+        return batch
+
+    def fork(self) -> "ColumnarFork":
+        """Return a what-if copy of this schedule; see ColumnarFork.
+
+        ColumnarScheduler does not support cheap forks: every fork copies all
+        columns, costing O(n) time and memory, so a warning is issued. Use
+        Scheduler.fork() to keep many small scenarios at once.
+        """
+        warnings.warn(
+            f"ColumnarScheduler.fork() copies all {len(self)} tasks; "
+            "use Scheduler.fork() for cheap what-if scenarios",
+            stacklevel=2
+        )
+        return ColumnarFork(self)
+
+    def summarize(self, owner: Optional[Owner] = None, days: int = 14,
+                  now: Optional[datetime] = None) -> ScheduleSummary:
+        """Compute dashboard aggregates with vectorized masks and bincounts.
+
+        Per-pet counts use the pet recorded when each task was stored (see
+        from_owner); `owner` is accepted for parity with Scheduler.summarize.
+        """
+        if now is None:
+            now = self.clock()
+        rows = self._live_rows()
+        times = self._times[rows]
+        completed = self._completed[rows]
+        priority = self._priority[rows]
+
+        high = self._priority_codes.get("high", -1)
+        overdue = (priority == high) & ~completed & (times < np.datetime64(now))
+
+        start = np.datetime64(datetime.combine(now.date(), time.min), "D")
+        day_index = (times.astype("datetime64[D]") - start).astype(np.int64)
+        in_window = (day_index >= 0) & (day_index < days)
+        # Shift pet codes so "no pet" (-1) becomes bucket 0
+        pet_slot = self._pet[rows][in_window] + 1
+        grid = np.bincount(
+            pet_slot * days + day_index[in_window],
+            minlength=(len(self._pets) + 1) * days
+        ).reshape(len(self._pets) + 1, days)
+
+        daily_counts: Dict[Optional[str], Dict[date, int]] = {}
+        for slot, day in zip(*np.nonzero(grid)):
+            name = None if slot == 0 else self._pets[slot - 1]
+            day_date = (start + day).item()
+            daily_counts.setdefault(name, {})[day_date] = int(grid[slot, day])
+
+        category = self._category[rows]
+        totals = np.bincount(category, minlength=len(self._categories))
+        done = np.bincount(category, weights=completed, minlength=len(self._categories))
+        return ScheduleSummary(
+            overdue_high_priority=self._tasks(rows[overdue]),
+            daily_counts=daily_counts,
+            completion_rate={
+                self._categories[c]: float(done[c] / totals[c])
+                for c in np.flatnonzero(totals).tolist()
+            }
+        )
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task], clock=datetime.now) -> "ColumnarScheduler":
+        """Build a columnar scheduler from existing Task objects."""
+        tasks = list(tasks)
+        scheduler = cls(clock=clock, capacity=max(len(tasks), _MIN_CAPACITY))
+        scheduler.add_tasks(tasks)
+        return scheduler
+
+    @classmethod
+    def from_owner(cls, owner: Owner, clock=datetime.now) -> "ColumnarScheduler":
+        """Build a columnar scheduler from every task of an owner's pets."""
+        scheduler = cls(clock=clock, capacity=max(len(owner.get_all_tasks()), _MIN_CAPACITY))
+        for pet in owner.pets:
+            scheduler.add_tasks(pet.tasks, pet)
+        return scheduler
+
+
+class ColumnarFork(ColumnarScheduler):
+    """A what-if copy of a ColumnarScheduler.
+
+    Unlike ScheduleFork, which only stores its own edits, the fork copies
+    every one of the parent's columns up front, so creating one is O(n) in
+    time and memory. Every method then works unchanged on the copy. commit() swaps the copied columns into the parent and sends the
+    parent's listeners the same events Scheduler does when a fork is
+    committed (removes, updates, completions, then adds); it is refused if
+    the parent has changed since the fork was made. discard() throws the
+    edits away.
+    """
+
+    # Attributes that stay with each scheduler instead of moving on commit
+    _OWN_STATE = frozenset({"clock", "parent", "_listeners", "_version",
+                            "_base_version", "_closed"})
+
+    def __init__(self, parent: ColumnarScheduler):
+        for name, value in vars(parent).items():
+            if name in self._OWN_STATE:
+                continue
+            if isinstance(value, (list, dict, np.ndarray)):
+                value = value.copy()
+            setattr(self, name, value)
+        self.clock = parent.clock
+        self.parent = parent
+        self._base_version = parent.version
+        self._closed = False
+        self._listeners = []
+        self._version = 0
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("Fork has already been committed or discarded")
+
+    def add_tasks(self, tasks: Iterable[Task], pet: Optional[Pet] = None):
+        """Store many tasks in the scenario; see ColumnarScheduler.add_tasks."""
+        self._check_open()
+        super().add_tasks(tasks, pet)
+
+    def _notify(self, event: str, task: Optional[Task]):
+        self._check_open()
+        super()._notify(event, task)
+
+    def _changes(self) -> List[Tuple[str, Task]]:
+        """Diff the fork against its parent as Scheduler._commit_fork would apply it."""
+        parent = self.parent
+        removed = [parent._task(row) for task_id, row in parent._rows.items() if task_id not in self._rows]
+        shared = [(row, parent._rows[task_id]) for task_id, row in self._rows.items() if task_id in parent._rows]
+        added = [self._task(row) for task_id, row in self._rows.items() if task_id not in parent._rows]
+        updated, completed = [], []
+        if shared:
+            mine, theirs = (np.array(rows, dtype=np.intp) for rows in zip(*shared))
+            differs = self._completed[mine] != parent._completed[theirs]
+            for name in ("_times", "_durations", "_recurrence"):
+                differs |= getattr(self, name)[mine] != getattr(parent, name)[theirs]
+            differs |= np.array(self._priorities)[self._priority[mine]] \
+                != np.array(parent._priorities)[parent._priority[theirs]]
+            differs |= np.array(self._categories)[self._category[mine]] \
+                != np.array(parent._categories)[parent._category[theirs]]
+            differs |= np.array([self._titles[a] != parent._titles[b]
+                                 or self._descriptions[a] != parent._descriptions[b]
+                                 or self._series[a] != parent._series[b]
+                                 for a, b in shared], dtype=bool)
+            for i in np.flatnonzero(differs).tolist():
+                new, old = self._task(shared[i][0]), parent._task(shared[i][1])
+                if any(getattr(new, name) != getattr(old, name) for name in EDITABLE_FIELDS):
+                    updated.append(replace(new, is_completed=old.is_completed))
+                if new.is_completed and not old.is_completed:
+                    completed.append(new)
+        return ([("remove", t) for t in removed] + [("update", t) for t in updated]
+                + [("complete", t) for t in completed] + [("add", t) for t in added])
+
+    def commit(self):
+        """Apply the scenario to the parent scheduler and close the fork.
+
+        Raises:
+            ValueError: If the parent changed since the fork was made, or the
+                fork was already committed or discarded.
+        """
+        self._check_open()
+        parent = self.parent
+        if parent.version != self._base_version:
+            raise ValueError("Scheduler changed since the fork was made; fork it again")
+        changes = self._changes()
+        for name, value in vars(self).items():
+            if name not in self._OWN_STATE:
+                setattr(parent, name, value)
+        self.discard()
+        for event, task in changes:
+            parent._notify(event, task)
+
+    def discard(self):
+        """Throw the scenario's edits away and close the fork."""
+        parent = self.parent
+        ColumnarScheduler.__init__(self, parent.clock, capacity=1)
+        self.parent = parent
+        self._closed = True
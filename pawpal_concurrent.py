@@ -0,0 +1,223 @@
+"""A Scheduler that can be shared between threads.
+
+ThreadSafeScheduler guards every Scheduler method with a reader-writer
+lock: queries run concurrently with each other, while changes take the
+lock exclusively for the duration of one index update. Waiting writers
+are preferred over new readers, so a steady stream of queries cannot
+starve them.
+
+Query results are consistent snapshots of which tasks exist and in what
+order at the moment of the call. The Task objects inside are the live,
+shared instances, so a writer may reschedule or complete them afterwards;
+hold reading() around a group of queries (and any use of the tasks they
+return) to see them all at one point in time. Forks read their parent
+without taking the lock, so query them inside reading(); committing one
+takes the write lock.
+"""
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from itertools import islice
+from typing import Callable, ContextManager, Iterator, List, Optional
+
+from pawpal_system import Occurrence, Scheduler, Task
+
+
+class RWLock:
+    """Reentrant, writer-preferring reader-writer lock.
+
+    A thread holding the write lock may take it again or take the read lock.
+    A thread holding only the read lock may take it again but not upgrade
+    to the write lock, which raises RuntimeError instead of deadlocking.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0  # threads currently holding the read lock
+        self._writer: Optional[int] = None  # ident of the writing thread
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()  # per-thread read depth
+
+    def holds_read(self) -> bool:
+        """Return True if the calling thread holds the read lock."""
+        return getattr(self._local, "reads", 0) > 0
+
+    def acquire_read(self):
+        if self._writer == threading.get_ident():
+            self._writer_depth += 1
+            return
+        reads = getattr(self._local, "reads", 0)
+        if not reads:
+            with self._cond:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+                self._readers += 1
+        self._local.reads = reads + 1
+
+    def release_read(self):
+        if self._writer == threading.get_ident():
+            # A read taken under the write lock counts toward the write depth,
+            # so releasing it may be what frees the lock
+            self.release_write()
+            return
+        self._local.reads -= 1
+        if not self._local.reads:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        if self._writer == me:
+            self._writer_depth += 1
+            return
+        if self.holds_read():
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+        with self._cond:
+            self._waiting_writers += 1
+            while self._readers or self._writer is not None:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self):
+        with self._cond:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the read lock for a with-block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the write lock for a with-block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+# The wrappers look the Scheduler method up on every call rather than
+# capturing it, so methods patched later (e.g. by pawpal_profiling.enable())
+# are used too.
+
+def _reads(name: str) -> Callable:
+    @wraps(getattr(Scheduler, name))
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_read()
+        try:
+            return getattr(Scheduler, name)(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+    return wrapper
+
+
+def _writes(name: str) -> Callable:
+    @wraps(getattr(Scheduler, name))
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_write()
+        try:
+            return getattr(Scheduler, name)(self, *args, **kwargs)
+        finally:
+            lock.release_write()
+    return wrapper
+
+
+class ThreadSafeScheduler(Scheduler):
+    """Scheduler whose methods may be called from many threads at once."""
+
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        """Initialize an empty scheduler; see Scheduler.__init__."""
+        self._lock = RWLock()
+        super().__init__(clock)
+
+    def reading(self) -> ContextManager[None]:
+        """Return a context manager holding the read lock, for a consistent multi-query view.
+
+        Writers wait until the block exits, so keep it short.
+        """
+        return self._lock.read()
+
+    @property
+    def all_tasks(self) -> List[Task]:
+        """Return all tasks in the order they were added."""
+        with self._lock.read():
+            return Scheduler.all_tasks.fget(self)
+
+    __len__ = _reads("__len__")
+    get_task = _reads("get_task")
+    find_pet = _reads("find_pet")
+    sort_by_time = _reads("sort_by_time")
+    tasks_between = _reads("tasks_between")
+    sort_by_priority = _reads("sort_by_priority")
+    get_tasks_by_priority = _reads("get_tasks_by_priority")
+    get_day_tasks = _reads("get_day_tasks")
+    get_today_tasks = _reads("get_today_tasks")
+    get_week = _reads("get_week")
+    get_upcoming_tasks = _reads("get_upcoming_tasks")
+    detect_conflicts = _reads("detect_conflicts")
+    summarize = _reads("summarize")
+
+    add_task = _writes("add_task")
+    add_tasks = _writes("add_tasks")
+    register_owner = _writes("register_owner")
+    unregister_owner = _writes("unregister_owner")
+    remove_task = _writes("remove_task")
+    reschedule_task = _writes("reschedule_task")
+    update_task = _writes("update_task")
+    subscribe = _writes("subscribe")
+    schedule_recurring_task = _writes("schedule_recurring_task")
+    materialize = _writes("materialize")
+    complete_occurrence = _writes("complete_occurrence")
+    complete_task_and_reschedule = _writes("complete_task_and_reschedule")
+    complete_task = _writes("complete_task")
+    complete_many = _writes("complete_many")
+    pop_next = _writes("pop_next")
+    rebuild_conflicts = _writes("rebuild_conflicts")
+    # ScheduleFork.commit() applies its edits through this, so a commit is atomic
+    _commit_fork = _writes("_commit_fork")
+
+    def iter_occurrences(self, start: datetime, end: datetime) -> Iterator[Occurrence]:
+        """Return the occurrences in [start, end), collected under the read lock.
+
+        A lazy generator could not hold the lock between steps, so the
+        results are gathered up front.
+        """
+        with self._lock.read():
+            return iter(list(Scheduler.iter_occurrences(self, start, end)))
+
+    def peek_next(self, k: int = 1, now: Optional[datetime] = None) -> List[Task]:
+        """Return the next k pending tasks; see Scheduler.peek_next.
+
+        The lookup runs under the read lock. Entries for tasks completed
+        behind the scheduler's back are purged afterwards under the write
+        lock, unless the caller already holds the read lock.
+        """
+        if now is None:
+            now = self.clock()
+        stale: List[str] = []
+        with self._lock.read():
+            upcoming = list(islice(self._iter_pending(now, stale), k))
+        if stale and not self._lock.holds_read():
+            with self._lock.write():
+                for task_id in stale:
+                    task = self._tasks.get(task_id)
+                    # Another thread may have purged or reopened it meanwhile
+                    if task is None or task.is_completed:
+                        self._unindex_pending(task_id)
+        return upcoming
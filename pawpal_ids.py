@@ -0,0 +1,186 @@
+"""Pluggable task ID allocation.
+
+Task IDs stay plain strings, but new ones come from an allocator that
+guarantees uniqueness instead of a truncated UUID (32 random bits, which
+collide by tens of thousands of tasks). The default allocator issues
+64-bit snowflake-style IDs in a compact base36 form; set_id_allocator()
+swaps in another one, such as a per-store counter.
+
+Snowflake IDs from different processes or hosts are only guaranteed
+distinct if their allocators have different node numbers. Without an
+explicit node each allocator picks one at random, so give every process
+whose IDs get merged its own node (pawpal_batch does this for its
+workers).
+"""
+import os
+import secrets
+import sys
+import threading
+import time
+from itertools import count
+from typing import Callable, Optional, Tuple
+from uuid import uuid4
+
+IdAllocator = Callable[[], str]
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def to_base36(number: int) -> str:
+    """Return a non-negative integer in lowercase base36."""
+    if number < 36:
+        return _DIGITS[number]
+    digits = []
+    while number:
+        number, digit = divmod(number, 36)
+        digits.append(_DIGITS[digit])
+    return "".join(reversed(digits))
+
+
+class SequentialIdAllocator:
+    """Issues "<prefix><n>" IDs from a monotonic integer counter.
+
+    The cheapest option, and unique for as long as the allocator lives. IDs
+    restart with each new allocator, so use a distinct prefix per store or
+    process if their tasks are ever merged.
+    """
+
+    def __init__(self, prefix: str = "", start: int = 1):
+        self.prefix = prefix
+        self._counter = count(start)
+
+    def __call__(self) -> str:
+        return sys.intern(f"{self.prefix}{next(self._counter)}")
+
+
+class SnowflakeIdAllocator:
+    """Issues 64-bit IDs built from a timestamp, a node number and a sequence.
+
+    Layout (most significant first): 41 bits of milliseconds since EPOCH_MS,
+    10 bits of node and 12 bits of sequence. Within one allocator IDs are
+    strictly increasing, even if the wall clock steps backwards or more than
+    4096 IDs are requested in one millisecond (the timestamp then runs ahead
+    of the clock instead of waiting). Allocators with different node numbers
+    never collide; two allocators sharing a node can, whenever they issue
+    IDs in the same millisecond.
+
+    The string form is 13 base36 characters: the timestamp and node in 10,
+    then the sequence in 3. Only the last three change within a millisecond,
+    so the prefix is cached, and the strings sort in creation order.
+    """
+
+    EPOCH_MS = 1_577_836_800_000  # 2020-01-01T00:00:00Z
+    NODE_BITS = 10
+    SEQUENCE_BITS = 12
+    _SEQUENCE_TEXT = [to_base36(n).rjust(3, "0") for n in range(1 << SEQUENCE_BITS)]
+
+    def __init__(self, node: Optional[int] = None, clock: Callable[[], int] = time.time_ns):
+        """Create an allocator.
+
+        Args:
+            node: Node number in [0, 1023]. Defaults to a random one, which
+                two allocators share with probability 1/1024; pass distinct
+                nodes whenever IDs from several processes or hosts are merged.
+            clock: Returns the current time in nanoseconds.
+
+        Raises:
+            ValueError: If node is out of range.
+        """
+        self._auto_node = node is None
+        if node is None:
+            node = self._random_node()
+        if not 0 <= node < 1 << self.NODE_BITS:
+            raise ValueError(f"node must be in [0, {(1 << self.NODE_BITS) - 1}]")
+        self.node = node
+        self.clock = clock
+        self._ms = -1
+        self._sequence = 0
+        # (milliseconds, prefix) of the last string ID, swapped as one tuple
+        # so concurrent callers never pair one's timestamp with another's prefix
+        self._prefix_cache: Tuple[int, str] = (-1, "")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _random_node(cls) -> int:
+        return secrets.randbelow(1 << cls.NODE_BITS)
+
+    def _after_fork(self):
+        """Give a forked child another node so it is unlikely to repeat the parent's IDs."""
+        self._lock = threading.Lock()
+        if self._auto_node:
+            self.node = (self.node + 1 + secrets.randbelow((1 << self.NODE_BITS) - 1)) \
+                % (1 << self.NODE_BITS)
+            self._prefix_cache = (-1, "")
+
+    def _next(self) -> Tuple[int, int]:
+        """Return the (milliseconds, sequence) pair for the next ID."""
+        now = self.clock() // 1_000_000 - self.EPOCH_MS
+        with self._lock:
+            if now > self._ms:
+                self._ms, self._sequence = now, 0
+            elif self._sequence < (1 << self.SEQUENCE_BITS) - 1:
+                self._sequence += 1
+            else:
+                self._ms, self._sequence = self._ms + 1, 0
+            return self._ms, self._sequence
+
+    def next_int(self) -> int:
+        """Return the next ID as an integer."""
+        ms, sequence = self._next()
+        return (((ms << self.NODE_BITS) | self.node) << self.SEQUENCE_BITS) | sequence
+
+    def __call__(self) -> str:
+        ms, sequence = self._next()
+        cached_ms, prefix = self._prefix_cache
+        if cached_ms != ms:
+            prefix = to_base36((ms << self.NODE_BITS) | self.node).rjust(10, "0")
+            self._prefix_cache = (ms, prefix)
+        return sys.intern(prefix + self._SEQUENCE_TEXT[sequence])
+
+    @classmethod
+    def parse(cls, task_id: str) -> int:
+        """Return the integer form of an ID issued by __call__.
+
+        Raises:
+            ValueError: If the string is not a snowflake ID.
+        """
+        if len(task_id) != 13:
+            raise ValueError(f"Not a snowflake ID: '{task_id}'")
+        return (int(task_id[:10], 36) << cls.SEQUENCE_BITS) | int(task_id[10:], 36)
+
+
+def uuid_id() -> str:
+    """Return an ID in the original format: the first 8 hex digits of a UUID4.
+
+    Kept for compatibility only; it is not collision-free.
+    """
+    return str(uuid4())[:8]
+
+
+_allocator: IdAllocator = SnowflakeIdAllocator()
+
+
+def _after_fork_in_child():
+    if isinstance(_allocator, SnowflakeIdAllocator):
+        _allocator._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def new_task_id() -> str:
+    """Return a new task ID from the current allocator."""
+    return _allocator()
+
+
+def get_id_allocator() -> IdAllocator:
+    """Return the allocator used for new task IDs."""
+    return _allocator
+
+
+def set_id_allocator(allocator: IdAllocator) -> IdAllocator:
+    """Use `allocator` for all new task IDs and return the previous one."""
+    global _allocator
+    previous, _allocator = _allocator, allocator
+    return previous
@@ -0,0 +1,279 @@
+"""Streaming bulk import/export of pets and tasks as JSONL or CSV.
+
+Both formats use the same flat rows: a "pet" row per pet followed by a
+"task" row per task, where task rows name their pet. Readers and writers
+are generators, and imports attach tasks in fixed-size batches, so memory
+use does not grow with file size.
+"""
+import csv
+import json
+import sys
+import time as timer
+from dataclasses import dataclass, field
+from datetime import datetime, date
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from pawpal_system import PRIORITY_RANK, Owner, Pet, Scheduler, Task
+
+CSV_FIELDS = [
+    "kind", "pet", "species", "breed", "date_of_birth",
+    "task_id", "title", "description", "category", "scheduled_time",
+    "duration_minutes", "recurrence_days", "priority", "is_completed", "series_id",
+]
+
+
+@dataclass
+class ImportReport:
+    """Outcome and throughput of a bulk import."""
+    rows: int = 0
+    pets_added: int = 0
+    tasks_added: int = 0
+    error_count: int = 0
+    # (row number, message) for the first `max_errors` rejected rows
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the import throughput."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+
+def _require(row: dict, key: str) -> str:
+    value = row.get(key)
+    if value is None or value == "":
+        raise ValueError(f"missing '{key}'")
+    return value
+
+
+def row_to_pet(row: dict) -> Pet:
+    """Build a Pet from a "pet" row.
+
+    Raises:
+        ValueError: If a required field is missing or malformed.
+    """
+    return Pet(
+        name=_require(row, "pet"),
+        species=_require(row, "species"),
+        breed=row.get("breed") or "Unknown",
+        date_of_birth=date.fromisoformat(_require(row, "date_of_birth"))
+    )
+
+
+def row_to_task(row: dict) -> Task:
+    """Build a Task from a "task" row.
+
+    Raises:
+        ValueError: If a required field is missing or malformed.
+    """
+    priority = row.get("priority") or "medium"
+    if priority not in PRIORITY_RANK:
+        raise ValueError(f"unknown priority '{priority}'")
+    fields = dict(
+        title=_require(row, "title"),
+        description=row.get("description") or "",
+        category=_require(row, "category"),
+        scheduled_time=datetime.fromisoformat(_require(row, "scheduled_time")),
+        is_completed=_parse_bool(row.get("is_completed") or False),
+        recurrence_days=int(row.get("recurrence_days") or 0),
+        priority=priority,
+        duration_minutes=int(row.get("duration_minutes") or 0)
+    )
+    if fields["recurrence_days"] < 0 or fields["duration_minutes"] < 0:
+        raise ValueError("recurrence_days and duration_minutes must not be negative")
+    if row.get("task_id"):
+        fields["task_id"] = sys.intern(str(row["task_id"]))
+    if row.get("series_id"):
+        fields["series_id"] = str(row["series_id"])
+    return Task(**fields)
+
+
+def pet_to_row(pet: Pet) -> dict:
+    """Return the "pet" row for a pet."""
+    return {
+        "kind": "pet",
+        "pet": pet.name,
+        "species": pet.species,
+        "breed": pet.breed,
+        "date_of_birth": pet.date_of_birth.isoformat(),
+    }
+
+
+def task_to_row(task: Task, pet_name: str) -> dict:
+    """Return the "task" row for a task belonging to `pet_name`."""
+    return {
+        "kind": "task",
+        "pet": pet_name,
+        "task_id": task.task_id,
+        "title": task.title,
+        "description": task.description,
+        "category": task.category,
+        "scheduled_time": task.scheduled_time.isoformat(),
+        "duration_minutes": task.duration_minutes,
+        "recurrence_days": task.recurrence_days,
+        "priority": task.priority,
+        "is_completed": task.is_completed,
+        "series_id": task.series_id,
+    }
+
+
+def iter_owner_rows(owner: Owner) -> Iterator[dict]:
+    """Yield every pet row followed by that pet's task rows."""
+    for pet in owner.pets:
+        yield pet_to_row(pet)
+        for task in pet.tasks:
+            yield task_to_row(task, pet.name)
+
+
+def read_jsonl(path: str) -> Iterator[Union[dict, ValueError]]:
+    """Lazily yield rows from a JSON Lines file, skipping blank lines.
+
+    A line that is not valid JSON is yielded as a ValueError describing it
+    instead of a row, so import_rows() counts it as a row error and carries
+    on with the rest of the file.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield ValueError(f"{path}:{line_number}: invalid JSON: {exc}")
+
+
+def read_csv(path: str) -> Iterator[dict]:
+    """Lazily yield rows from a CSV file with a header row."""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def write_jsonl(rows: Iterable[dict], path: str) -> int:
+    """Write rows as JSON Lines and return how many were written."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def write_csv(rows: Iterable[dict], path: str) -> int:
+    """Write rows as CSV with the CSV_FIELDS header and return how many were written."""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def import_rows(rows: Iterable[Union[dict, ValueError]], owner: Owner, scheduler: Optional[Scheduler] = None,
+                batch_size: int = 1000, max_errors: int = 100) -> ImportReport:
+    """Validate rows and attach pets and tasks to an owner (and scheduler).
+
+    Pet rows add the pet to the owner unless one with that name exists.
+    Task rows are attached to the named pet; tasks are then handed to the
+    scheduler one batch at a time via Scheduler.add_tasks. Invalid rows are
+    skipped and recorded in the report rather than aborting the import;
+    that includes rows that are not objects and ValueError entries for
+    unreadable lines (see read_jsonl()).
+
+    Args:
+        rows: Row dicts, e.g. from read_jsonl() or read_csv().
+        owner: Owner receiving pets and tasks.
+        scheduler: Optional Scheduler to add imported tasks to.
+        batch_size: Number of rows validated before each batch is attached.
+        max_errors: Number of error messages kept in the report.
+    """
+    report = ImportReport()
+    started = timer.perf_counter()
+    rows = iter(rows)
+
+    def reject(row_number: int, message: str):
+        report.error_count += 1
+        if len(report.errors) < max_errors:
+            report.errors.append((row_number, message))
+
+    while True:
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            break
+        batch: List[Tuple[int, Pet, Task]] = []
+        batch_ids: Set[str] = set()
+        for row in chunk:
+            report.rows += 1
+            try:
+                if isinstance(row, ValueError):
+                    raise row
+                if not isinstance(row, dict):
+                    raise ValueError(f"expected an object, got {type(row).__name__}")
+                kind = row.get("kind") or "task"
+                if kind == "pet":
+                    pet = row_to_pet(row)
+                    if owner.get_pet(pet.name) is None:
+                        owner.add_pet(pet)
+                        report.pets_added += 1
+                elif kind == "task":
+                    pet = owner.get_pet(row.get("pet"))
+                    if pet is None:
+                        raise ValueError(f"unknown pet '{row.get('pet')}'")
+                    task = row_to_task(row)
+                    if task.task_id in batch_ids or owner.find_pet_for_task(task.task_id) is not None:
+                        raise ValueError(f"Duplicate task_id '{task.task_id}'")
+                    batch_ids.add(task.task_id)
+                    batch.append((report.rows, pet, task))
+                else:
+                    raise ValueError(f"unknown row kind '{kind}'")
+            except (ValueError, TypeError) as exc:
+                reject(report.rows, str(exc))
+
+        # Pets get their tasks first, so scheduler listeners (e.g. a Journal)
+        # can already tell which pet each added task belongs to
+        for _, pet, task in batch:
+            pet.add_task(task)
+        if scheduler is not None:
+            try:
+                scheduler.add_tasks(task for _, _, task in batch)
+            except ValueError:
+                # Fall back to one at a time so only the clashing rows are rejected
+                accepted = []
+                for entry in batch:
+                    try:
+                        scheduler.add_task(entry[2])
+                        accepted.append(entry)
+                    except ValueError as exc:
+                        entry[1].remove_task(entry[2].task_id)
+                        reject(entry[0], str(exc))
+                batch = accepted
+        report.tasks_added += len(batch)
+
+    report.seconds = timer.perf_counter() - started
+    return report
+
+
+def import_file(path: str, owner: Owner, scheduler: Optional[Scheduler] = None,
+                **kwargs) -> ImportReport:
+    """Import a .jsonl or .csv file; see import_rows() for the keyword arguments."""
+    reader = read_csv if path.endswith(".csv") else read_jsonl
+    return import_rows(reader(path), owner, scheduler, **kwargs)
+
+
+def export_file(owner: Owner, path: str) -> int:
+    """Export an owner's pets and tasks to a .jsonl or .csv file.
+
+    Returns:
+        int: Number of rows written.
+    """
+    writer = write_csv if path.endswith(".csv") else write_jsonl
+    return writer(iter_owner_rows(owner), path)
@@ -0,0 +1,372 @@
+"""Append-only change journal for a Scheduler, with replay and a change feed.
+
+A Journal subscribes to a scheduler and records every change made through
+it (add, remove, reschedule, update, complete) as a numbered entry. Each
+entry is one compact JSON array per line:
+
+    [seq, event, task_id, data]
+
+where data is the task's row (see pawpal_io.task_to_row, plus its owner)
+for "add", the edited fields for "reschedule"/"update", and null for
+"remove" and "complete". Completing a recurring task is recorded as its
+"complete" followed by the "add" of the next occurrence, so replay never
+has to re-derive anything.
+
+Entries can also go to a file, fsynced in batches: a crash loses at most
+the entries written since the last sync. After a crash, recover() loads
+the last checkpoint snapshot and replays the journal file over it.
+Replaying is idempotent, so entries already covered by the snapshot are
+harmless.
+
+subscribe(callback, since=seq) and entries_since(seq) give downstream
+views just the entries they have not seen yet, instead of a rescan.
+
+Changes made directly on Task objects (e.g. task.mark_complete()) bypass
+the scheduler and are not journaled.
+"""
+import json
+import os
+import time as timer
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pawpal_io import row_to_task, task_to_row
+from pawpal_snapshot import Snapshot, write_snapshot
+from pawpal_system import EDITABLE_FIELDS, Owner, Pet, Scheduler, Task
+
+EVENTS = ("add", "remove", "reschedule", "update", "complete")
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """One recorded change."""
+    seq: int
+    event: str
+    task_id: str
+    # See the module docstring; None for "remove" and "complete"
+    data: Optional[Dict[str, Any]] = None
+
+    def to_line(self) -> str:
+        """Return the entry as one line of the journal file (without newline)."""
+        return json.dumps([self.seq, self.event, self.task_id, self.data],
+                          separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def from_line(cls, line: str) -> "JournalEntry":
+        """Parse one journal file line.
+
+        Raises:
+            ValueError: If the line is not a valid entry.
+        """
+        try:
+            seq, event, task_id, data = json.loads(line)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Malformed journal entry: {line[:80]!r}") from exc
+        if event not in EVENTS:
+            raise ValueError(f"Unknown journal event '{event}'")
+        return cls(seq, event, task_id, data)
+
+
+def _scan(path: str) -> Iterator[Tuple[JournalEntry, int]]:
+    """Yield each complete entry of a journal file with the byte offset just past it.
+
+    An entry only counts once its newline is written, so a torn last line
+    (from a crash mid-write) is ignored, whether or not it happens to parse.
+
+    Raises:
+        ValueError: If a line other than the last one is corrupt.
+    """
+    with open(path, "rb") as f:
+        offset = 0
+        bad_line = None
+        for line_number, line in enumerate(f, start=1):
+            offset += len(line)
+            if not line.strip():
+                continue
+            if bad_line is not None:
+                raise ValueError(f"{path}:{bad_line}: corrupt journal entry")
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("torn entry")
+                entry = JournalEntry.from_line(line.decode("utf-8"))
+            except ValueError:
+                bad_line = line_number
+                continue
+            yield entry, offset
+
+
+def read_journal(path: str) -> Iterator[JournalEntry]:
+    """Lazily yield the entries of a journal file.
+
+    A torn last line (from a crash mid-write) is ignored.
+
+    Raises:
+        ValueError: If a line other than the last one is corrupt.
+    """
+    return (entry for entry, _ in _scan(path))
+
+
+class Journal:
+    """Records a scheduler's changes in order and feeds them to subscribers.
+
+    At least the most recent `retain` entries are kept in memory for
+    entries_since() and catch-up subscriptions; the file, if any, keeps
+    everything since the last checkpoint.
+    """
+
+    def __init__(self, path: Optional[str] = None, sync_every: int = 64,
+                 sync_interval: float = 1.0, retain: int = 10_000):
+        """Open a journal, continuing the numbering of an existing file.
+
+        A torn last line left by a crash is truncated away first.
+
+        Args:
+            path: Optional journal file, appended to.
+            sync_every: fsync the file after this many entries...
+            sync_interval: ...or once this many seconds passed since the last sync.
+            retain: Minimum number of recent entries kept in memory.
+        """
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.retain = retain
+        self._entries: List[JournalEntry] = []
+        self._last_seq = 0
+        self._subscribers: List[Callable[[JournalEntry], None]] = []
+        self._scheduler: Optional[Scheduler] = None
+        self._detach: Optional[Callable[[], None]] = None
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = timer.monotonic()
+        if path is not None:
+            if os.path.exists(path):
+                end = 0
+                for entry, end in _scan(path):
+                    self._last_seq = entry.seq
+                # Cut off a torn last line so new entries start on a line of their own
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+            self._file = open(path, "a", encoding="utf-8")
+
+    @property
+    def last_seq(self) -> int:
+        """Return the sequence number of the latest entry (0 if none yet)."""
+        return self._last_seq
+
+    def attach(self, scheduler: Scheduler):
+        """Start recording changes made through `scheduler`."""
+        self.detach()
+        self._scheduler = scheduler
+        self._detach = scheduler.subscribe(self._on_change)
+
+    def detach(self):
+        """Stop recording changes."""
+        if self._detach is not None:
+            self._detach()
+            self._detach = self._scheduler = None
+
+    def _on_change(self, event: str, task: Task):
+        if event == "add":
+            data = task_to_row(task, None)
+            del data["kind"], data["task_id"]
+            pet = self._scheduler.find_pet(task.task_id)
+            if pet is not None:
+                data["pet"] = pet.name
+                data["owner"] = pet._owner.name
+        elif event == "reschedule":
+            data = {"scheduled_time": task.scheduled_time.isoformat()}
+        elif event == "update":
+            data = {name: getattr(task, name) for name in sorted(EDITABLE_FIELDS)}
+            data["scheduled_time"] = task.scheduled_time.isoformat()
+        else:
+            data = None
+        self.append(event, task.task_id, data)
+
+    def append(self, event: str, task_id: str, data: Optional[Dict[str, Any]] = None) -> JournalEntry:
+        """Record an entry, write it to the file and pass it to subscribers.
+
+        attach() calls this for every scheduler change; call it directly
+        only to journal changes made some other way.
+
+        Raises:
+            ValueError: If event is not one of EVENTS.
+        """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown journal event '{event}'")
+        self._last_seq += 1
+        entry = JournalEntry(self._last_seq, event, task_id, data)
+        self._entries.append(entry)
+        if len(self._entries) > 2 * self.retain:
+            # Trim in chunks so appends stay amortized O(1)
+            del self._entries[:-self.retain]
+        if self._file is not None:
+            self._file.write(entry.to_line() + "\n")
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every \
+                    or timer.monotonic() - self._last_sync >= self.sync_interval:
+                self.sync()
+        for callback in list(self._subscribers):
+            callback(entry)
+        return entry
+
+    def sync(self):
+        """Flush the file and fsync it."""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = timer.monotonic()
+
+    def close(self):
+        """Detach, sync and close the file."""
+        self.detach()
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def entries_since(self, seq: int) -> List[JournalEntry]:
+        """Return the entries after `seq`, oldest first, in O(returned entries).
+
+        Raises:
+            ValueError: If entries after `seq` are no longer kept in memory;
+                the caller must rebuild its view from the scheduler instead.
+        """
+        if seq >= self._last_seq:
+            return []
+        first = self._entries[0].seq if self._entries else self._last_seq + 1
+        if seq + 1 < first:
+            raise ValueError(f"Entries after {seq} are no longer retained (oldest is {first})")
+        # Sequence numbers are consecutive, so the offset is arithmetic
+        return self._entries[seq + 1 - first:]
+
+    def subscribe(self, callback: Callable[[JournalEntry], None],
+                  since: Optional[int] = None) -> Callable[[], None]:
+        """Call `callback(entry)` for every new entry.
+
+        Args:
+            callback: Receives each JournalEntry, synchronously.
+            since: Optional sequence number the caller is up to date with;
+                the entries after it are delivered first.
+
+        Returns:
+            Callable[[], None]: A function that unsubscribes the callback.
+
+        Raises:
+            ValueError: If `since` is older than the retained entries.
+        """
+        backlog = self.entries_since(since) if since is not None else []
+        for entry in backlog:
+            callback(entry)
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def checkpoint(self, snapshot_path: str, owners: Iterable[Owner] = ()):
+        """Write a snapshot of the attached scheduler and start a new journal file.
+
+        The snapshot is written before the file is truncated, so a crash in
+        between only means some entries get replayed again, which is harmless.
+
+        Raises:
+            ValueError: If no scheduler is attached.
+        """
+        if self._scheduler is None:
+            raise ValueError("Journal is not attached to a scheduler")
+        self.sync()
+        write_snapshot(snapshot_path, owners, self._scheduler)
+        if self._file is not None:
+            self._file.close()
+            self._file = open(self.path, "w", encoding="utf-8")
+            self.sync()
+
+
+def _find_pet(owners: Iterable[Owner], owner_name: Optional[str], pet_name: Optional[str]) -> Optional[Pet]:
+    for owner in owners:
+        if owner.name == owner_name:
+            pet = owner.get_pet(pet_name)
+            if pet is not None:
+                return pet
+    return None
+
+
+def replay(entries: Iterable[JournalEntry], scheduler: Scheduler,
+           owners: Iterable[Owner] = ()) -> int:
+    """Apply journal entries to a scheduler (and the owners' pets).
+
+    Entries whose effect is already present are skipped, so replaying over
+    a snapshot that already includes some of them is safe. A removed task
+    is also taken off its pet.
+
+    Args:
+        entries: Entries in sequence order.
+        scheduler: The scheduler to update.
+        owners: Owners whose pets receive added tasks, matched by name.
+
+    Returns:
+        int: Number of entries that changed something.
+    """
+    owners = list(owners)
+    applied = 0
+    for entry in entries:
+        task = scheduler.get_task(entry.task_id)
+        if entry.event == "add":
+            if task is not None:
+                continue
+            row = dict(entry.data, task_id=entry.task_id)
+            task = row_to_task(row)
+            pet = _find_pet(owners, row.get("owner"), row.get("pet"))
+            if pet is not None:
+                pet.add_task(task)
+            scheduler.add_task(task)
+        elif task is None:
+            continue
+        elif entry.event == "remove":
+            pet = scheduler.find_pet(entry.task_id)
+            scheduler.remove_task(entry.task_id)
+            if pet is not None:
+                pet.remove_task(entry.task_id)
+        elif entry.event == "complete":
+            if task.is_completed:
+                continue
+            scheduler.complete_task(entry.task_id)
+        else:
+            changes = dict(entry.data)
+            changes["scheduled_time"] = datetime.fromisoformat(changes["scheduled_time"])
+            if all(getattr(task, name) == value for name, value in changes.items()):
+                continue
+            scheduler.update_task(entry.task_id, **changes)
+        applied += 1
+    return applied
+
+
+def recover(snapshot_path: Optional[str], journal_path: str,
+            clock: Callable[[], datetime] = datetime.now) -> Tuple[Scheduler, List[Owner]]:
+    """Rebuild a scheduler after a crash from the last checkpoint and the journal.
+
+    Args:
+        snapshot_path: Snapshot written by Journal.checkpoint(), or None (or a
+            missing file) to replay the journal from an empty schedule.
+        journal_path: The journal file.
+        clock: Clock for the new scheduler.
+
+    Returns:
+        Tuple[Scheduler, List[Owner]]: The recovered scheduler, with the
+        snapshot's owners registered.
+    """
+    if snapshot_path is not None and os.path.exists(snapshot_path):
+        with Snapshot(snapshot_path) as snapshot:
+            scheduler = snapshot.to_scheduler(clock)
+            owners = snapshot.load_owners()
+    else:
+        scheduler, owners = Scheduler(clock=clock), []
+    if os.path.exists(journal_path):
+        replay(read_journal(journal_path), scheduler, owners)
+    return scheduler, owners
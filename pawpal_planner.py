@@ -0,0 +1,257 @@
+"""Daily plan optimizer: choose and order tasks to fit an owner's free time.
+
+plan_day() treats fixed appointments as immovable, splits the owner's
+available windows into the free slots around them, and then picks which
+flexible tasks to do (and in which slot) to maximize priority-weighted
+value. The choice is made with a memoized branch-and-bound search that
+starts from a greedy solution and returns the best plan found so far if it
+runs out of its latency budget.
+"""
+import time as timer
+from dataclasses import dataclass, field
+from datetime import datetime, date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pawpal_system import Owner, Scheduler, Task
+
+# Value of completing a task of each priority; unknown priorities get 1
+PRIORITY_VALUE = {"high": 8, "medium": 4, "low": 2}
+FIXED_CATEGORIES = {"appointment"}
+# Above this many flexible candidates the exact search is skipped entirely
+MAX_EXACT_CANDIDATES = 400
+
+Window = Tuple[datetime, datetime]
+
+
+@dataclass
+class PlannedTask:
+    """A task placed in the day plan, with the reason it was chosen."""
+    task: Task
+    start: datetime
+    end: datetime
+    reason: str
+
+
+@dataclass
+class DayPlan:
+    """The result of plan_day()."""
+    day: date
+    entries: List[PlannedTask] = field(default_factory=list)
+    # Candidates left out of the plan, with the reason why
+    skipped: List[Tuple[Task, str]] = field(default_factory=list)
+    total_value: int = 0
+    # False if the latency budget ran out before the search finished
+    optimal: bool = True
+    elapsed_ms: float = 0.0
+
+    def explain(self) -> List[str]:
+        """Return one human-readable line per planned or skipped task."""
+        lines = [
+            f"{e.start.strftime('%H:%M')}–{e.end.strftime('%H:%M')} {e.task.title}: {e.reason}"
+            for e in self.entries
+        ]
+        lines.extend(f"Skipped {task.title}: {reason}" for task, reason in self.skipped)
+        return lines
+
+    def apply(self, scheduler: Scheduler) -> int:
+        """Move each planned task in the scheduler to its planned start time.
+
+        Returns:
+            int: Number of tasks that were rescheduled.
+        """
+        moved = 0
+        for entry in self.entries:
+            if entry.task.scheduled_time != entry.start:
+                scheduler.reschedule_task(entry.task.task_id, entry.start)
+                moved += 1
+        return moved
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _free_slots(windows: Sequence[Window], busy: Iterable[Window]) -> List[Window]:
+    """Subtract busy intervals from the (merged) available windows."""
+    slots: List[Window] = []
+    for start, end in sorted(windows):
+        if slots and start <= slots[-1][1]:
+            slots[-1] = (slots[-1][0], max(end, slots[-1][1]))
+        else:
+            slots.append((start, end))
+    for busy_start, busy_end in sorted(busy):
+        remaining = []
+        for start, end in slots:
+            if busy_end <= start or busy_start >= end:
+                remaining.append((start, end))
+                continue
+            if start < busy_start:
+                remaining.append((start, busy_start))
+            if busy_end < end:
+                remaining.append((busy_end, end))
+        slots = remaining
+    return slots
+
+
+def _greedy(items: Sequence[Tuple[int, int, int]], capacities: List[int]) -> Tuple[int, List[Tuple[int, int]]]:
+    """Best-fit by value density. Items are (value, minutes, index) sorted by density."""
+    capacities = list(capacities)
+    value, assignment = 0, []
+    for item_value, minutes, index in items:
+        fits = [s for s, cap in enumerate(capacities) if cap >= minutes]
+        if fits:
+            slot = min(fits, key=lambda s: capacities[s])
+            capacities[slot] -= minutes
+            value += item_value
+            assignment.append((index, slot))
+    return value, assignment
+
+
+def _branch_and_bound(items: Sequence[Tuple[int, int, int]], capacities: List[int],
+                      incumbent: Tuple[int, List[Tuple[int, int]]],
+                      deadline: float) -> Tuple[int, List[Tuple[int, int]], bool]:
+    """Search item-to-slot assignments for the maximum total value.
+
+    Prunes with a fractional-knapsack upper bound and memoizes the best value
+    seen at each (item, remaining capacities) state, so equivalent partial
+    plans are only expanded once.
+
+    Returns:
+        (value, assignment, finished): finished is False on timeout, in which
+        case the best assignment found so far is returned.
+    """
+    best_value, best_assignment = incumbent
+    best = [best_value, list(best_assignment)]
+    memo: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+    assignment: List[Tuple[int, int]] = []
+    caps = list(capacities)
+
+    def bound(i: int, value: int) -> float:
+        room = sum(caps)
+        for item_value, minutes, _ in items[i:]:
+            if minutes <= room:
+                room -= minutes
+                value += item_value
+            else:
+                return value + item_value * room / minutes
+        return value
+
+    def search(i: int, value: int):
+        # Every node runs an O(n) bound, so a clock read per node is cheap
+        # and keeps the overshoot past the deadline to about one node
+        if timer.perf_counter() > deadline:
+            raise _Timeout
+        if value > best[0]:
+            best[0], best[1] = value, list(assignment)
+        if i == len(items) or bound(i, value) <= best[0]:
+            return
+        key = (i, tuple(sorted(caps)))
+        if memo.get(key, -1) >= value:
+            return
+        memo[key] = value
+
+        item_value, minutes, index = items[i]
+        tried = set()
+        for slot, cap in enumerate(caps):
+            # Slots with equal remaining room are interchangeable
+            if cap >= minutes and cap not in tried:
+                tried.add(cap)
+                caps[slot] -= minutes
+                assignment.append((index, slot))
+                search(i + 1, value + item_value)
+                assignment.pop()
+                caps[slot] += minutes
+        search(i + 1, value)
+
+    try:
+        search(0, 0)
+    except _Timeout:
+        return best[0], best[1], False
+    return best[0], best[1], True
+
+
+def plan_day(owner: Owner, available_windows: Sequence[Window],
+             candidates: Optional[Iterable[Task]] = None,
+             latency_budget_ms: float = 50.0) -> DayPlan:
+    """Choose and order tasks for one day within the owner's available time.
+
+    Fixed appointments (category "appointment") keep their scheduled time.
+    Every other candidate is flexible: it may be placed in any free slot
+    around the appointments, or left out if time runs short. The plan
+    maximizes the sum of PRIORITY_VALUE over placed tasks; within a slot,
+    tasks run back to back in their originally scheduled order.
+
+    Args:
+        owner: Owner whose pending tasks are planned.
+        available_windows: (start, end) periods the owner has free that day.
+        candidates: Tasks to consider; defaults to the owner's pending tasks
+            scheduled on or before the day (overdue tasks carry over).
+        latency_budget_ms: Time allowed for the exact search before falling
+            back to the best plan found so far (at least the greedy plan).
+
+    Returns:
+        DayPlan: Planned tasks in time order with explanations.
+    """
+    started = timer.perf_counter()
+    if not available_windows:
+        raise ValueError("At least one available window is required")
+    day = min(start for start, _ in available_windows).date()
+    if candidates is None:
+        candidates = [
+            t for t in owner.get_all_tasks()
+            if not t.is_completed and t.scheduled_time.date() <= day
+        ]
+    plan = DayPlan(day=day)
+
+    fixed = [t for t in candidates if t.category in FIXED_CATEGORIES]
+    flexible = [t for t in candidates if t.category not in FIXED_CATEGORIES]
+    for task in fixed:
+        if task.scheduled_time.date() != day:
+            plan.skipped.append((task, "Appointment is not on this day"))
+            continue
+        plan.entries.append(PlannedTask(
+            task, task.scheduled_time, task.end_time,
+            f"Fixed appointment at {task.scheduled_time.strftime('%H:%M')}"
+        ))
+        plan.total_value += PRIORITY_VALUE.get(task.priority, 1)
+
+    slots = _free_slots(available_windows, [(e.start, e.end) for e in plan.entries])
+    capacities = [int((end - start).total_seconds() // 60) for start, end in slots]
+    items = sorted(
+        ((PRIORITY_VALUE.get(t.priority, 1), t.duration_minutes, i) for i, t in enumerate(flexible)),
+        key=lambda item: item[0] / item[1] if item[1] else float("inf"),
+        reverse=True
+    )
+
+    incumbent = _greedy(items, capacities)
+    if len(items) <= MAX_EXACT_CANDIDATES:
+        deadline = started + latency_budget_ms / 1000
+        value, assignment, plan.optimal = _branch_and_bound(items, capacities, incumbent, deadline)
+    else:
+        (value, assignment), plan.optimal = incumbent, False
+    plan.total_value += value
+
+    by_slot: Dict[int, List[Task]] = {}
+    for index, slot in assignment:
+        by_slot.setdefault(slot, []).append(flexible[index])
+    for slot, tasks in by_slot.items():
+        cursor, slot_end = slots[slot]
+        for task in sorted(tasks, key=lambda t: t.scheduled_time):
+            end = cursor + timedelta(minutes=task.duration_minutes)
+            reason = f"{task.priority} priority, {task.duration_minutes} min"
+            if task.scheduled_time.date() < day:
+                reason += f", overdue since {task.scheduled_time.strftime('%Y-%m-%d %H:%M')}"
+            reason += f"; fits free time {slots[slot][0].strftime('%H:%M')}–{slot_end.strftime('%H:%M')}"
+            plan.entries.append(PlannedTask(task, cursor, end, reason))
+            cursor = end
+
+    chosen = {index for index, _ in assignment}
+    for i, task in enumerate(flexible):
+        if i not in chosen:
+            plan.skipped.append(
+                (task, f"Not enough free time left for {task.duration_minutes} min "
+                       f"({task.priority} priority)")
+            )
+    plan.entries.sort(key=lambda e: e.start)
+    plan.elapsed_ms = (timer.perf_counter() - started) * 1000
+    return plan
@@ -0,0 +1,195 @@
+"""Opt-in instrumentation for Scheduler, Owner and Pet methods.
+
+enable() replaces each public method on the target classes with a wrapper
+that records call counts, a latency histogram and how many tasks the call
+returned. disable() puts the original methods back, so there is no
+overhead at all while instrumentation is off.
+
+Methods that return generators (e.g. Scheduler.iter_occurrences) are
+recorded when the generator is exhausted or closed, with the time spent
+producing its items, not just creating it. A generator that is never
+iterated is not recorded. Stats are updated under a lock, so counts stay
+exact when instrumented methods run on several threads (e.g. readers of a
+ThreadSafeScheduler).
+"""
+import threading
+import time as timer
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from types import GeneratorType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pawpal_system import Owner, Pet, Scheduler, Task
+
+DEFAULT_TARGETS = (Scheduler, Owner, Pet)
+# Upper bounds (in seconds) of the latency histogram buckets; the last
+# bucket collects everything slower.
+BUCKET_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1)
+BUCKET_LABELS = ("<10µs", "<100µs", "<1ms", "<10ms", "<100ms", ">=100ms")
+
+
+@dataclass
+class OperationStats:
+    """Aggregated measurements for one instrumented method."""
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    # Call counts per latency bucket, see BUCKET_LABELS
+    histogram: List[int] = field(default_factory=lambda: [0] * len(BUCKET_LABELS))
+    # Tasks returned (lists of tasks or conflicts count each item) or created
+    tasks_touched: int = 0
+
+    @property
+    def mean_ms(self) -> float:
+        """Return the mean latency in milliseconds."""
+        return 1000 * self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, seconds: float, touched: int):
+        """Add one call to the totals."""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        bucket = 0
+        while bucket < len(BUCKET_BOUNDS) and seconds >= BUCKET_BOUNDS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        self.tasks_touched += touched
+
+
+_stats: Dict[str, OperationStats] = {}
+# Guards every OperationStats in _stats
+_lock = threading.Lock()
+# (class, attribute name, original function) for every patched method
+_originals: List[Tuple[type, str, object]] = []
+
+
+def _count_tasks(result) -> int:
+    if isinstance(result, Task):
+        return 1
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 0
+
+
+def _timed_iteration(stats: OperationStats, iterator: Iterator, seconds: float) -> Iterator:
+    """Yield from `iterator`, then record the time spent inside it and the items it yielded."""
+    yielded = 0
+    try:
+        while True:
+            start = timer.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                seconds += timer.perf_counter() - start
+                return
+            seconds += timer.perf_counter() - start
+            yielded += 1
+            yield item
+    finally:
+        iterator.close()
+        with _lock:
+            stats.record(seconds, yielded)
+
+
+def _instrument(name: str, func):
+    stats = _stats.setdefault(name, OperationStats())
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = timer.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = timer.perf_counter() - start
+        if isinstance(result, GeneratorType):
+            return _timed_iteration(stats, result, seconds)
+        with _lock:
+            stats.record(seconds, _count_tasks(result))
+        return result
+    return wrapper
+
+
+def enable(targets: Iterable[type] = DEFAULT_TARGETS):
+    """Start recording every public method call on the target classes.
+
+    Calling enable() again while already enabled does nothing.
+    """
+    if _originals:
+        return
+    for cls in targets:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value) \
+                    or isinstance(value, (staticmethod, classmethod, type)):
+                continue
+            _originals.append((cls, attr, value))
+            setattr(cls, attr, _instrument(f"{cls.__name__}.{attr}", value))
+
+
+def disable():
+    """Restore the original methods. Recorded stats are kept until reset()."""
+    while _originals:
+        cls, attr, value = _originals.pop()
+        setattr(cls, attr, value)
+
+
+def is_enabled() -> bool:
+    """Return True while instrumentation is active."""
+    return bool(_originals)
+
+
+def reset():
+    """Discard all recorded stats."""
+    with _lock:
+        for stats in _stats.values():
+            stats.__init__()
+
+
+@contextmanager
+def profiled(targets: Iterable[type] = DEFAULT_TARGETS) -> Iterator[None]:
+    """Enable instrumentation for the duration of a with-block."""
+    was_enabled = is_enabled()
+    enable(targets)
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot() -> Dict[str, OperationStats]:
+    """Return a copy of the stats for every method called at least once."""
+    with _lock:
+        return {
+            name: OperationStats(s.calls, s.total_seconds, s.max_seconds, list(s.histogram),
+                                 s.tasks_touched)
+            for name, s in _stats.items() if s.calls
+        }
+
+
+def snapshot_rows(stats: Optional[Dict[str, OperationStats]] = None) -> List[dict]:
+    """Return a snapshot as table rows, slowest total time first."""
+    stats = snapshot() if stats is None else stats
+    rows = []
+    for name, s in sorted(stats.items(), key=lambda item: -item[1].total_seconds):
+        row = {
+            "method": name,
+            "calls": s.calls,
+            "total_ms": round(1000 * s.total_seconds, 3),
+            "mean_ms": round(s.mean_ms, 3),
+            "max_ms": round(1000 * s.max_seconds, 3),
+            "tasks_touched": s.tasks_touched,
+        }
+        row.update(zip(BUCKET_LABELS, s.histogram))
+        rows.append(row)
+    return rows
+
+
+def format_snapshot(stats: Optional[Dict[str, OperationStats]] = None) -> str:
+    """Return a snapshot as a plain-text table."""
+    rows = snapshot_rows(stats)
+    lines = [f"{'method':<40} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'tasks':>8}"]
+    for row in rows:
+        lines.append(
+            f"{row['method']:<40} {row['calls']:>7} {row['total_ms']:>10.3f} "
+            f"{row['mean_ms']:>9.3f} {row['max_ms']:>9.3f} {row['tasks_touched']:>8}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,154 @@
+"""Asyncio reminder dispatcher that fires when scheduled tasks come due.
+
+ReminderDispatcher keeps every pending task in a min-heap keyed by due
+time and sleeps until the earliest one, so it never polls. It subscribes
+to a Scheduler and reacts to tasks being added, removed, rescheduled or
+completed (including recurring rollover) while it runs. Changes made
+from other threads are handed to the event loop's thread.
+"""
+import asyncio
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pawpal_system import Scheduler, Task
+
+logger = logging.getLogger(__name__)
+
+ReminderCallback = Callable[[Task], Awaitable[None]]
+
+
+class ReminderDispatcher:
+    """Invokes an async callback for each task when its scheduled time arrives."""
+
+    def __init__(self, scheduler: Scheduler, callback: ReminderCallback,
+                 lead_time: timedelta = timedelta(0)):
+        """Set up the dispatcher; call run() to start it.
+
+        Args:
+            scheduler: Scheduler to watch. Its clock decides when tasks are due.
+            callback: Coroutine function awaited with each due task.
+            lead_time: How long before scheduled_time to send the reminder.
+        """
+        self.scheduler = scheduler
+        self.callback = callback
+        self.lead_time = lead_time
+        # Min-heap of (due_time, seq, task_id). Entries are invalidated lazily:
+        # one is live only while _live[task_id] still holds its seq.
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._live: Dict[str, int] = {}
+        self._seq = count()
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        self._stopped = False
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of reminders still waiting to fire."""
+        return len(self._live)
+
+    def _push(self, task: Task):
+        if task.is_completed:
+            self._drop(task)
+            return
+        seq = next(self._seq)
+        self._live[task.task_id] = seq
+        heapq.heappush(self._heap, (task.scheduled_time - self.lead_time, seq, task.task_id))
+
+    def _drop(self, task: Task):
+        self._live.pop(task.task_id, None)
+
+    def _compact(self):
+        """Rebuild the heap from live entries once stale ones make up most of it."""
+        if len(self._heap) > 2 * len(self._live) + 64:
+            live = self._live
+            self._heap = [entry for entry in self._heap if live.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
+
+    def _on_loop_thread(self) -> bool:
+        return self._loop is None or threading.get_ident() == self._loop_thread
+
+    def _on_change(self, event: str, task: Task):
+        """Scheduler listener: keep the heap in step with the schedule."""
+        if not self._on_loop_thread():
+            # The heap and the wake event belong to the loop's thread
+            self._loop.call_soon_threadsafe(self._on_change, event, task)
+            return
+        if event in ("add", "reschedule", "update"):
+            self._push(task)
+        else:
+            self._drop(task)
+        self._compact()
+        # Re-evaluate the sleep only if the earliest reminder may have changed
+        if self._wake is not None:
+            self._wake.set()
+
+    def _pop_due(self, now: datetime) -> List[str]:
+        """Pop the IDs of every live reminder due at or before `now`."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, task_id = heapq.heappop(self._heap)
+            if self._live.get(task_id) == seq:
+                del self._live[task_id]
+                due.append(task_id)
+        return due
+
+    def _next_due(self) -> Optional[datetime]:
+        """Return the earliest live due time, discarding stale heap entries."""
+        while self._heap and self._live.get(self._heap[0][2]) != self._heap[0][1]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    async def run(self):
+        """Load pending tasks, then fire reminders until stop() is called."""
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopped = False
+        for task in self.scheduler.sort_by_time():
+            if not task.is_completed:
+                self._push(task)
+        self._unsubscribe = self.scheduler.subscribe(self._on_change)
+        try:
+            while not self._stopped:
+                next_due = self._next_due()
+                now = self.scheduler.clock()
+                if next_due is None or next_due > now:
+                    timeout = None if next_due is None else (next_due - now).total_seconds()
+                    self._wake.clear()
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                for task_id in self._pop_due(now):
+                    task = self.scheduler.get_task(task_id)
+                    # Tasks completed directly on the Task never notify the scheduler
+                    if task is None or task.is_completed:
+                        continue
+                    try:
+                        await self.callback(task)
+                    except Exception:
+                        logger.exception("Reminder callback failed for task %s", task_id)
+        finally:
+            self._unsubscribe()
+            self._unsubscribe = None
+            self._loop = self._loop_thread = None
+
+    def stop(self):
+        """Ask run() to return after the current batch of reminders.
+
+        Safe to call from any thread.
+        """
+        self._stopped = True
+        if self._wake is None:
+            return
+        if self._on_loop_thread():
+            self._wake.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wake.set)
@@ -0,0 +1,319 @@
+"""Versioned binary snapshots of owners, pets and scheduled tasks.
+
+A snapshot is one file written in a single pass: a fixed header, a string
+table (every title, description, name, ... stored once as UTF-8), and
+fixed-width records for owners, pets and tasks. Task records are stored in
+time order, followed by an index sorted by task_id and each pet's task
+list (in the pet's own order).
+
+Snapshot opens a file with mmap and reads only the header, so opening is
+instant whatever the size. Tasks are built from their records on first
+access and then cached; get_task() and tasks_between() binary-search the
+records, so they touch O(log n + k) of them. load_owners() and
+to_scheduler() materialize everything for callers that need live objects.
+"""
+import mmap
+import os
+from array import array
+from datetime import datetime, date
+from struct import Struct
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from pawpal_system import Owner, Pet, Scheduler, Task
+from pawpal_sqlite import from_us, to_us
+
+MAGIC = b"PPSN"
+VERSION = 2
+
+# magic, version, reserved, task count, pet count, owner count, string count,
+# then the byte offsets of: string offsets, string data, owners, pets,
+# tasks, the task_id index and the per-pet task lists
+_HEADER = Struct("<4sHHQIII4xQQQQQQQ")
+# name, email, phone (string indexes)
+_OWNER = Struct("<III")
+# name, species, breed (string indexes), date_of_birth ordinal, owner index,
+# then where the pet's task list starts in the pet-tasks section and its length
+_PET = Struct("<IIIiiQI4x")
+# scheduled time (µs since 1970), task_id, title, description, category
+# (string indexes), duration, recurrence, pet index (-1 = none),
+# priority code, flags, series_id (string index, -1 = none)
+_TASK = Struct("<qIIIIiiiBB2xi")
+# Version 1 task records, which had no series_id
+_TASK_V1 = Struct("<qIIIIiiiBB2x")
+_TIME = Struct("<q")
+_TASK_ID = Struct("<8xI")
+
+PRIORITY_CODES = ("low", "medium", "high")
+_PRIORITY_CODE = {name: code for code, name in enumerate(PRIORITY_CODES)}
+_COMPLETED = 1
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_snapshot(path: str, owners: Iterable[Owner] = (),
+                   scheduler: Optional[Scheduler] = None) -> int:
+    """Write owners, their pets and tasks (and any other scheduled tasks) to a snapshot.
+
+    The file is written to a temporary name and renamed into place, so a
+    crash never leaves a half-written snapshot at `path`.
+
+    Args:
+        path: Destination file.
+        owners: Owners whose pets and tasks are saved.
+        scheduler: Optional Scheduler; its tasks are saved too, including
+            ones that belong to no pet.
+
+    Returns:
+        int: Number of tasks written.
+
+    Raises:
+        ValueError: If a task has a priority outside PRIORITY_CODES.
+    """
+    owners = list(owners)
+    strings: Dict[str, int] = {}
+
+    def string(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    owner_records = [_OWNER.pack(string(o.name), string(o.email), string(o.phone)) for o in owners]
+    pets = [(owner_number, pet) for owner_number, owner in enumerate(owners) for pet in owner.pets]
+    task_pet: Dict[str, int] = {}
+    for pet_number, (_, pet) in enumerate(pets):
+        for task in pet.tasks:
+            task_pet[task.task_id] = pet_number
+
+    if scheduler is not None:
+        tasks = scheduler.sort_by_time()
+        seen = {task.task_id for task in tasks}
+        tasks.extend(t for o in owners for t in o.iter_tasks() if t.task_id not in seen)
+        tasks.sort(key=lambda t: t.scheduled_time)
+    else:
+        tasks = sorted((t for o in owners for t in o.iter_tasks()), key=lambda t: t.scheduled_time)
+
+    task_records = []
+    for task in tasks:
+        code = _PRIORITY_CODE.get(task.priority)
+        if code is None:
+            raise ValueError(f"Cannot snapshot unknown priority '{task.priority}'")
+        task_records.append(_TASK.pack(
+            to_us(task.scheduled_time), string(task.task_id), string(task.title),
+            string(task.description), string(task.category), task.duration_minutes,
+            task.recurrence_days, task_pet.get(task.task_id, -1), code,
+            _COMPLETED if task.is_completed else 0,
+            -1 if task.series_id is None else string(task.series_id)
+        ))
+    id_index = array("I", sorted(range(len(tasks)), key=lambda i: tasks[i].task_id))
+
+    # Each pet's tasks as record numbers, in the pet's own order
+    position = {task.task_id: i for i, task in enumerate(tasks)}
+    pet_tasks = array("I")
+    pet_records = []
+    for owner_number, pet in pets:
+        pet_records.append(_PET.pack(
+            string(pet.name), string(pet.species), string(pet.breed),
+            pet.date_of_birth.toordinal(), owner_number, len(pet_tasks), len(pet.tasks)
+        ))
+        pet_tasks.extend(position[task.task_id] for task in pet.tasks)
+
+    blob = bytearray()
+    offsets = array("Q", [0])
+    for value in strings:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+
+    sections = [offsets.tobytes(), bytes(blob), b"".join(owner_records),
+                b"".join(pet_records), b"".join(task_records), id_index.tobytes(),
+                pet_tasks.tobytes()]
+    positions = []
+    position = _HEADER.size
+    for section in sections:
+        position = _align(position)
+        positions.append(position)
+        position += len(section)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(tasks), len(pet_records), len(owner_records),
+                             len(strings), *positions))
+        for section, start in zip(sections, positions):
+            f.write(b"\0" * (start - f.tell()))
+            f.write(section)
+    os.replace(tmp_path, path)
+    return len(tasks)
+
+
+class Snapshot:
+    """Read-only, lazily materialized view of a snapshot file.
+
+    Tasks returned by the same Snapshot are cached, so asking twice for a
+    task gives the same object. Use as a context manager or call close().
+    """
+
+    def __init__(self, path: str):
+        """Map a snapshot file and validate its header.
+
+        Raises:
+            ValueError: If the file is not a snapshot or has an unsupported version.
+        """
+        self._string_offsets = self._id_index = None
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: empty file is not a snapshot")
+        if len(self._mm) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: not a snapshot")
+        (magic, version, _, self._task_count, self._pet_count, self._owner_count, string_count,
+         strings_pos, self._blob_pos, self._owners_pos, self._pets_pos, self._tasks_pos,
+         id_index_pos, self._pet_tasks_pos) = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a snapshot")
+        if version not in (1, VERSION):
+            self.close()
+            raise ValueError(f"{path}: unsupported snapshot version {version}")
+        self.version = version
+        self._record = _TASK if version == VERSION else _TASK_V1
+        view = memoryview(self._mm)
+        self._string_offsets = view[strings_pos:strings_pos + 8 * (string_count + 1)].cast("Q")
+        self._id_index = view[id_index_pos:id_index_pos + 4 * self._task_count].cast("I")
+        view.release()
+        self._strings: Dict[int, str] = {}
+        self._tasks: Dict[int, Task] = {}
+        self._owners: Optional[List[Owner]] = None
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap the file. Tasks already materialized stay usable."""
+        for view in (self._string_offsets, self._id_index):
+            if view is not None:
+                view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        """Return the number of tasks in the snapshot."""
+        return self._task_count
+
+    def _string(self, index: int) -> str:
+        value = self._strings.get(index)
+        if value is None:
+            start, end = self._string_offsets[index], self._string_offsets[index + 1]
+            value = self._strings[index] = str(self._mm[self._blob_pos + start:self._blob_pos + end],
+                                               "utf-8")
+        return value
+
+    def _time_us(self, index: int) -> int:
+        return _TIME.unpack_from(self._mm, self._tasks_pos + index * self._record.size)[0]
+
+    def task(self, index: int) -> Task:
+        """Return the task at a position in time order, building it on first access."""
+        task = self._tasks.get(index)
+        if task is not None:
+            return task
+        if not 0 <= index < self._task_count:
+            raise IndexError(index)
+        record = self._record.unpack_from(self._mm, self._tasks_pos + index * self._record.size)
+        (scheduled_us, task_id, title, description, category, duration, recurrence,
+         _, priority, flags) = record[:10]
+        series = record[10] if len(record) > 10 else -1
+        task = self._tasks[index] = Task(
+            title=self._string(title),
+            description=self._string(description),
+            category=self._string(category),
+            scheduled_time=from_us(scheduled_us),
+            task_id=self._string(task_id),
+            is_completed=bool(flags & _COMPLETED),
+            recurrence_days=recurrence,
+            priority=PRIORITY_CODES[priority],
+            duration_minutes=duration,
+            series_id=None if series < 0 else self._string(series)
+        )
+        return task
+
+    def __iter__(self) -> Iterator[Task]:
+        """Yield every task in time order."""
+        return (self.task(i) for i in range(self._task_count))
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return a task by ID with a binary search of the ID index, or None."""
+        lo, hi = 0, self._task_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            index = self._id_index[mid]
+            record_id = _TASK_ID.unpack_from(self._mm, self._tasks_pos + index * self._record.size)[0]
+            if self._string(record_id) < task_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._task_count:
+            index = self._id_index[lo]
+            task = self.task(index)
+            if task.task_id == task_id:
+                return task
+        return None
+
+    def _bisect_time(self, when_us: int) -> int:
+        lo, hi = 0, self._task_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._time_us(mid) < when_us:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def tasks_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return tasks scheduled in [start, end), in time order, building only those."""
+        lo, hi = self._bisect_time(to_us(start)), self._bisect_time(to_us(end))
+        return [self.task(i) for i in range(lo, hi)]
+
+    def load_owners(self) -> List[Owner]:
+        """Build every owner and pet and attach their tasks (cached after the first call)."""
+        if self._owners is not None:
+            return self._owners
+        owners = [
+            Owner(name=self._string(n), email=self._string(e), phone=self._string(p))
+            for n, e, p in _OWNER.iter_unpack(
+                self._mm[self._owners_pos:self._owners_pos + self._owner_count * _OWNER.size])
+        ]
+        for name, species, breed, born, owner, first, count in _PET.iter_unpack(
+                self._mm[self._pets_pos:self._pets_pos + self._pet_count * _PET.size]):
+            pet = Pet(name=self._string(name), species=self._string(species),
+                      breed=self._string(breed), date_of_birth=date.fromordinal(born))
+            start = self._pet_tasks_pos + 4 * first
+            for index in array("I", self._mm[start:start + 4 * count]):
+                pet.add_task(self.task(index))
+            owners[owner].add_pet(pet)
+        self._owners = owners
+        return owners
+
+    def to_scheduler(self, clock: Callable[[], datetime] = datetime.now) -> Scheduler:
+        """Build a live Scheduler holding every task, with the owners registered.
+
+        The records are already in time order, so the tasks go in as one
+        bulk add: the indexes are appended in order and conflicts are found
+        in a single sweep. This still materializes the whole snapshot. To
+        read only part of it, query the Snapshot directly instead:
+        get_task(task_id) and tasks_between(start, end) binary-search the
+        records, task(index) and iteration walk them in time order, and
+        len() counts them, building only the tasks they return.
+        """
+        owners = self.load_owners()
+        scheduler = Scheduler(clock=clock)
+        scheduler.add_tasks(self)
+        for owner in owners:
+            scheduler.register_owner(owner)
+        return scheduler
@@ -0,0 +1,567 @@
+"""SQLite persistence for owners, pets and tasks.
+
+SQLiteStore saves and loads Owner/Pet/Task graphs in a single database file,
+and SQLiteScheduler answers the Scheduler queries directly in SQL so large
+schedules never have to be rebuilt in memory. Tasks returned by
+SQLiteScheduler are detached snapshots of their rows: change them through
+the scheduler's methods, not by mutating the returned objects.
+
+Owners are keyed by a surrogate row ID, not by name, so two owners that
+share a name are stored separately.
+"""
+import sqlite3
+from datetime import datetime, date, time, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pawpal_system import (
+    EDITABLE_FIELDS, PRIORITY_RANK, Conflict, Owner, Pet, Scheduler, Task, _coerce_fields
+)
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_MINUTE_US = 60_000_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS owners (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS owners_by_name ON owners (name);
+CREATE TABLE IF NOT EXISTS pets (
+    id INTEGER PRIMARY KEY,
+    owner_id INTEGER NOT NULL REFERENCES owners(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    species TEXT NOT NULL,
+    breed TEXT NOT NULL,
+    date_of_birth TEXT NOT NULL,
+    UNIQUE (owner_id, name)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    pet_id INTEGER REFERENCES pets(id) ON DELETE SET NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    scheduled_us INTEGER NOT NULL,
+    duration_minutes INTEGER NOT NULL DEFAULT 0,
+    recurrence_days INTEGER NOT NULL DEFAULT 0,
+    priority TEXT NOT NULL DEFAULT 'medium',
+    is_completed INTEGER NOT NULL DEFAULT 0,
+    series_id TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_by_pet_time ON tasks (pet_id, scheduled_us);
+CREATE INDEX IF NOT EXISTS tasks_by_time ON tasks (scheduled_us);
+CREATE INDEX IF NOT EXISTS tasks_by_completion ON tasks (is_completed, scheduled_us);
+"""
+
+_TASK_COLUMNS = (
+    "task_id, title, description, category, scheduled_us, duration_minutes, "
+    "recurrence_days, priority, is_completed, series_id"
+)
+_OWNER_COLUMNS = "id INTEGER PRIMARY KEY, name TEXT NOT NULL, email TEXT NOT NULL, phone TEXT NOT NULL"
+_TASK_WIDTH = len(_TASK_COLUMNS.split(", "))
+# Orders rows the way Scheduler orders tasks: by time, then insertion order
+_TIME_ORDER = "scheduled_us, rowid"
+_RANK_SQL = "CASE priority " + " ".join(
+    f"WHEN '{name}' THEN {rank}" for name, rank in PRIORITY_RANK.items()
+) + " ELSE 0 END"
+
+
+def to_us(value: datetime) -> int:
+    """Convert a naive datetime to integer microseconds since 1970-01-01."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_us(value: int) -> datetime:
+    """Convert integer microseconds since 1970-01-01 back to a datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+_INSERT_TASK = (
+    f"INSERT INTO tasks (pet_id, {_TASK_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _task_row(task: Task, pet_id: Optional[int]) -> tuple:
+    """Return the parameters for _INSERT_TASK."""
+    return (
+        pet_id, task.task_id, task.title, task.description, task.category,
+        to_us(task.scheduled_time), task.duration_minutes, task.recurrence_days,
+        task.priority, int(task.is_completed), task.series_id
+    )
+
+
+def _row_task(row, offset: int = 0) -> Task:
+    """Build a Task from _TASK_COLUMNS starting at `offset` in a result row."""
+    (task_id, title, description, category, scheduled_us, duration,
+     recurrence, priority, completed, series_id) = row[offset:offset + _TASK_WIDTH]
+    return Task(
+        title=title,
+        description=description,
+        category=category,
+        scheduled_time=from_us(scheduled_us),
+        task_id=task_id,
+        is_completed=bool(completed),
+        recurrence_days=recurrence,
+        priority=priority,
+        duration_minutes=duration,
+        series_id=series_id
+    )
+
+
+class SQLiteStore:
+    """Owns the SQLite connection and the owner/pet tables."""
+
+    def __init__(self, path: str = ":memory:"):
+        """Open (or create) the database at `path`.
+
+        File databases use WAL journaling so several worker processes can read
+        while one writes.
+        """
+        self.conn = sqlite3.connect(path)
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        self._drop_unique_owner_names()
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        # id(Owner) -> (Owner, row ID); the Owner is kept so its id() is not reused
+        self._owner_ids: Dict[int, Tuple[Owner, int]] = {}
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(tasks)")}
+        if "series_id" not in columns:
+            # Databases created before tasks recorded their series
+            with self.conn:
+                self.conn.execute("ALTER TABLE tasks ADD COLUMN series_id TEXT")
+
+    def _drop_unique_owner_names(self):
+        """Rebuild an owners table created when owner names had to be unique.
+
+        Runs before foreign keys are switched on, so dropping the old table
+        does not cascade to the owners' pets.
+        """
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'owners'"
+        ).fetchone()
+        if row is None or "UNIQUE" not in row[0]:
+            return
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE owners_new ({_OWNER_COLUMNS})")
+            self.conn.execute("INSERT INTO owners_new SELECT id, name, email, phone FROM owners")
+            self.conn.execute("DROP TABLE owners")
+            self.conn.execute("ALTER TABLE owners_new RENAME TO owners")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def save_owner(self, owner: Owner) -> int:
+        """Store an owner with all of their pets and tasks, replacing what was saved before.
+
+        An Owner saved or loaded through this store before keeps its row;
+        any other Owner gets a new row, even if an owner with the same name
+        is stored. Pets and tasks of this owner that are no longer in memory
+        (e.g. after Pet.remove_task or Owner.remove_pet) are deleted, so the
+        stored owner mirrors the Owner object. Everything is written in one
+        transaction with batched statements.
+
+        Returns:
+            int: The owner's row ID.
+        """
+        with self.conn:
+            owner_id = self.owner_id(owner)
+            if owner_id is None:
+                owner_id = self.conn.execute(
+                    "INSERT INTO owners (name, email, phone) VALUES (?, ?, ?)",
+                    (owner.name, owner.email, owner.phone)
+                ).lastrowid
+                self._owner_ids[id(owner)] = (owner, owner_id)
+            else:
+                self.conn.execute(
+                    "UPDATE owners SET name = ?, email = ?, phone = ? WHERE id = ?",
+                    (owner.name, owner.email, owner.phone, owner_id)
+                )
+            self.conn.executemany(
+                "INSERT INTO pets (owner_id, name, species, breed, date_of_birth) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (owner_id, name) DO UPDATE SET "
+                "species = excluded.species, breed = excluded.breed, "
+                "date_of_birth = excluded.date_of_birth",
+                [
+                    (owner_id, pet.name, pet.species, pet.breed, pet.date_of_birth.isoformat())
+                    for pet in owner.pets
+                ]
+            )
+            for pet in owner.pets:
+                self._upsert_tasks(pet.tasks, self.pet_id(owner_id, pet.name))
+            self._delete_missing(owner_id, owner)
+        return owner_id
+
+    def _delete_missing(self, owner_id: int, owner: Owner):
+        """Delete an owner's stored pets and tasks that the Owner object no longer has."""
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id TEXT PRIMARY KEY)")
+        self.conn.execute("DELETE FROM keep_ids")
+        self.conn.executemany("INSERT OR IGNORE INTO keep_ids VALUES (?)",
+                              ((task.task_id,) for task in owner.iter_tasks()))
+        self.conn.execute(
+            "DELETE FROM tasks WHERE pet_id IN (SELECT id FROM pets WHERE owner_id = ?) "
+            "AND task_id NOT IN (SELECT id FROM keep_ids)",
+            (owner_id,)
+        )
+        self.conn.execute("DELETE FROM keep_ids")
+        self.conn.executemany("INSERT INTO keep_ids VALUES (?)", ((pet.name,) for pet in owner.pets))
+        self.conn.execute(
+            "DELETE FROM pets WHERE owner_id = ? AND name NOT IN (SELECT id FROM keep_ids)",
+            (owner_id,)
+        )
+        self.conn.execute("DELETE FROM keep_ids")
+
+    def _upsert_tasks(self, tasks: Iterable[Task], pet_id: Optional[int]):
+        # ON CONFLICT ... DO UPDATE keeps the rowid, and with it insertion order
+        self.conn.executemany(
+            f"{_INSERT_TASK} ON CONFLICT (task_id) DO UPDATE SET pet_id = excluded.pet_id, "
+            "title = excluded.title, description = excluded.description, "
+            "category = excluded.category, scheduled_us = excluded.scheduled_us, "
+            "duration_minutes = excluded.duration_minutes, "
+            "recurrence_days = excluded.recurrence_days, priority = excluded.priority, "
+            "is_completed = excluded.is_completed, series_id = excluded.series_id",
+            (_task_row(t, pet_id) for t in tasks)
+        )
+
+    def owner_id(self, owner: Union[Owner, str, int]) -> Optional[int]:
+        """Return the row ID of an owner, or None if not stored.
+
+        Args:
+            owner: An Owner saved or loaded through this store, an owner's
+                name, or a row ID (returned as is).
+
+        Raises:
+            ValueError: If a name is shared by more than one stored owner.
+        """
+        if isinstance(owner, Owner):
+            entry = self._owner_ids.get(id(owner))
+            return entry[1] if entry else None
+        if isinstance(owner, int):
+            return owner
+        rows = self.conn.execute("SELECT id FROM owners WHERE name = ? LIMIT 2", (owner,)).fetchall()
+        if len(rows) > 1:
+            raise ValueError(f"More than one owner is named '{owner}'; use the owner's row ID")
+        return rows[0][0] if rows else None
+
+    def pet_id(self, owner: Union[Owner, str, int], pet_name: str) -> Optional[int]:
+        """Return the row ID of one of an owner's pets, or None if not stored.
+
+        `owner` is resolved as in owner_id().
+        """
+        owner_id = self.owner_id(owner)
+        if owner_id is None:
+            return None
+        row = self.conn.execute(
+            "SELECT id FROM pets WHERE owner_id = ? AND name = ?", (owner_id, pet_name)
+        ).fetchone()
+        return row[0] if row else None
+
+    def load_owner(self, owner: Union[str, int], include_tasks: bool = True) -> Optional[Owner]:
+        """Load an owner and their pets, optionally with every pet's tasks.
+
+        Saving the returned Owner updates the row it was loaded from. Pass
+        include_tasks=False to get just the owner/pet records and query tasks
+        through a SQLiteScheduler instead.
+
+        Args:
+            owner: The owner's row ID, or a name shared by no other owner.
+            include_tasks: Whether to load every pet's tasks.
+        """
+        owner_id = self.owner_id(owner)
+        row = self.conn.execute(
+            "SELECT name, email, phone FROM owners WHERE id = ?", (owner_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        loaded = Owner(name=row[0], email=row[1], phone=row[2])
+        for pet_id, pet_name, species, breed, dob in self.conn.execute(
+            "SELECT id, name, species, breed, date_of_birth FROM pets WHERE owner_id = ? ORDER BY id",
+            (owner_id,)
+        ):
+            pet = Pet(name=pet_name, species=species, breed=breed,
+                      date_of_birth=date.fromisoformat(dob))
+            if include_tasks:
+                for task_row in self.conn.execute(
+                    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE pet_id = ? ORDER BY rowid", (pet_id,)
+                ):
+                    pet.add_task(_row_task(task_row))
+            loaded.add_pet(pet)
+        self._owner_ids[id(loaded)] = (loaded, owner_id)
+        return loaded
+
+
+class SQLiteScheduler:
+    """Scheduler whose tasks live in a SQLiteStore.
+
+    Implements the task, query, conflict and completion parts of the
+    Scheduler API with indexed SQL, so only the rows a query returns are
+    ever turned into Task objects. Occurrence projection, forks, change
+    subscriptions and the owner summary are not supported; use an
+    in-memory Scheduler for those.
+    """
+
+    def __init__(self, store: SQLiteStore, owner: Union[Owner, str, int, None] = None,
+                 clock=datetime.now):
+        """Attach to a store.
+
+        Args:
+            store: The SQLiteStore holding the tasks.
+            owner: Owner used to resolve Pet arguments to stored pets, given
+                as anything SQLiteStore.owner_id() accepts.
+            clock: Returns the current time, as for Scheduler.
+        """
+        self.store = store
+        self.conn = store.conn
+        self.owner_id = store.owner_id(owner) if owner is not None else None
+        self.clock = clock
+
+    def _pet_id(self, pet: Optional[Pet]) -> Optional[int]:
+        if pet is None:
+            return None
+        pet_id = self.store.pet_id(self.owner_id, pet.name) if self.owner_id is not None else None
+        if pet_id is None:
+            raise ValueError(f"Pet '{pet.name}' is not stored for this scheduler's owner")
+        return pet_id
+
+    def _select(self, where: str = "", params: tuple = (), order: str = _TIME_ORDER,
+                limit: Optional[int] = None) -> List[Task]:
+        sql = f"SELECT {_TASK_COLUMNS} FROM tasks"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [_row_task(row) for row in self.conn.execute(sql, params)]
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    @property
+    def all_tasks(self) -> List[Task]:
+        """Return all tasks in the order they were added."""
+        return self._select(order="rowid")
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """Stream every task in time order without loading them all at once."""
+        for row in self.conn.execute(f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY {_TIME_ORDER}"):
+            yield _row_task(row)
+
+    def add_task(self, task: Task, pet: Optional[Pet] = None):
+        """Store a task, optionally attached to one of the owner's pets.
+
+        Raises:
+            ValueError: If a task with the same task_id is already stored.
+        """
+        self.add_tasks([task], pet)
+
+    def add_tasks(self, tasks: Iterable[Task], pet: Optional[Pet] = None):
+        """Store many tasks in a single transaction.
+
+        Raises:
+            ValueError: If any task_id is already stored; nothing is written.
+        """
+        pet_id = self._pet_id(pet)
+        try:
+            with self.conn:
+                self.conn.executemany(_INSERT_TASK, (_task_row(t, pet_id) for t in tasks))
+        except sqlite3.IntegrityError as exc:
+            raise ValueError(f"Duplicate task_id: {exc}") from exc
+
+    def remove_task(self, task_id: str):
+        """Remove a task by task ID."""
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return the task with the given ID, or None if it is not stored."""
+        row = self.conn.execute(
+            f"SELECT {_TASK_COLUMNS} FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        return _row_task(row) if row else None
+
+    def reschedule_task(self, task_id: str, new_time: datetime) -> Optional[Task]:
+        """Move a stored task to a new time."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE tasks SET scheduled_us = ? WHERE task_id = ?", (to_us(new_time), task_id)
+            )
+        return self.get_task(task_id)
+
+    def update_task(self, task_id: str, **changes) -> Optional[Task]:
+        """Edit fields of a stored task.
+
+        Args:
+            task_id: The ID of the task to edit.
+            **changes: New values for any of EDITABLE_FIELDS.
+
+        Returns:
+            Optional[Task]: The updated task, or None if the ID is unknown.
+
+        Raises:
+            ValueError: If a field cannot be edited this way.
+        """
+        unknown = set(changes) - EDITABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update field(s): {', '.join(sorted(unknown))}")
+        columns = _coerce_fields(changes)
+        if "scheduled_time" in columns:
+            columns["scheduled_us"] = to_us(columns.pop("scheduled_time"))
+        if columns:
+            assignments = ", ".join(f"{name} = ?" for name in columns)
+            with self.conn:
+                self.conn.execute(
+                    f"UPDATE tasks SET {assignments} WHERE task_id = ?",
+                    tuple(columns.values()) + (task_id,)
+                )
+        return self.get_task(task_id)
+
+    def sort_by_time(self) -> List[Task]:
+        """Return tasks sorted by scheduled time."""
+        return self._select()
+
+    def tasks_between(self, start: datetime, end: datetime,
+                      pet: Optional[Pet] = None) -> List[Task]:
+        """Return tasks scheduled in the half-open range [start, end), in time order.
+
+        Args:
+            start: Start of the range.
+            end: End of the range (excluded).
+            pet: Optional Pet to restrict the list to its tasks.
+        """
+        where, params = "scheduled_us >= ? AND scheduled_us < ?", (to_us(start), to_us(end))
+        if pet is not None:
+            where, params = f"pet_id = ? AND {where}", (self._pet_id(pet),) + params
+        return self._select(where, params)
+
+    def sort_by_priority(self) -> List[Task]:
+        """Sort tasks by priority (high > medium > low)."""
+        return self._select(order=f"{_RANK_SQL} DESC, rowid")
+
+    def get_tasks_by_priority(self, now: Optional[datetime] = None) -> List[Task]:
+        """Return tasks ordered by (overdue first, priority, scheduled time)."""
+        if now is None:
+            now = self.clock()
+        return self._select(
+            order=f"(is_completed = 0 AND scheduled_us < {to_us(now)}) DESC, "
+                  f"{_RANK_SQL} DESC, {_TIME_ORDER}"
+        )
+
+    def peek_next(self, k: int = 1, now: Optional[datetime] = None) -> List[Task]:
+        """Return the next k pending tasks in get_tasks_by_priority() order."""
+        if now is None:
+            now = self.clock()
+        return self._select(
+            "is_completed = 0",
+            order=f"scheduled_us < {to_us(now)} DESC, {_RANK_SQL} DESC, {_TIME_ORDER}",
+            limit=k
+        )
+
+    def pop_next(self, now: Optional[datetime] = None, pet: Optional[Pet] = None) -> Optional[Task]:
+        """Complete the most urgent pending task and return it.
+
+        Recurring tasks roll over through complete_task_and_reschedule().
+
+        Args:
+            now: Reference time for overdue checks; defaults to the clock.
+            pet: Optional Pet to receive the next occurrence of a recurring task.
+
+        Returns:
+            Optional[Task]: The task that was completed, or None if nothing is pending.
+        """
+        upcoming = self.peek_next(1, now)
+        if not upcoming:
+            return None
+        self.complete_task_and_reschedule(upcoming[0].task_id, pet)
+        return self.get_task(upcoming[0].task_id)
+
+    def get_day_tasks(self, day: date, pet: Optional[Pet] = None) -> List[Task]:
+        """Return the tasks scheduled on a given day, in time order.
+
+        Args:
+            day: The calendar day to list.
+            pet: Optional Pet to restrict the list to its tasks.
+        """
+        start = datetime.combine(day, time.min)
+        return self.tasks_between(start, start + timedelta(days=1), pet)
+
+    get_today_tasks = Scheduler.get_today_tasks
+    get_week = Scheduler.get_week
+
+    def get_upcoming_tasks(self, days: int, pet: Optional[Pet] = None) -> List[Task]:
+        """Get all tasks scheduled from today through the next N days.
+
+        Args:
+            days: Number of days after today to include (the range covers the
+                whole of the last day).
+            pet: Optional Pet to restrict the list to its tasks.
+        """
+        start = datetime.combine(self.clock().date(), time.min)
+        return self.tasks_between(start, start + timedelta(days=days + 1), pet)
+
+    def detect_conflicts(self, scope: Union[Pet, Owner, None] = None) -> List[Conflict]:
+        """Detect tasks whose scheduled intervals overlap, as a self-join in SQL.
+
+        For each task `a`, the partners `b` are found with a range scan on the
+        time index: later rows starting before `a` ends (or at the same instant
+        when `a` has no duration).
+        """
+        where, params = "", ()
+        if isinstance(scope, Owner):
+            owner_id = self.store.owner_id(scope)
+            pets = "(SELECT id FROM pets WHERE owner_id = ?)"
+            where, params = f"AND a.pet_id IN {pets} AND b.pet_id IN {pets}", (owner_id, owner_id)
+        elif scope is not None:
+            pet_id = self._pet_id(scope)
+            where, params = "AND a.pet_id = ? AND b.pet_id = ?", (pet_id, pet_id)
+
+        # Bounding a's start from both sides keeps each probe a short range scan
+        max_span = self.conn.execute(
+            f"SELECT COALESCE(MAX(duration_minutes), 0) * {_MINUTE_US} FROM tasks"
+        ).fetchone()[0]
+        columns = ", ".join(
+            f"{alias}.{column}" for alias in ("a", "b") for column in _TASK_COLUMNS.split(", ")
+        )
+        rows = self.conn.execute(
+            f"SELECT {columns} FROM tasks AS a JOIN tasks AS b "
+            f"ON b.scheduled_us >= a.scheduled_us AND a.scheduled_us >= b.scheduled_us - ? "
+            f"AND b.scheduled_us < a.scheduled_us + MAX(a.duration_minutes * {_MINUTE_US}, 1) "
+            f"AND (b.scheduled_us > a.scheduled_us OR b.rowid > a.rowid) "
+            f"WHERE 1 = 1 {where} "
+            f"ORDER BY b.scheduled_us, b.rowid, a.scheduled_us, a.rowid",
+            (max_span,) + params
+        )
+        return [Conflict(_row_task(row), _row_task(row, _TASK_WIDTH)) for row in rows]
+
+    def schedule_recurring_task(self, task: Task, recurrence_days: int):
+        """Schedule a recurring task with a specified interval."""
+        task.recurrence_days = recurrence_days
+        self.add_task(task)
+
+    def complete_task_and_reschedule(self, task_id: str, pet: Optional[Pet] = None) -> Optional[Task]:
+        """Mark a task complete and store its next occurrence if recurring.
+
+        The next occurrence is attached to the same stored pet as the original;
+        `pet`, if given, also receives it in memory.
+
+        Returns:
+            Optional[Task]: The new recurring task if created, None otherwise.
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        new_task = task.mark_complete()
+        with self.conn:
+            self.conn.execute("UPDATE tasks SET is_completed = 1 WHERE task_id = ?", (task_id,))
+            if new_task:
+                pet_id = self.conn.execute(
+                    "SELECT pet_id FROM tasks WHERE task_id = ?", (task_id,)
+                ).fetchone()[0]
+                self.conn.execute(_INSERT_TASK, _task_row(new_task, pet_id))
+        if new_task and pet:
+            pet.add_task(new_task)
+        return new_task
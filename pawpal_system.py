@@ -1,20 +1,94 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
-from datetime import datetime, date, timedelta
-from uuid import uuid4
+import sys
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from heapq import heappop, heappush, merge
+from itertools import chain, count, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from datetime import datetime, date, time, timedelta
+from weakref import WeakSet
+from pawpal_ids import new_task_id
 
 
-@dataclass
+class Priority(str, Enum):
+    """Task priority level with a precomputed sort rank.
+
+    Members are str subclasses that compare, hash and format exactly like
+    their values, so Priority.HIGH == "high" and existing code, files and
+    databases that use the plain strings keep working.
+    """
+    LOW = ("low", 1)
+    MEDIUM = ("medium", 2)
+    HIGH = ("high", 3)
+
+    def __new__(cls, value: str, rank: int):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.rank = rank
+        return member
+
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+# Sort rank for each priority level, keyed by the plain strings.
+PRIORITY_RANK = {p.value: p.rank for p in Priority}
+# Task fields that Scheduler.update_task may change
+EDITABLE_FIELDS = {
+    "title", "description", "category", "scheduled_time",
+    "recurrence_days", "priority", "duration_minutes", "series_id",
+}
+
+
+def _coerce_fields(changes: dict) -> dict:
+    """Convert priority and category values the way Task.__post_init__ does."""
+    if "priority" in changes:
+        changes["priority"] = Priority(changes["priority"])
+    if "category" in changes:
+        changes["category"] = sys.intern(changes["category"])
+    return changes
+
+
+@dataclass(slots=True)
 class Task:
-    """Represents a pet care task (feeding, walk, medication, appointment)."""
+    """Represents a pet care task (feeding, walk, medication, appointment).
+
+    Tasks are slotted to keep them small. priority accepts the plain
+    strings "low", "medium" and "high" and stores the Priority member;
+    category strings are interned so repeated categories share one object.
+    Change them on a scheduled task through Scheduler.update_task.
+    """
     title: str
     description: str
     category: str  # e.g., "feeding", "walk", "medication", "appointment"
     scheduled_time: datetime
-    task_id: str = field(default_factory=lambda: str(uuid4())[:8])
+    task_id: str = field(default_factory=new_task_id)
     is_completed: bool = False
     recurrence_days: int = 0  # 0 = no recurrence, >0 = recurring every N days
-    priority: str = "medium"  # "low", "medium", "high"
+    priority: Priority = Priority.MEDIUM  # "low", "medium", "high"
+    duration_minutes: int = 0  # 0 = instantaneous (only exact start-time clashes)
+    # task_id of the first task of the recurring series this task continues;
+    # None for one-off tasks and for the first task itself (see series_key)
+    series_id: Optional[str] = None
+
+    def __post_init__(self):
+        """Normalize priority to a Priority member and intern the category.
+
+        Raises:
+            ValueError: If priority is not one of "low", "medium" or "high".
+        """
+        self.priority = Priority(self.priority)
+        self.category = sys.intern(self.category)
+
+    @property
+    def series_key(self) -> str:
+        """Return the ID shared by every task of this task's recurring series."""
+        return self.series_id or self.task_id
+
+    @property
+    def end_time(self) -> datetime:
+        """Return the time at which this task finishes."""
+        return self.scheduled_time + timedelta(minutes=self.duration_minutes)
 
     def mark_complete(self) -> Optional['Task']:
         """Mark this task as completed.
@@ -37,7 +111,9 @@ class Task:
                     category=self.category,
                     scheduled_time=next_time,
                     recurrence_days=self.recurrence_days,
-                    priority=self.priority
+                    priority=self.priority,
+                    duration_minutes=self.duration_minutes,
+                    series_id=self.series_key
                 )
                 return new_task
 
@@ -47,9 +123,15 @@ class Task:
         """Mark this task as incomplete."""
         self.is_completed = False
 
-    def is_overdue(self) -> bool:
-        """Check if the task is overdue."""
-        return not self.is_completed and self.scheduled_time < datetime.now()
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """Check if the task is overdue.
+
+        Args:
+            now: Reference time; defaults to the current time.
+        """
+        if now is None:
+            now = datetime.now()
+        return not self.is_completed and self.scheduled_time < now
 
     def get_next_occurrence(self) -> Optional[datetime]:
         """Get the next occurrence if task is recurring."""
@@ -57,23 +139,204 @@ class Task:
             return None
         return self.scheduled_time + timedelta(days=self.recurrence_days)
 
+    def next_occurrence_after(self, now: datetime) -> Optional[datetime]:
+        """Return the first occurrence strictly after `now`, computed in O(1).
+
+        Always at least one interval after scheduled_time, so for a task
+        that is not overdue this equals get_next_occurrence(). Returns None
+        for non-recurring tasks.
+        """
+        if self.recurrence_days == 0:
+            return None
+        interval = timedelta(days=self.recurrence_days)
+        k = max(1, (now - self.scheduled_time) // interval + 1)
+        return self.scheduled_time + k * interval
+
+    def iter_future_occurrences(self, start: datetime, end: datetime) -> Iterator[datetime]:
+        """Lazily yield later occurrence times of a recurring task in [start, end).
+
+        The task's own scheduled_time is not included. The first occurrence is
+        found arithmetically, so windows far in the future cost nothing extra.
+        """
+        if self.recurrence_days == 0:
+            return
+        interval = timedelta(days=self.recurrence_days)
+        # Smallest k >= 1 with scheduled_time + k * interval >= start
+        k = max(1, -((self.scheduled_time - start) // interval))
+        occurrence = self.scheduled_time + k * interval
+        while occurrence < end:
+            yield occurrence
+            occurrence += interval
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """A task instance at a point in time, either concrete or projected.
+
+    Virtual occurrences (is_virtual=True) are future repeats of the recurring
+    `task`; they only become real Tasks through Scheduler.materialize().
+    """
+    task: Task
+    scheduled_time: datetime
+    is_virtual: bool = False
+
+    @property
+    def title(self) -> str:
+        """Return the title of the underlying task."""
+        return self.task.title
+
+    @property
+    def end_time(self) -> datetime:
+        """Return the time at which this occurrence finishes."""
+        return self.scheduled_time + timedelta(minutes=self.task.duration_minutes)
+
+
+@dataclass(frozen=True)
+class Conflict:
+    """A pair of tasks whose scheduled intervals overlap.
+
+    `first` always starts no later than `second`.
+    """
+    first: Task
+    second: Task
+
+    @property
+    def overlap_start(self) -> datetime:
+        """Return the start of the overlapping interval."""
+        return self.second.scheduled_time
+
+    @property
+    def overlap_end(self) -> datetime:
+        """Return the end of the overlapping interval."""
+        return min(self.first.end_time, self.second.end_time)
+
+    @property
+    def message(self) -> str:
+        """Return a human-readable warning for this conflict."""
+        when = self.overlap_start.strftime("%Y-%m-%d %H:%M")
+        return f"⚠️  Conflict detected at {when} between '{self.first.title}' and '{self.second.title}'"
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def find_conflicts(tasks: Iterable[Task]) -> List[Conflict]:
+    """Find all pairs of overlapping tasks with a sort-and-sweep pass.
+
+    Tasks are treated as half-open intervals [scheduled_time, end_time).
+    Tasks that start at the same instant always conflict, so zero-duration
+    tasks still clash with anything starting at exactly the same time.
+
+    Args:
+        tasks: Tasks ordered by scheduled_time.
+
+    Returns:
+        List[Conflict]: One record per overlapping pair, ordered by start time.
+        Runs in O(n log n + c) for c conflicts.
+    """
+    conflicts = []
+    # Min-heap of (end_time, start_time, seq, task) for tasks still "open"
+    active: List[Tuple[datetime, datetime, int, Task]] = []
+
+    for seq, task in enumerate(tasks):
+        start = task.scheduled_time
+        # Drop tasks that ended by `start`, but keep ones starting at `start`
+        while active and (active[0][0] < start or (active[0][0] == start and active[0][1] < start)):
+            heappop(active)
+        for entry in active:
+            conflicts.append(Conflict(entry[3], task))
+        heappush(active, (task.end_time, start, seq, task))
+
+    return conflicts
+
+
+@dataclass
+class SkippedOccurrences:
+    """A run of occurrences of a recurring task that a catch-up passed over.
+
+    Stored as first time, interval and count instead of one entry per
+    occurrence; times() expands it lazily.
+    """
+    task_id: str
+    first: datetime
+    interval_days: int
+    count: int
+
+    def times(self) -> Iterator[datetime]:
+        """Lazily yield each skipped occurrence time."""
+        interval = timedelta(days=self.interval_days)
+        return (self.first + i * interval for i in range(self.count))
+
+
+@dataclass
+class CompletionBatch:
+    """Outcome of Scheduler.complete_many()."""
+    completed: List[Task]
+    # Next occurrences created for the recurring tasks among `completed`
+    created: List[Task]
+    skipped_count: int = 0
+    # Only filled in when complete_many() is called with log_skipped=True
+    skipped: List[SkippedOccurrences] = field(default_factory=list)
+
 
 @dataclass
+class ScheduleSummary:
+    """Dashboard aggregates computed together by Scheduler.summarize()."""
+    overdue_high_priority: List[Task]
+    # pet name (None for tasks not on any of the owner's pets) -> day -> task count
+    daily_counts: Dict[Optional[str], Dict[date, int]]
+    # category -> fraction of its tasks that are completed
+    completion_rate: Dict[str, float]
+
+
+@dataclass(slots=True)
 class Pet:
-    """Represents a pet owned by an owner."""
+    """Represents a pet owned by an owner.
+
+    Tasks are kept in the `tasks` list (in the order added) and indexed by
+    task_id. Add and remove them through add_task/remove_task so the index
+    and the owner's task -> pet registry stay in sync.
+    """
     name: str
     species: str  # e.g., "dog", "cat", "rabbit"
     breed: str
     date_of_birth: date
     tasks: List[Task] = field(default_factory=list)
+    _tasks_by_id: Dict[str, Task] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Owner this pet belongs to, set by Owner.add_pet
+    _owner: Optional['Owner'] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._tasks_by_id = {t.task_id: t for t in self.tasks}
 
     def add_task(self, task: Task):
-        """Add a task for this pet."""
+        """Add a task for this pet.
+
+        Raises:
+            ValueError: If a different task with the same task_id is already on this pet.
+        """
+        existing = self._tasks_by_id.get(task.task_id)
+        if existing is task:
+            return
+        if existing is not None:
+            raise ValueError(f"Duplicate task_id '{task.task_id}' on pet '{self.name}'")
         self.tasks.append(task)
+        self._tasks_by_id[task.task_id] = task
+        if self._owner is not None:
+            self._owner._track(task.task_id, self)
 
     def remove_task(self, task_id: str):
         """Remove a task by task ID."""
-        self.tasks = [t for t in self.tasks if t.task_id != task_id]
+        task = self._tasks_by_id.pop(task_id, None)
+        if task is None:
+            return
+        self.tasks.remove(task)
+        if self._owner is not None:
+            self._owner._untrack(task_id, self)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return this pet's task with the given ID, or None."""
+        return self._tasks_by_id.get(task_id)
 
     def get_tasks(self) -> List[Task]:
         """Return all tasks for this pet."""
@@ -88,111 +351,813 @@ class Pet:
         return age
 
 
-@dataclass
+@dataclass(slots=True)
 class Owner:
-    """Represents a pet owner."""
+    """Represents a pet owner.
+
+    Keeps a registry of pets by name and of which pet owns each task, so
+    lookups need no scan. Add and remove pets through add_pet/remove_pet.
+    """
     name: str
     email: str
     phone: str
     pets: List[Pet] = field(default_factory=list)
+    _pets_by_name: Dict[str, Pet] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # task_id -> Pet owning that task
+    _task_pets: Dict[str, Pet] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Schedulers this owner is registered with; their task -> pet maps are
+    # kept in step with _task_pets
+    _schedulers: "WeakSet[Scheduler]" = field(default_factory=WeakSet, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        pets, self.pets = self.pets, []
+        for pet in pets:
+            self.add_pet(pet)
 
     def add_pet(self, pet: Pet):
-        """Add a pet to the owner's collection."""
+        """Add a pet to the owner's collection.
+
+        Raises:
+            ValueError: If the owner already has a different pet with this name.
+        """
+        existing = self._pets_by_name.get(pet.name)
+        if existing is pet:
+            return
+        if existing is not None:
+            raise ValueError(f"Duplicate pet name '{pet.name}'")
         self.pets.append(pet)
+        self._pets_by_name[pet.name] = pet
+        pet._owner = self
+        for task_id in pet._tasks_by_id:
+            self._track(task_id, pet)
 
     def remove_pet(self, pet_name: str):
         """Remove a pet by name."""
-        self.pets = [p for p in self.pets if p.name != pet_name]
+        pet = self._pets_by_name.pop(pet_name, None)
+        if pet is None:
+            return
+        self.pets.remove(pet)
+        pet._owner = None
+        for task_id in pet._tasks_by_id:
+            self._untrack(task_id, pet)
+
+    def _track(self, task_id: str, pet: Pet):
+        self._task_pets[task_id] = pet
+        # Checked first because iterating even an empty WeakSet is slow
+        if self._schedulers:
+            for scheduler in self._schedulers:
+                scheduler._task_pets[task_id] = pet
+
+    def _untrack(self, task_id: str, pet: Pet):
+        self._task_pets.pop(task_id, None)
+        if not self._schedulers:
+            return
+        for scheduler in self._schedulers:
+            # Another registered owner may have a task with the same ID
+            if scheduler._task_pets.get(task_id) is pet:
+                del scheduler._task_pets[task_id]
+
+    def rename_pet(self, old_name: str, new_name: str):
+        """Rename a pet, keeping the name registry in sync.
+
+        Raises:
+            ValueError: If there is no pet called old_name or new_name is taken.
+        """
+        pet = self._pets_by_name.get(old_name)
+        if pet is None:
+            raise ValueError(f"No pet named '{old_name}'")
+        if new_name != old_name and new_name in self._pets_by_name:
+            raise ValueError(f"Duplicate pet name '{new_name}'")
+        del self._pets_by_name[old_name]
+        pet.name = new_name
+        self._pets_by_name[new_name] = pet
+
+    def get_pet(self, pet_name: str) -> Optional[Pet]:
+        """Return the pet with the given name, or None."""
+        return self._pets_by_name.get(pet_name)
+
+    def find_pet_for_task(self, task_id: str) -> Optional[Pet]:
+        """Return the pet that owns a task, or None if no pet of this owner does."""
+        return self._task_pets.get(task_id)
 
     def get_pets(self) -> List[Pet]:
         """Retrieve all pets owned by this owner."""
         return self.pets
 
+    def iter_tasks(self) -> Iterator[Task]:
+        """Iterate over all tasks across all pets without copying them."""
+        return chain.from_iterable(pet.tasks for pet in self.pets)
+
     def get_all_tasks(self) -> List[Task]:
-        """Return all tasks across all pets."""
-        all_tasks = []
-        for pet in self.pets:
-            all_tasks.extend(pet.tasks)
-        return all_tasks
+        """Return all tasks across all pets as a new list."""
+        return list(self.iter_tasks())
+
+    @property
+    def task_count(self) -> int:
+        """Return the number of tasks across all pets."""
+        return len(self._task_pets)
 
 
 class Scheduler:
     """Manages and organizes tasks for the pet care system."""
 
-    def __init__(self):
-        """Initialize the scheduler with an empty task list."""
-        self.all_tasks: List[Task] = []
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        """Initialize the scheduler with an empty task index.
+
+        Args:
+            clock: Returns the current time. Each query reads it once, so tests
+                and batch jobs can inject a fixed or simulated clock.
+        """
+        self.clock = clock
+        # task_id -> Task; dicts keep insertion order, so this doubles as the
+        # ordered task list while giving O(1) lookup and removal.
+        self._tasks: Dict[str, Task] = {}
+        # Time-ordered index of (scheduled_time, seq, task) entries kept sorted
+        # with bisect. seq breaks ties in insertion order and is recorded per
+        # task so an entry can be found again even if the task is mutated.
+        self._time_index: List[Tuple[datetime, int, Task]] = []
+        self._time_keys: Dict[str, Tuple[datetime, int]] = {}
+        self._seq = count()
+        # Calendar view of the same entries: day -> that day's entries in
+        # time order. Day and week queries read only the buckets they need.
+        self._day_buckets: Dict[date, List[Tuple[datetime, int, Task]]] = {}
+        # Incrementally maintained conflict set, keyed by (first_id, second_id),
+        # plus a per-task reverse index so removals only touch their own pairs.
+        self._conflicts: Dict[Tuple[str, str], Conflict] = {}
+        self._task_conflicts: Dict[str, Set[Tuple[str, str]]] = {}
+        self._conflict_list: Optional[List[Conflict]] = None
+        # Longest duration seen so far; bounds how far back an overlapping
+        # task can start. Never shrinks, which only widens the search window.
+        self._max_duration = timedelta(0)
+        # Pending tasks per priority rank, each list time-ordered like
+        # _time_index. Backs peek_next/pop_next without a full sort.
+        self._pending: Dict[int, List[Tuple[datetime, int, Task]]] = {}
+        self._pending_ranks: Dict[str, int] = {}
+        # Pending recurring tasks: the heads of each series, used to project
+        # future occurrences lazily.
+        self._recurring: Dict[str, Task] = {}
+        # Occurrences materialized ahead of time: series head task_id ->
+        # {occurrence time: materialized task_id}. Handed to the next head
+        # whenever the series rolls over; see _stand_in().
+        self._materialized: Dict[str, Dict[datetime, str]] = {}
+        # Owners registered through register_owner(), and the task -> pet
+        # map of all their pets, which the owners keep up to date so
+        # completion finds the right pet in O(1).
+        self._owners: List[Owner] = []
+        self._task_pets: Dict[str, Pet] = {}
+        # Change listeners registered through subscribe(), and a counter
+        # bumped on every change so callers can cache derived views
+        self._listeners: List[Callable[[str, Task], None]] = []
+        self._version = 0
+
+    @property
+    def all_tasks(self) -> List[Task]:
+        """Return all tasks in the order they were added."""
+        return list(self._tasks.values())
+
+    def __len__(self) -> int:
+        """Return the number of tasks in the scheduler."""
+        return len(self._tasks)
 
     def add_task(self, task: Task):
-        """Add a task to the scheduler."""
-        self.all_tasks.append(task)
+        """Add a task to the scheduler.
+
+        Raises:
+            ValueError: If a different task with the same task_id is already scheduled.
+        """
+        existing = self._tasks.get(task.task_id)
+        if existing is task:
+            return
+        if existing is not None:
+            raise ValueError(f"Duplicate task_id '{task.task_id}'")
+        self._tasks[task.task_id] = task
+        self._index_time(task)
+        self._index_conflicts(task)
+        self._index_pending(task)
+        self._notify("add", task)
+
+    def register_owner(self, owner: Owner):
+        """Schedule all of an owner's tasks and remember the owner.
+
+        Once registered, completing or materializing a task finds the pet
+        that owns it, so callers no longer need to pass `pet`.
+        """
+        # Owners compare by value, so two distinct owners can be equal
+        if not any(known is owner for known in self._owners):
+            self._owners.append(owner)
+            owner._schedulers.add(self)
+            self._task_pets.update(owner._task_pets)
+        self.add_tasks(owner.iter_tasks())
+
+    def unregister_owner(self, owner: Owner):
+        """Unschedule all of an owner's tasks and forget the owner.
+
+        The reverse of register_owner(); other owners' tasks stay scheduled,
+        even ones that share a task_id with this owner's.
+        """
+        for task in owner.iter_tasks():
+            if self._tasks.get(task.task_id) is task:
+                self.remove_task(task.task_id)
+        if any(known is owner for known in self._owners):
+            self._owners = [known for known in self._owners if known is not owner]
+            owner._schedulers.discard(self)
+            for task_id, pet in owner._task_pets.items():
+                if self._task_pets.get(task_id) is pet:
+                    del self._task_pets[task_id]
+
+    def find_pet(self, task_id: str) -> Optional[Pet]:
+        """Return the pet owning a task among the registered owners' pets."""
+        return self._task_pets.get(task_id)
+
+    def add_tasks(self, tasks: Iterable[Task]):
+        """Add many tasks at once.
+
+        Index entries are appended and each index is sorted once at the end,
+        which is much cheaper than one insort per task for large batches.
+        Batches that are small next to the existing index are insorted
+        instead, since re-sorting would cost O(n) however few tasks arrive.
+        Likewise, when the batch is at least half of the resulting schedule,
+        conflicts are recomputed in one sweep rather than probed per task.
+
+        Raises:
+            ValueError: If any task_id clashes with a scheduled task or another
+                task in the batch. Nothing is added in that case.
+        """
+        batch: Dict[str, Task] = {}
+        for task in tasks:
+            existing = self._tasks.get(task.task_id) or batch.get(task.task_id)
+            if existing is task:
+                continue
+            if existing is not None:
+                raise ValueError(f"Duplicate task_id '{task.task_id}'")
+            batch[task.task_id] = task
+        if not batch:
+            return
+
+        bulk = len(batch) * 64 >= len(self._time_index)
+        for task in batch.values():
+            self._tasks[task.task_id] = task
+            self._index_time(task, bulk)
+            self._index_pending(task, bulk)
+        if bulk:
+            self._time_index.sort()
+            for day in {task.scheduled_time.date() for task in batch.values()}:
+                self._day_buckets[day].sort()
+            for queue in self._pending.values():
+                queue.sort()
+        if len(batch) * 2 >= len(self._time_index):
+            # Mostly new tasks (e.g. loading a schedule): one sweep over the
+            # whole index beats probing a window per task
+            for task in batch.values():
+                self._max_duration = max(self._max_duration, task.end_time - task.scheduled_time)
+            self._sweep_conflicts()
+        else:
+            for task in batch.values():
+                self._index_conflicts(task)
+        if self._listeners:
+            for task in batch.values():
+                self._notify("add", task)
+        else:
+            self._version += 1
 
     def remove_task(self, task_id: str):
         """Remove a task by task ID."""
-        self.all_tasks = [t for t in self.all_tasks if t.task_id != task_id]
+        task = self._tasks.pop(task_id, None)
+        if task is not None:
+            self._unindex_pending(task_id)
+            self._unindex_conflicts(task_id)
+            self._unindex_time(task_id)
+            self._materialized.pop(task_id, None)
+            self._notify("remove", task)
+
+    def reschedule_task(self, task_id: str, new_time: datetime) -> Optional[Task]:
+        """Move a scheduled task to a new time, keeping the time index in sync.
+
+        Returns:
+            Optional[Task]: The rescheduled task, or None if the ID is unknown.
+        """
+        return self._reindex(task_id, {"scheduled_time": new_time}, "reschedule")
+
+    def update_task(self, task_id: str, **changes) -> Optional[Task]:
+        """Edit fields of a scheduled task, keeping every index in sync.
+
+        Args:
+            task_id: The ID of the task to edit.
+            **changes: New values for any of EDITABLE_FIELDS.
+
+        Returns:
+            Optional[Task]: The updated task, or None if the ID is unknown.
+
+        Raises:
+            ValueError: If a field cannot be edited this way.
+        """
+        unknown = set(changes) - EDITABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update field(s): {', '.join(sorted(unknown))}")
+        return self._reindex(task_id, _coerce_fields(changes), "update")
+
+    def _reindex(self, task_id: str, changes: dict, event: str) -> Optional[Task]:
+        """Apply field changes to a task between unindexing and reindexing it."""
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        self._unindex_pending(task_id)
+        self._unindex_conflicts(task_id)
+        self._unindex_time(task_id)
+        for name, value in changes.items():
+            setattr(task, name, value)
+        self._index_time(task)
+        self._index_conflicts(task)
+        self._index_pending(task)
+        self._notify(event, task)
+        return task
+
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the scheduled tasks change.
+
+        Callers can cache derived views (sorted lists, plans) and recompute
+        them only when the version differs from the one they were built at.
+        """
+        return self._version
+
+    def subscribe(self, listener: Callable[[str, Task], None]) -> Callable[[], None]:
+        """Register a callback for changes made through the scheduler.
+
+        The listener is called synchronously as listener(event, task), where
+        event is "add", "remove", "reschedule", "update" or "complete". Completing a
+        recurring task emits "complete" for it and then "add" for the next
+        occurrence.
+
+        Returns:
+            Callable[[], None]: A function that unsubscribes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self, event: str, task: Task):
+        """Bump the version and send a change event to every listener."""
+        self._version += 1
+        for listener in self._listeners:
+            listener(event, task)
+
+    def _index_time(self, task: Task, bulk: bool = False):
+        """Insert a task into the time-ordered index and its day bucket.
+
+        With bulk=True the entry is appended and the caller must re-sort the
+        index and the bucket.
+        """
+        key = (task.scheduled_time, next(self._seq))
+        self._time_keys[task.task_id] = key
+        entry = key + (task,)
+        bucket = self._day_buckets.setdefault(task.scheduled_time.date(), [])
+        if bulk:
+            self._time_index.append(entry)
+            bucket.append(entry)
+        else:
+            insort(self._time_index, entry)
+            insort(bucket, entry)
+
+    def _unindex_time(self, task_id: str):
+        """Remove a task's entry from the time-ordered index and its day bucket."""
+        key = self._time_keys.pop(task_id)
+        del self._time_index[bisect_left(self._time_index, key)]
+        day = key[0].date()
+        bucket = self._day_buckets[day]
+        del bucket[bisect_left(bucket, key)]
+        if not bucket:
+            del self._day_buckets[day]
+
+    def _index_pending(self, task: Task, bulk: bool = False):
+        """Add an incomplete task to its priority rank's pending queue.
+
+        With bulk=True the entry is appended and the caller must re-sort.
+        """
+        if task.is_completed:
+            return
+        if task.recurrence_days > 0:
+            self._recurring[task.task_id] = task
+        rank = task.priority.rank
+        self._pending_ranks[task.task_id] = rank
+        queue = self._pending.setdefault(rank, [])
+        entry = self._time_keys[task.task_id] + (task,)
+        if bulk:
+            queue.append(entry)
+        else:
+            insort(queue, entry)
+
+    def _unindex_pending(self, task_id: str):
+        """Remove a task from the pending queues if it is still there."""
+        self._recurring.pop(task_id, None)
+        rank = self._pending_ranks.pop(task_id, None)
+        if rank is None:
+            return
+        queue = self._pending[rank]
+        del queue[bisect_left(queue, self._time_keys[task_id])]
+
+    def _index_conflicts(self, task: Task):
+        """Record conflicts between a newly indexed task and its neighbours.
+
+        Only tasks starting within [start - longest duration, end) can overlap,
+        so the check is a bisect plus a scan of that window.
+        """
+        start, end = task.scheduled_time, task.end_time
+        self._max_duration = max(self._max_duration, end - start)
+        key = self._time_keys[task.task_id]
+        lo = bisect_left(self._time_index, (start - self._max_duration,))
+        # Zero-duration tasks still clash with anything starting at `start`
+        hi = bisect_left(self._time_index, (max(end, start + timedelta.resolution),))
+
+        for other_start, other_seq, other in self._time_index[lo:hi]:
+            if other is task:
+                continue
+            if other_start != start and not (other_start < end and start < other.end_time):
+                continue
+            if (other_start, other_seq) < key:
+                pair, conflict = (other.task_id, task.task_id), Conflict(other, task)
+            else:
+                pair, conflict = (task.task_id, other.task_id), Conflict(task, other)
+            self._conflicts[pair] = conflict
+            self._task_conflicts.setdefault(other.task_id, set()).add(pair)
+            self._task_conflicts.setdefault(task.task_id, set()).add(pair)
+            self._conflict_list = None
+
+    def _unindex_conflicts(self, task_id: str):
+        """Drop every recorded conflict involving a task."""
+        for pair in self._task_conflicts.pop(task_id, ()):
+            del self._conflicts[pair]
+            other_id = pair[1] if pair[0] == task_id else pair[0]
+            self._task_conflicts[other_id].discard(pair)
+            self._conflict_list = None
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return the task with the given ID, or None if it is not scheduled."""
+        return self._tasks.get(task_id)
 
     def sort_by_time(self) -> List[Task]:
         """Return tasks sorted by scheduled time."""
-        return sorted(self.all_tasks, key=lambda task: task.scheduled_time)
+        return [entry[2] for entry in self._time_index]
+
+    def tasks_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return tasks scheduled in the half-open range [start, end), in time order.
+
+        Uses the time-ordered index, so the cost is O(log n + k) for k results.
+        """
+        lo = bisect_left(self._time_index, (start,))
+        hi = bisect_left(self._time_index, (end,))
+        return [entry[2] for entry in self._time_index[lo:hi]]
 
     def sort_by_priority(self) -> List[Task]:
-        """Sort tasks by priority (high > medium > low)."""
-        priority_order = {"high": 3, "medium": 2, "low": 1}
-        return sorted(
-            self.all_tasks,
-            key=lambda task: priority_order.get(task.priority, 0),
-            reverse=True
-        )
+        """Sort tasks by priority (high > medium > low), stable within a level.
 
-    def get_tasks_by_priority(self) -> List[Task]:
-        """Return tasks sorted by priority (overdue first, then by category)."""
-        # Separate overdue and non-overdue tasks
-        overdue_tasks = [t for t in self.all_tasks if t.is_overdue()]
-        other_tasks = [t for t in self.all_tasks if not t.is_overdue()]
-        
-        # Sort each group by priority
-        overdue_tasks.sort(key=lambda t: {"high": 3, "medium": 2, "low": 1}.get(t.priority, 0), reverse=True)
-        other_tasks.sort(key=lambda t: {"high": 3, "medium": 2, "low": 1}.get(t.priority, 0), reverse=True)
-        
-        return overdue_tasks + other_tasks
-
-    def get_today_tasks(self) -> List[Task]:
-        """Get all tasks scheduled for today."""
-        today = date.today()
+        There are only three ranks, so tasks are bucketed by rank in one
+        pass instead of sorted.
+        """
+        buckets: List[List[Task]] = [[] for _ in range(len(Priority) + 1)]
+        for task in self._tasks.values():
+            buckets[task.priority.rank].append(task)
+        return [task for bucket in reversed(buckets) for task in bucket]
+
+    def get_tasks_by_priority(self, now: Optional[datetime] = None) -> List[Task]:
+        """Return tasks ordered by (overdue first, priority, scheduled time).
+
+        Walks the time index once, dropping each task into one of the
+        (overdue, rank) buckets, so no sort is needed.
+
+        Args:
+            now: Reference time for overdue checks; defaults to the clock.
+        """
+        if now is None:
+            now = self.clock()
+        overdue: List[List[Task]] = [[] for _ in range(len(Priority) + 1)]
+        upcoming: List[List[Task]] = [[] for _ in range(len(Priority) + 1)]
+        for when, _, task in self._time_index:
+            group = upcoming if task.is_completed or when >= now else overdue
+            group[task.priority.rank].append(task)
+        return [task for group in (overdue, upcoming) for bucket in reversed(group) for task in bucket]
+
+    def _iter_pending(self, now: datetime, stale: List[str]) -> Iterator[Task]:
+        """Yield pending tasks in (overdue first, priority, time) order.
+
+        Each rank's queue is time-ordered, so its overdue tasks are the prefix
+        before `now`. Tasks completed behind the scheduler's back are skipped
+        and their IDs collected in `stale` for the caller to purge.
+        """
+        ranks = sorted(self._pending, reverse=True)
+        cuts = {rank: bisect_left(self._pending[rank], (now,)) for rank in ranks}
+        for overdue in (True, False):
+            for rank in ranks:
+                queue = self._pending[rank]
+                lo, hi = (0, cuts[rank]) if overdue else (cuts[rank], len(queue))
+                for i in range(lo, hi):
+                    task = queue[i][2]
+                    if task.is_completed:
+                        stale.append(task.task_id)
+                        continue
+                    yield task
+
+    def peek_next(self, k: int = 1, now: Optional[datetime] = None) -> List[Task]:
+        """Return the next k pending tasks without a full sort.
+
+        Ordering matches get_tasks_by_priority() restricted to incomplete tasks.
+        Costs O(log n + k) per priority level rather than O(n log n).
+
+        Args:
+            k: Maximum number of tasks to return.
+            now: Reference time for overdue checks; defaults to the clock.
+        """
+        if now is None:
+            now = self.clock()
+        stale: List[str] = []
+        upcoming = list(islice(self._iter_pending(now, stale), k))
+        for task_id in stale:
+            self._unindex_pending(task_id)
+        return upcoming
+
+    def pop_next(self, now: Optional[datetime] = None, pet: Optional['Pet'] = None) -> Optional[Task]:
+        """Complete the most urgent pending task and return it.
+
+        Recurring tasks roll over through complete_task_and_reschedule().
+
+        Args:
+            now: Reference time for overdue checks; defaults to the clock.
+            pet: Optional Pet to receive the next occurrence of a recurring task.
+
+        Returns:
+            Optional[Task]: The task that was completed, or None if nothing is pending.
+        """
+        upcoming = self.peek_next(1, now)
+        if not upcoming:
+            return None
+        self.complete_task_and_reschedule(upcoming[0].task_id, pet)
+        return upcoming[0]
+
+    def get_day_tasks(self, day: date, pet: Optional[Pet] = None) -> List[Task]:
+        """Return the tasks scheduled on a given day, in time order.
+
+        Args:
+            day: The calendar day to list.
+            pet: Optional Pet to restrict the list to its tasks.
+        """
+        bucket = self._day_buckets.get(day, ())
+        if pet is None:
+            return [entry[2] for entry in bucket]
+        owned = pet._tasks_by_id
+        return [entry[2] for entry in bucket if entry[2].task_id in owned]
+
+    def get_today_tasks(self, pet: Optional[Pet] = None) -> List[Task]:
+        """Get all tasks scheduled for today, optionally only one pet's."""
+        return self.get_day_tasks(self.clock().date(), pet)
+
+    def get_week(self, start: Optional[date] = None,
+                 pet: Optional[Pet] = None) -> Dict[date, List[Task]]:
+        """Return seven consecutive days of tasks, keyed by day.
+
+        Args:
+            start: First day of the week; defaults to today.
+            pet: Optional Pet to restrict the view to its tasks.
+
+        Returns:
+            Dict[date, List[Task]]: Every one of the seven days, in order,
+            mapped to its tasks in time order (empty days included).
+        """
+        if start is None:
+            start = self.clock().date()
+        days = (start + timedelta(days=offset) for offset in range(7))
+        return {day: self.get_day_tasks(day, pet) for day in days}
+
+    def detect_conflicts(self, scope: Union[Pet, Owner, None] = None) -> List[Conflict]:
+        """Detect tasks whose scheduled intervals overlap.
+
+        Args:
+            scope: Optional Pet or Owner to restrict the check to their tasks.
+                By default every scheduled task is checked against every other.
+
+        Returns:
+            List[Conflict]: Overlapping task pairs, ordered by the start time of
+            the later task in each pair. Served from the incrementally
+            maintained conflict set, so no rescan happens here.
+        """
+        if self._conflict_list is None:
+            keys = self._time_keys
+            self._conflict_list = sorted(
+                self._conflicts.values(),
+                key=lambda c: (keys[c.second.task_id], keys[c.first.task_id])
+            )
+        if scope is None:
+            return list(self._conflict_list)
+
+        # The registries are dicts keyed by task_id, so no set is built here
+        scoped_ids = scope._task_pets if isinstance(scope, Owner) else scope._tasks_by_id
         return [
-            t for t in self.all_tasks
-            if t.scheduled_time.date() == today
+            c for c in self._conflict_list
+            if c.first.task_id in scoped_ids and c.second.task_id in scoped_ids
         ]
 
-    def detect_conflicts(self) -> List[str]:
-        """Detect scheduling conflicts (e.g., overlapping tasks within same pet)."""
-        warnings = []
-        times_seen = {}
+    def rebuild_conflicts(self) -> bool:
+        """Recompute the conflict set from scratch with a full sweep.
 
-        for task in sorted(self.all_tasks, key=lambda t: t.scheduled_time):
-            task_time = task.scheduled_time.time()
-            if task_time in times_seen:
-                warnings.append(
-                    f"⚠️  Conflict detected at {task_time} between '{times_seen[task_time].title}' and '{task.title}'"
-                )
-            else:
-                times_seen[task_time] = task
+        Intended as a consistency check for the incremental maintenance done
+        by add_task/remove_task/reschedule_task.
 
-        return warnings
+        Returns:
+            bool: True if the incrementally maintained set matched the rebuild.
+        """
+        previous = self._conflicts
+        self._sweep_conflicts()
+        return previous.keys() == self._conflicts.keys()
+
+    def _sweep_conflicts(self):
+        """Replace the conflict set with one find_conflicts() pass over the time index."""
+        self._conflicts = {
+            (c.first.task_id, c.second.task_id): c
+            for c in find_conflicts(self.sort_by_time())
+        }
+        self._task_conflicts = {}
+        for pair in self._conflicts:
+            self._task_conflicts.setdefault(pair[0], set()).add(pair)
+            self._task_conflicts.setdefault(pair[1], set()).add(pair)
+        self._conflict_list = None
 
     def schedule_recurring_task(self, task: Task, recurrence_days: int):
         """Schedule a recurring task with a specified interval."""
         task.recurrence_days = recurrence_days
         self.add_task(task)
 
-    def get_upcoming_tasks(self, days: int) -> List[Task]:
-        """Get all tasks scheduled for the next N days."""
-        today = date.today()
-        end_date = today + timedelta(days=days)
-        return [
-            t for t in self.all_tasks
-            if today <= t.scheduled_time.date() <= end_date
+    def get_upcoming_tasks(self, days: int, pet: Optional[Pet] = None) -> List[Task]:
+        """Get all tasks scheduled from today through the next N days.
+
+        Args:
+            days: Number of days after today to include (the range covers the
+                whole of the last day).
+            pet: Optional Pet to restrict the list to its tasks.
+        """
+        today = self.clock().date()
+        tasks = []
+        for offset in range(days + 1):
+            tasks.extend(self.get_day_tasks(today + timedelta(days=offset), pet))
+        return tasks
+
+    def iter_occurrences(self, start: datetime, end: datetime) -> Iterator[Occurrence]:
+        """Lazily yield every occurrence in [start, end) in time order.
+
+        Concrete tasks come from the time index; future repeats of pending
+        recurring tasks are projected on the fly and merged in, so memory use
+        depends on the number of recurring series rather than the window size.
+        A projected occurrence is skipped once it has been materialized.
+        Collect the results before materializing or otherwise mutating the
+        scheduler.
+        """
+        lo = bisect_left(self._time_index, (start,))
+        hi = bisect_left(self._time_index, (end,))
+        concrete = (
+            Occurrence(self._time_index[i][2], self._time_index[i][0])
+            for i in range(lo, hi)
+        )
+        virtual = [
+            self._project(task, start, end)
+            for task in list(self._recurring.values())
+            if not task.is_completed
         ]
+        for occurrence in merge(concrete, *virtual, key=lambda o: o.scheduled_time):
+            if occurrence.is_virtual and \
+                    self._stand_in(occurrence.task.task_id, occurrence.scheduled_time) is not None:
+                continue
+            yield occurrence
+
+    @staticmethod
+    def _project(task: Task, start: datetime, end: datetime) -> Iterator[Occurrence]:
+        """Yield virtual occurrences of one recurring task in [start, end)."""
+        for when in task.iter_future_occurrences(start, end):
+            yield Occurrence(task, when, is_virtual=True)
+
+    def get_upcoming_occurrences(self, days: int) -> Iterator[Occurrence]:
+        """Lazily yield occurrences for the next N days, including projected repeats."""
+        start = datetime.combine(self.clock().date(), time.min)
+        return self.iter_occurrences(start, start + timedelta(days=days + 1))
+
+    def _links(self, head_id: str) -> Dict[datetime, str]:
+        """Return the occurrences materialized from a series head, by occurrence time."""
+        return self._materialized.get(head_id, {})
+
+    def _stand_in(self, head_id: str, when: datetime) -> Optional[Task]:
+        """Return the task materialized for a series' occurrence at `when`, if it still exists."""
+        task_id = self._links(head_id).get(when)
+        return None if task_id is None else self.get_task(task_id)
+
+    def _link(self, head_id: str, links: Dict[datetime, str]):
+        """Replace a series head's materialized occurrences; an empty dict drops them."""
+        if links:
+            self._materialized[head_id] = links
+        else:
+            self._materialized.pop(head_id, None)
+
+    def _hand_over(self, head_id: str, new_head_id: str, after: datetime):
+        """Move a series' materialized occurrences later than `after` to its next head."""
+        links = self._links(head_id)
+        if links:
+            self._link(head_id, {})
+            self._link(new_head_id, {when: task_id for when, task_id in links.items() if when > after})
+
+    def _skip_materialized(self, task: Task, next_time: datetime) -> Tuple[datetime, Optional[Task]]:
+        """Find where a recurring task's series continues after it is completed.
+
+        Occurrences materialized ahead of time already exist as one-off
+        tasks. Completed ones are skipped, and the first pending one is
+        returned so the caller can adopt it as the new head of the series
+        instead of creating a duplicate at the same time. Only tasks
+        materialized from this series count, whatever their titles.
+
+        Returns:
+            Tuple[datetime, Optional[Task]]: The next occurrence's time and the
+            materialized task already standing in for it, if any.
+        """
+        interval = timedelta(days=task.recurrence_days)
+        while True:
+            existing = self._stand_in(task.task_id, next_time)
+            if existing is None or existing.recurrence_days:
+                return next_time, None
+            if not existing.is_completed:
+                return next_time, existing
+            next_time += interval
+
+    def materialize(self, occurrence: Occurrence, pet: Optional['Pet'] = None) -> Task:
+        """Turn an occurrence into a real, schedulable Task.
+
+        Concrete occurrences return their task unchanged. Virtual ones become a
+        one-off copy of the recurring task at the projected time, which is added
+        to the scheduler (and optionally the pet) so it can be edited or completed.
+        If no pet is given, the pet owning the recurring task is used when one
+        of the registered owners has it.
+        """
+        if not occurrence.is_virtual:
+            return occurrence.task
+        source = occurrence.task
+        task = Task(
+            title=source.title,
+            description=source.description,
+            category=source.category,
+            scheduled_time=occurrence.scheduled_time,
+            priority=source.priority,
+            duration_minutes=source.duration_minutes
+        )
+        if pet is None:
+            pet = self.find_pet(source.task_id)
+        if pet:
+            pet.add_task(task)
+        self.add_task(task)
+        self._link(source.task_id, {**self._links(source.task_id), occurrence.scheduled_time: task.task_id})
+        return task
+
+    def complete_occurrence(self, occurrence: Occurrence, pet: Optional['Pet'] = None) -> Task:
+        """Materialize an occurrence if needed and mark it complete.
+
+        Returns:
+            Task: The completed task.
+        """
+        task = self.materialize(occurrence, pet)
+        self.complete_task_and_reschedule(task.task_id, pet)
+        return task
+
+    def summarize(self, owner: Optional[Owner] = None, days: int = 14,
+                  now: Optional[datetime] = None) -> ScheduleSummary:
+        """Compute dashboard aggregates in a single pass over the tasks.
+
+        Args:
+            owner: Optional Owner whose pets are used to split the daily counts.
+            days: Number of days, starting today, to count tasks for.
+            now: Reference time; defaults to the clock.
+
+        Returns:
+            ScheduleSummary: Overdue high-priority tasks, per-pet daily task
+            counts for the window, and completion rate per category.
+        """
+        if now is None:
+            now = self.clock()
+        today = now.date()
+        task_pets = owner._task_pets if owner is not None else {}
+
+        overdue_high = []
+        daily_counts: Dict[Optional[str], Dict[date, int]] = {}
+        totals: Dict[str, int] = {}
+        completed: Dict[str, int] = {}
+        for task in self._tasks.values():
+            if task.priority is Priority.HIGH and task.is_overdue(now):
+                overdue_high.append(task)
+            day = task.scheduled_time.date()
+            if 0 <= (day - today).days < days:
+                pet = task_pets.get(task.task_id)
+                counts = daily_counts.setdefault(pet.name if pet else None, {})
+                counts[day] = counts.get(day, 0) + 1
+            totals[task.category] = totals.get(task.category, 0) + 1
+            if task.is_completed:
+                completed[task.category] = completed.get(task.category, 0) + 1
+
+        return ScheduleSummary(
+            overdue_high_priority=overdue_high,
+            daily_counts=daily_counts,
+            completion_rate={c: completed.get(c, 0) / n for c, n in totals.items()}
+        )
 
     def complete_task_and_reschedule(self, task_id: str, pet: Optional['Pet'] = None) -> Optional[Task]:
         """Mark a task complete and automatically create next occurrence if recurring.
@@ -203,26 +1168,512 @@ class Scheduler:
         3. Adds the new task to the scheduler
         4. Optionally adds the new task to the pet's task list
 
+        If the next occurrence was already materialized, that task becomes the
+        new recurring task instead; occurrences materialized and completed
+        early are skipped.
+
         Args:
             task_id: The ID of the task to complete
-            pet: Optional Pet object to add the new recurring task to
+            pet: Optional Pet object to add the new recurring task to. Defaults
+                to the pet owning the task, if a registered owner has it.
 
         Returns:
             Optional[Task]: The new recurring task if created, None otherwise
         """
-        # Find the task in the scheduler
-        task = next((t for t in self.all_tasks if t.task_id == task_id), None)
+        task = self._tasks.get(task_id)
 
         if not task:
             return None
 
         # Mark complete (returns new task if recurring)
         new_task = task.mark_complete()
+        self._unindex_pending(task_id)
+        self._notify("complete", task)
 
-        # If a new recurring task was created, add it to scheduler and pet
+        # If a new recurring task was created, add it to the pet and scheduler.
+        # The pet comes first so listeners can already see who owns it.
         if new_task:
+            new_task.scheduled_time, adopted = self._skip_materialized(task, new_task.scheduled_time)
+            if adopted is not None:
+                # An occurrence materialized early carries the series on
+                self._hand_over(task_id, adopted.task_id, new_task.scheduled_time)
+                return self.update_task(adopted.task_id, recurrence_days=task.recurrence_days,
+                                        series_id=task.series_key)
+            if pet is None:
+                pet = self.find_pet(task_id)
+            if pet:
+                pet.add_task(new_task)
             self.add_task(new_task)
+            self._hand_over(task_id, new_task.task_id, new_task.scheduled_time)
+
+        return new_task
+
+    def complete_many(self, task_ids: Iterable[str], now: Optional[datetime] = None,
+                      log_skipped: bool = False) -> CompletionBatch:
+        """Complete many tasks at once, catching recurring ones up to the present.
+
+        Each recurring task gets a single next occurrence at its first
+        repeat after `now` (see Task.next_occurrence_after), instead of one
+        task per missed interval. Pending-queue removals and new-task
+        insertions are applied in bulk, and each new task joins the pet of
+        the task it replaces. An occurrence materialized ahead of time is
+        reused rather than duplicated. Unknown and already completed IDs
+        are ignored.
+
+        Args:
+            task_ids: IDs of the tasks to complete.
+            now: Reference time for the catch-up; defaults to the clock.
+            log_skipped: Record each task's skipped occurrences as a
+                SkippedOccurrences run in the result.
+
+        Returns:
+            CompletionBatch: The completed tasks, the new occurrences and the
+            skipped occurrences.
+        """
+        if now is None:
+            now = self.clock()
+        batch = CompletionBatch([], [])
+        # rank -> IDs leaving that pending queue
+        leaving: Dict[int, Set[str]] = {}
+        for task_id in task_ids:
+            task = self._tasks.get(task_id)
+            if task is None or task.is_completed:
+                continue
+            task.is_completed = True
+            batch.completed.append(task)
+            self._recurring.pop(task_id, None)
+            rank = self._pending_ranks.pop(task_id, None)
+            if rank is not None:
+                leaving.setdefault(rank, set()).add(task_id)
+
+            next_time = task.next_occurrence_after(now)
+            if next_time is None:
+                continue
+            next_time, adopted = self._skip_materialized(task, next_time)
+            skipped = (next_time - task.scheduled_time).days // task.recurrence_days - 1
+            if skipped:
+                batch.skipped_count += skipped
+                if log_skipped:
+                    batch.skipped.append(SkippedOccurrences(
+                        task_id, task.scheduled_time + timedelta(days=task.recurrence_days),
+                        task.recurrence_days, skipped
+                    ))
+            if adopted is not None:
+                # An occurrence materialized early carries the series on
+                self._hand_over(task_id, adopted.task_id, next_time)
+                self.update_task(adopted.task_id, recurrence_days=task.recurrence_days,
+                                 series_id=task.series_key)
+                batch.created.append(adopted)
+                continue
+            new_task = replace(task, scheduled_time=next_time, task_id=new_task_id(),
+                               is_completed=False, series_id=task.series_key)
+            self._hand_over(task_id, new_task.task_id, next_time)
+            pet = self.find_pet(task_id)
             if pet:
                 pet.add_task(new_task)
+            batch.created.append(new_task)
+
+        for rank, ids in leaving.items():
+            queue = self._pending[rank]
+            if len(ids) * 64 < len(queue):
+                # A few tasks: delete each entry in place
+                for task_id in ids:
+                    del queue[bisect_left(queue, self._time_keys[task_id])]
+            else:
+                # Many tasks: one filtering pass instead of a deletion (and shift) per task
+                self._pending[rank] = [entry for entry in queue if entry[2].task_id not in ids]
+        for task in batch.completed:
+            self._notify("complete", task)
+        self.add_tasks(batch.created)
+        return batch
+
+    def complete_task(self, task_id: str) -> Optional[Task]:
+        """Mark a task complete without creating its next occurrence.
+
+        For replaying or merging changes where the next occurrence is
+        recorded separately; use complete_task_and_reschedule() otherwise.
 
+        Returns:
+            Optional[Task]: The task, or None if the ID is unknown.
+        """
+        task = self._tasks.get(task_id)
+        if task is None or task.is_completed:
+            return task
+        task.is_completed = True
+        self._unindex_pending(task_id)
+        self._notify("complete", task)
+        return task
+
+    def fork(self) -> 'ScheduleFork':
+        """Return a copy-on-write what-if view of this schedule.
+
+        The fork shares every unchanged task and index with this scheduler
+        and records only its own edits, so it costs memory in proportion to
+        the edits rather than the schedule. See ScheduleFork.
+        """
+        return ScheduleFork(self)
+
+    def _commit_fork(self, fork: 'ScheduleFork'):
+        """Apply a fork's edits to this scheduler; called by ScheduleFork.commit()."""
+        if self._version != fork._base_version:
+            raise ValueError("Scheduler changed since the fork was made; fork it again")
+        for task_id in fork._hidden - fork._tasks.keys():
+            self.remove_task(task_id)
+        added = []
+        for task_id, copy in fork._tasks.items():
+            original = self._tasks.get(task_id)
+            if original is None:
+                added.append(copy)
+                continue
+            changes = {
+                name: getattr(copy, name) for name in EDITABLE_FIELDS
+                if getattr(copy, name) != getattr(original, name)
+            }
+            if changes:
+                self.update_task(task_id, **changes)
+            if copy.is_completed:
+                # The fork already added the next occurrence of a recurring
+                # task, so only the completion itself is applied here
+                self.complete_task(task_id)
+        for task in added:
+            pet = fork._pets.get(task.task_id)
+            if pet:
+                pet.add_task(task)
+        self.add_tasks(added)
+        for head_id, links in fork._materialized.items():
+            self._link(head_id, links)
+
+
+class ScheduleFork:
+    """A copy-on-write what-if scenario layered over a Scheduler.
+
+    Edits made through the fork never touch the parent or its tasks: a
+    parent task is copied the first time the fork changes it, removed tasks
+    are hidden, and new tasks live only in the fork. Queries merge the
+    parent's indexes with the fork's small delta index on the fly.
+
+    commit() applies the edits to the parent through its normal methods
+    (so listeners and pets are updated), and is refused if the parent has
+    changed since the fork was made. discard() throws the edits away.
+    Queries on a fork whose parent has since changed see the parent's
+    current state with the fork's edits on top.
+    """
+
+    def __init__(self, parent: Scheduler):
+        self.parent = parent
+        self.clock = parent.clock
+        self._base_version = parent.version
+        self._closed = False
+        # task_id -> Task for tasks added in the fork or copied to be edited
+        self._tasks: Dict[str, Task] = {}
+        # IDs of parent tasks the fork removed or replaced with a copy
+        self._hidden: Set[str] = set()
+        # Pets that tasks added in the fork will join on commit
+        self._pets: Dict[str, Pet] = {}
+        # Time-ordered (scheduled_time, seq, task) entries for _tasks only
+        self._time_index: List[Tuple[datetime, int, Task]] = []
+        self._time_keys: Dict[str, Tuple[datetime, int]] = {}
+        self._seq = count()
+        self._max_duration = timedelta(0)
+        # Series heads whose materialized occurrences the fork changed;
+        # see Scheduler._materialized
+        self._materialized: Dict[str, Dict[datetime, str]] = {}
+
+    # -- edits ---------------------------------------------------------
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("Fork has already been committed or discarded")
+
+    def _index(self, task: Task):
+        key = (task.scheduled_time, next(self._seq))
+        self._time_keys[task.task_id] = key
+        insort(self._time_index, key + (task,))
+        self._max_duration = max(self._max_duration, task.end_time - task.scheduled_time)
+
+    def _unindex(self, task_id: str):
+        key = self._time_keys.pop(task_id)
+        del self._time_index[bisect_left(self._time_index, key)]
+
+    def _own(self, task_id: str) -> Optional[Task]:
+        """Return the fork's copy of a task, copying it from the parent on first write."""
+        task = self._tasks.get(task_id)
+        if task is not None or task_id in self._hidden:
+            return task
+        original = self.parent.get_task(task_id)
+        if original is None:
+            return None
+        task = self._tasks[task_id] = replace(original)
+        self._hidden.add(task_id)
+        self._index(task)
+        return task
+
+    def add_task(self, task: Task, pet: Optional[Pet] = None):
+        """Add a task to the scenario.
+
+        Args:
+            task: The new task.
+            pet: Optional Pet the task joins when the fork is committed.
+
+        Raises:
+            ValueError: If a task with the same task_id is already visible.
+        """
+        self._check_open()
+        if self.get_task(task.task_id) is not None:
+            raise ValueError(f"Duplicate task_id '{task.task_id}'")
+        self._tasks[task.task_id] = task
+        self._index(task)
+        if pet is not None:
+            self._pets[task.task_id] = pet
+
+    def remove_task(self, task_id: str):
+        """Remove a task from the scenario."""
+        self._check_open()
+        if self._tasks.pop(task_id, None) is not None:
+            self._unindex(task_id)
+            self._pets.pop(task_id, None)
+        elif task_id in self.parent._tasks:
+            self._hidden.add(task_id)
+
+    def reschedule_task(self, task_id: str, new_time: datetime) -> Optional[Task]:
+        """Move a task to a new time in the scenario.
+
+        Returns:
+            Optional[Task]: The fork's copy of the task, or None if the ID is unknown.
+        """
+        return self.update_task(task_id, scheduled_time=new_time)
+
+    def update_task(self, task_id: str, **changes) -> Optional[Task]:
+        """Edit fields of a task in the scenario; see Scheduler.update_task.
+
+        Raises:
+            ValueError: If a field cannot be edited this way.
+        """
+        self._check_open()
+        unknown = set(changes) - EDITABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update field(s): {', '.join(sorted(unknown))}")
+        _coerce_fields(changes)
+        task = self._own(task_id)
+        if task is None:
+            return None
+        self._unindex(task_id)
+        for name, value in changes.items():
+            setattr(task, name, value)
+        self._index(task)
+        return task
+
+    def complete_task_and_reschedule(self, task_id: str, pet: Optional[Pet] = None) -> Optional[Task]:
+        """Complete a task in the scenario, adding its next occurrence if recurring.
+
+        Args:
+            task_id: The ID of the task to complete.
+            pet: Optional Pet for the next occurrence; defaults to the pet
+                owning the task, if the parent's registered owners have it.
+
+        Returns:
+            Optional[Task]: The new recurring task if created, None otherwise.
+        """
+        self._check_open()
+        task = self._own(task_id)
+        if task is None:
+            return None
+        new_task = task.mark_complete()
+        if new_task:
+            new_task.scheduled_time, adopted = self._skip_materialized(task, new_task.scheduled_time)
+            if adopted is not None:
+                self._hand_over(task_id, adopted.task_id, new_task.scheduled_time)
+                return self.update_task(adopted.task_id, recurrence_days=task.recurrence_days,
+                                        series_id=task.series_key)
+            if pet is None:
+                pet = self._pets.get(task_id) or self.parent.find_pet(task_id)
+            self.add_task(new_task, pet)
+            self._hand_over(task_id, new_task.task_id, new_task.scheduled_time)
         return new_task
+
+    def _links(self, head_id: str) -> Dict[datetime, str]:
+        """Return a series head's materialized occurrences, as changed in the fork."""
+        if head_id in self._materialized:
+            return self._materialized[head_id]
+        return self.parent._links(head_id)
+
+    def _link(self, head_id: str, links: Dict[datetime, str]):
+        self._materialized[head_id] = links
+
+    _stand_in = Scheduler._stand_in
+    _hand_over = Scheduler._hand_over
+    _skip_materialized = Scheduler._skip_materialized
+
+    def commit(self):
+        """Apply the scenario to the parent scheduler and close the fork.
+
+        Raises:
+            ValueError: If the parent changed since the fork was made, or the
+                fork was already committed or discarded.
+        """
+        self._check_open()
+        self.parent._commit_fork(self)
+        self.discard()
+
+    def discard(self):
+        """Throw the scenario's edits away and close the fork."""
+        self._closed = True
+        self._tasks, self._hidden, self._pets = {}, set(), {}
+        self._time_index, self._time_keys = [], {}
+        self._materialized = {}
+
+    # -- queries -------------------------------------------------------
+
+    def _visible(self, entries: Iterable[Tuple[datetime, int, Task]]) -> Iterator[Tuple[datetime, int, Task]]:
+        hidden = self._hidden
+        return (entry for entry in entries if entry[2].task_id not in hidden)
+
+    def _merged(self, parent_entries, own_entries) -> Iterator[Task]:
+        """Merge parent and fork index slices by time; parent tasks win ties."""
+        for entry in merge(self._visible(parent_entries), own_entries, key=lambda e: e[0]):
+            yield entry[2]
+
+    def _owned_by(self, task_id: str, pet: Pet) -> bool:
+        if task_id in self._pets:
+            return self._pets[task_id] is pet
+        return task_id in pet._tasks_by_id
+
+    @property
+    def all_tasks(self) -> List[Task]:
+        """Return all tasks, parent order first, then tasks added in the fork."""
+        tasks = []
+        for task_id, task in self.parent._tasks.items():
+            if task_id in self._tasks:
+                tasks.append(self._tasks[task_id])
+            elif task_id not in self._hidden:
+                tasks.append(task)
+        tasks.extend(t for task_id, t in self._tasks.items() if task_id not in self.parent._tasks)
+        return tasks
+
+    def __len__(self) -> int:
+        """Return the number of tasks in the scenario."""
+        return len(self.parent) - len(self._hidden) + len(self._tasks)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return the task with the given ID, or None if it is not in the scenario."""
+        task = self._tasks.get(task_id)
+        if task is None and task_id not in self._hidden:
+            task = self.parent.get_task(task_id)
+        return task
+
+    def sort_by_time(self) -> List[Task]:
+        """Return tasks sorted by scheduled time."""
+        return list(self._merged(self.parent._time_index, self._time_index))
+
+    def tasks_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Return tasks scheduled in [start, end), in time order."""
+        parent = self.parent._time_index
+        own = self._time_index
+        return list(self._merged(
+            parent[bisect_left(parent, (start,)):bisect_left(parent, (end,))],
+            own[bisect_left(own, (start,)):bisect_left(own, (end,))]
+        ))
+
+    def sort_by_priority(self) -> List[Task]:
+        """Sort tasks by priority (high > medium > low)."""
+        return sorted(self.all_tasks, key=lambda task: task.priority.rank, reverse=True)
+
+    def get_tasks_by_priority(self, now: Optional[datetime] = None) -> List[Task]:
+        """Return tasks ordered by (overdue first, priority, scheduled time)."""
+        if now is None:
+            now = self.clock()
+        return sorted(
+            self.all_tasks,
+            key=lambda t: (t.is_completed or t.scheduled_time >= now, -t.priority.rank, t.scheduled_time)
+        )
+
+    def peek_next(self, k: int = 1, now: Optional[datetime] = None) -> List[Task]:
+        """Return the next k pending tasks, merging the parent's queues with the fork's."""
+        if now is None:
+            now = self.clock()
+
+        def key(t: Task):
+            return (t.scheduled_time >= now, -t.priority.rank, t.scheduled_time)
+
+        hidden = self._hidden
+        # The parent's stale entries are left for the parent to purge
+        parent = (t for t in self.parent._iter_pending(now, []) if t.task_id not in hidden)
+        own = sorted((e for e in self._time_index if not e[2].is_completed),
+                     key=lambda e: key(e[2]) + (e[1],))
+        return list(islice(merge(parent, (e[2] for e in own), key=key), k))
+
+    def get_day_tasks(self, day: date, pet: Optional[Pet] = None) -> List[Task]:
+        """Return the tasks scheduled on a given day, in time order."""
+        start = datetime.combine(day, time.min)
+        own = self._time_index
+        tasks = self._merged(
+            self.parent._day_buckets.get(day, ()),
+            own[bisect_left(own, (start,)):bisect_left(own, (start + timedelta(days=1),))]
+        )
+        if pet is None:
+            return list(tasks)
+        return [t for t in tasks if self._owned_by(t.task_id, pet)]
+
+    get_today_tasks = Scheduler.get_today_tasks
+    get_week = Scheduler.get_week
+    get_upcoming_tasks = Scheduler.get_upcoming_tasks
+    get_upcoming_occurrences = Scheduler.get_upcoming_occurrences
+
+    def detect_conflicts(self, scope: Union[Pet, Owner, None] = None) -> List[Conflict]:
+        """Detect overlapping tasks in the scenario; see Scheduler.detect_conflicts.
+
+        The parent's conflicts are reused minus those involving hidden
+        tasks, and only the fork's own tasks are checked for new overlaps.
+        """
+        hidden = self._hidden
+        conflicts = [
+            c for c in self.parent.detect_conflicts()
+            if c.first.task_id not in hidden and c.second.task_id not in hidden
+        ]
+        parent_index = self.parent._time_index
+        window = max(self.parent._max_duration, self._max_duration)
+        for start, seq, task in self._time_index:
+            end = task.end_time
+            lo = bisect_left(parent_index, (start - window,))
+            hi = bisect_left(parent_index, (max(end, start + timedelta.resolution),))
+            for other_start, _, other in self._visible(parent_index[lo:hi]):
+                if other_start != start and not (other_start < end and start < other.end_time):
+                    continue
+                # On equal start times parent tasks order first
+                conflicts.append(Conflict(task, other) if start < other_start else Conflict(other, task))
+        conflicts.extend(find_conflicts(entry[2] for entry in self._time_index))
+
+        parent_keys = self.parent._time_keys
+
+        def key(t: Task):
+            own = self._time_keys.get(t.task_id)
+            if own is not None:
+                return (own[0], 1, own[1])
+            parent = parent_keys[t.task_id]
+            return (parent[0], 0, parent[1])
+
+        conflicts.sort(key=lambda c: (key(c.second), key(c.first)))
+        if scope is None:
+            return conflicts
+        if isinstance(scope, Owner):
+            pets = scope.pets
+            return [
+                c for c in conflicts
+                if all(any(self._owned_by(t.task_id, p) for p in pets) for t in (c.first, c.second))
+            ]
+        return [c for c in conflicts
+                if self._owned_by(c.first.task_id, scope) and self._owned_by(c.second.task_id, scope)]
+
+    def iter_occurrences(self, start: datetime, end: datetime) -> Iterator[Occurrence]:
+        """Lazily yield every occurrence in [start, end); see Scheduler.iter_occurrences."""
+        concrete = (Occurrence(t, t.scheduled_time) for t in self.tasks_between(start, end))
+        recurring = chain(
+            (t for task_id, t in self.parent._recurring.items() if task_id not in self._hidden),
+            (t for t in self._tasks.values() if t.recurrence_days > 0)
+        )
+        virtual = [Scheduler._project(t, start, end) for t in list(recurring) if not t.is_completed]
+        for occurrence in merge(concrete, *virtual, key=lambda o: o.scheduled_time):
+            if occurrence.is_virtual and \
+                    self._stand_in(occurrence.task.task_id, occurrence.scheduled_time) is not None:
+                continue
+            yield occurrence
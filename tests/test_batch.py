@@ -0,0 +1,92 @@
+import sys
+import os
+from datetime import datetime, date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Scheduler, Task
+from pawpal_ids import SnowflakeIdAllocator, get_id_allocator
+from pawpal_batch import merge_plans, pack_owner, plan_owners, unpack_owner
+
+
+def _owner(name, conflicting):
+    owner = Owner(name=name, email=f"{name}@example.com", phone="123")
+    pet = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    owner.add_pet(pet)
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 2, 15, 8, 0), recurrence_days=1,
+                duration_minutes=30)
+    walk.mark_complete()  # completed directly, so no next occurrence exists yet
+    pet.add_task(walk)
+    pet.add_task(Task(title="Feed", description="", category="feeding",
+                      scheduled_time=datetime(2026, 2, 15, 8, 15 if conflicting else 45)))
+    return owner
+
+
+def test_pack_round_trip():
+    """Test that packing an owner for a worker preserves pets and tasks."""
+    owner = _owner("A", conflicting=True)
+    restored = unpack_owner(pack_owner(owner))
+    assert restored == owner
+
+
+def test_plan_owners_in_process_and_pool():
+    """Test that pooled planning matches in-process planning and merges rollovers back."""
+    owners = [_owner(f"owner{i}", conflicting=i % 2 == 0) for i in range(6)]
+    now = datetime(2026, 2, 15, 20, 0)
+
+    serial = plan_owners(owners, now=now, max_workers=1, shard_size=4)
+    pooled = plan_owners(owners, now=now, max_workers=2, shard_size=4)
+
+    # New occurrences get fresh IDs, so compare everything else
+    assert [(p.owner_name, p.conflicts, p.schedule[:2]) for p in pooled] == [
+        (p.owner_name, p.conflicts, p.schedule[:2]) for p in serial
+    ]
+    assert [[r[1][1:] for r in p.rolled_over] for p in pooled] == [
+        [r[1][1:] for r in p.rolled_over] for p in serial
+    ]
+    assert [p.owner_name for p in serial] == [o.name for o in owners]
+    # Workers issue IDs on their own nodes, never the parent's
+    nodes = {(SnowflakeIdAllocator.parse(r[1][0]) >> 12) & 0x3FF for p in pooled for r in p.rolled_over}
+    assert get_id_allocator().node not in nodes
+    assert [len(p.conflicts) for p in serial] == [1, 0, 1, 0, 1, 0]
+    walk_id, feed_id = (t.task_id for t in owners[0].pets[0].tasks)
+    assert serial[0].conflicts == [(walk_id, feed_id)]
+    assert [len(p.rolled_over) for p in serial] == [1] * 6
+    assert serial[0].schedule[:2] == [walk_id, feed_id]
+
+    assert merge_plans(owners, serial) == 6
+    new_walk = owners[0].pets[0].tasks[-1]
+    assert new_walk.scheduled_time == datetime(2026, 2, 16, 8, 0)
+    assert new_walk.task_id == serial[0].schedule[-1]
+
+    # Once merged, a second run has nothing left to roll over
+    assert all(not p.rolled_over for p in plan_owners(owners, now=now, max_workers=1))
+
+
+def test_rollover_follows_series_not_titles():
+    """Test that only ended series roll over, whatever their titles and however successors moved."""
+    owner = _owner("A", conflicting=False)
+    pet = owner.pets[0]
+    scheduler = Scheduler(clock=lambda: datetime(2026, 2, 15, 7, 0))
+    scheduler.register_owner(owner)
+    # A second "Walk" series whose successor was moved to 18:30
+    evening = Task(title="Walk", description="", category="walk",
+                   scheduled_time=datetime(2026, 2, 14, 18, 0), recurrence_days=1)
+    pet.add_task(evening)
+    scheduler.add_task(evening)
+    successor = scheduler.complete_task_and_reschedule(evening.task_id)
+    scheduler.reschedule_task(successor.task_id, datetime(2026, 2, 15, 18, 30))
+
+    plans = plan_owners([owner], now=datetime(2026, 2, 15, 20, 0), max_workers=1)
+    assert [packed[4] for _, packed in plans[0].rolled_over] == [datetime(2026, 2, 16, 8, 0)]
+    assert merge_plans([owner], plans, scheduler) == 1
+    walks = [t for t in pet.tasks if t.title == "Walk" and not t.is_completed]
+    assert sorted(t.scheduled_time for t in walks) == [
+        datetime(2026, 2, 15, 18, 30), datetime(2026, 2, 16, 8, 0)
+    ]
+    assert len({t.series_key for t in walks}) == 2
+
+    # Plans for pets that no longer exist are skipped
+    owner.remove_pet(pet.name)
+    assert merge_plans([owner], plans) == 0
@@ -0,0 +1,45 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks")))
+
+from bench_suite import build_workload, compare, remeasure_slow, run_suite
+
+
+def test_workload_is_seeded():
+    """Test that the same seed always generates the same tasks."""
+    a, b = build_workload(300, seed=3), build_workload(300, seed=3)
+    assert [(t.task_id, t.scheduled_time, t.priority) for t in a.tasks] == \
+        [(t.task_id, t.scheduled_time, t.priority) for t in b.tasks]
+    assert sum(len(owner.get_all_tasks()) for owner in a.owners) == 300
+
+
+def test_compare_flags_slowdowns_against_baseline():
+    """Test that results are JSON-shaped and slower runs are reported as regressions."""
+    results = run_suite([200], ["Scheduler.sort_by_time", "Scheduler.remove_task"], repeat=1)
+    assert {r["operation"] for r in results["results"]} == {
+        "Scheduler.sort_by_time", "Scheduler.remove_task"
+    }
+    assert compare(results, results) == []
+
+    slower = {"results": [dict(r, seconds=r["seconds"] * 10 + 0.01) for r in results["results"]]}
+    assert len(compare(slower, results)) == 2
+
+
+def test_remeasure_clears_one_off_slow_timings():
+    """Test that operations flagged by a single slow run are timed again before failing."""
+    results = run_suite([200], ["Scheduler.add_tasks"], repeat=3)
+    baseline = {"results": [dict(r, seconds=max(r["seconds"], 0.01)) for r in results["results"]]}
+    noisy = dict(results, results=[dict(r, seconds=1.0) for r in results["results"]])
+    assert len(compare(noisy, baseline)) == 1
+
+    assert compare(remeasure_slow(noisy, baseline, repeat=3), baseline) == []
+
+
+def test_remeasure_clears_one_off_memory_peaks():
+    """Test that operations flagged by a single large memory peak are measured again before failing."""
+    results = run_suite([200], ["Scheduler.add_tasks"], repeat=3)
+    noisy = dict(results, results=[dict(r, peak_bytes=r["peak_bytes"] * 10) for r in results["results"]])
+    assert len(compare(noisy, results)) == 1
+
+    assert compare(remeasure_slow(noisy, results, repeat=3), results) == []
@@ -0,0 +1,206 @@
+import sys
+import os
+import random
+import pytest
+from datetime import datetime, date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pytest.importorskip("numpy")
+
+from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_columnar import ColumnarScheduler
+
+
+def _random_tasks(count, seed=7):
+    rng = random.Random(seed)
+    base = datetime(2026, 2, 15, 0, 0)
+    return [
+        Task(
+            title=f"Task {i}",
+            description="",
+            category=rng.choice(["walk", "feeding", "medication"]),
+            scheduled_time=base + timedelta(minutes=15 * rng.randrange(400)),
+            priority=rng.choice(["low", "medium", "high"]),
+            is_completed=rng.random() < 0.2,
+            recurrence_days=rng.choice([0, 0, 1, 7]),
+            duration_minutes=rng.choice([0, 15, 45]),
+        )
+        for i in range(count)
+    ]
+
+
+def _ids(tasks):
+    return [t.task_id for t in tasks]
+
+
+def test_columnar_matches_object_scheduler():
+    """Test that ColumnarScheduler answers queries the same way as Scheduler."""
+    now = datetime(2026, 2, 17, 12, 0)
+    tasks = _random_tasks(500)
+    scheduler = Scheduler(clock=lambda: now)
+    for t in tasks:
+        scheduler.add_task(t)
+    columnar = ColumnarScheduler.from_tasks(tasks, clock=lambda: now)
+
+    for t in tasks[::5]:
+        scheduler.remove_task(t.task_id)
+        columnar.remove_task(t.task_id)
+
+    assert len(columnar) == len(scheduler)
+    assert _ids(columnar.sort_by_time()) == _ids(scheduler.sort_by_time())
+    assert _ids(columnar.sort_by_priority()) == _ids(scheduler.sort_by_priority())
+    assert _ids(columnar.get_tasks_by_priority()) == _ids(scheduler.get_tasks_by_priority())
+    assert _ids(columnar.peek_next(10)) == _ids(scheduler.peek_next(10))
+    assert _ids(columnar.get_today_tasks()) == _ids(scheduler.get_today_tasks())
+    assert _ids(columnar.get_upcoming_tasks(2)) == _ids(scheduler.get_upcoming_tasks(2))
+    assert [
+        (c.first.task_id, c.second.task_id) for c in columnar.detect_conflicts()
+    ] == [
+        (c.first.task_id, c.second.task_id) for c in scheduler.detect_conflicts()
+    ]
+    assert columnar.get_task(tasks[1].task_id) == tasks[1]
+
+
+def test_columnar_completion_and_scope():
+    """Test recurring rollover and per-pet conflict scoping on the columnar store."""
+    pet = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 2, 15, 8, 0), recurrence_days=1,
+                duration_minutes=30)
+    feed = Task(title="Feed", description="", category="feeding",
+                scheduled_time=datetime(2026, 2, 15, 8, 15))
+    other = Task(title="Groom", description="", category="grooming",
+                 scheduled_time=datetime(2026, 2, 15, 8, 10))
+    pet.add_task(walk)
+    pet.add_task(feed)
+    columnar = ColumnarScheduler.from_tasks([walk, feed, other])
+
+    assert len(columnar.detect_conflicts()) == 2
+    assert [(c.first.title, c.second.title) for c in columnar.detect_conflicts(scope=pet)] == [
+        ("Walk", "Feed")
+    ]
+
+    new_task = columnar.complete_task_and_reschedule(walk.task_id, pet)
+    assert new_task.scheduled_time == datetime(2026, 2, 16, 8, 0)
+    assert columnar.get_task(walk.task_id).is_completed
+    assert columnar.get_task(new_task.task_id) == new_task
+    assert new_task in pet.tasks
+    assert len(columnar) == 4
+
+
+def test_columnar_summary_matches_loop_summary():
+    """Test that the vectorized summary matches Scheduler.summarize()."""
+    now = datetime(2026, 2, 17, 12, 0)
+    owner = Owner(name="TestOwner", email="test@example.com", phone="123")
+    tasks = _random_tasks(600, seed=11)
+    for i, name in enumerate(["Buddy", "Luna", "Mochi"]):
+        pet = Pet(name=name, species="dog", breed="Mixed", date_of_birth=date(2020, 1, 1))
+        owner.add_pet(pet)
+        for t in tasks[i * 150:(i + 1) * 150]:
+            pet.add_task(t)
+
+    scheduler = Scheduler(clock=lambda: now)
+    for t in tasks:
+        scheduler.add_task(t)
+    columnar = ColumnarScheduler.from_owner(owner, clock=lambda: now)
+    columnar.add_tasks(tasks[450:])
+
+    expected = scheduler.summarize(owner, days=5)
+    actual = columnar.summarize(days=5)
+
+    assert _ids(actual.overdue_high_priority) == _ids(expected.overdue_high_priority)
+    assert actual.daily_counts == expected.daily_counts
+    assert actual.completion_rate == pytest.approx(expected.completion_rate)
+
+
+def _parity_engines():
+    """Build a Scheduler and a ColumnarScheduler over equal copies of the same tasks."""
+    now = datetime(2026, 2, 16, 7, 0)
+    engines = []
+    for engine in (Scheduler, ColumnarScheduler):
+        owner = Owner(name="TestOwner", email="test@example.com", phone="123")
+        pet = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+        owner.add_pet(pet)
+        for i, (title, hour, recurrence) in enumerate([
+            ("Walk", 8, 1), ("Feed", 9, 0), ("Meds", 10, 7), ("Brush", 11, 0), ("Play", 12, 2)
+        ]):
+            pet.add_task(Task(title=title, description="", category="walk",
+                              scheduled_time=datetime(2026, 2, 15, hour, 0), task_id=f"t{i}",
+                              recurrence_days=recurrence, duration_minutes=30))
+        if engine is Scheduler:
+            scheduler = Scheduler(clock=lambda: now)
+            scheduler.register_owner(owner)
+            scheduler.add_tasks(pet.tasks)
+        else:
+            scheduler = ColumnarScheduler.from_owner(owner, clock=lambda: now)
+        engines.append((scheduler, pet))
+    return engines
+
+
+def _view(tasks):
+    return [(t.title, t.scheduled_time, t.is_completed) for t in tasks]
+
+
+@pytest.mark.filterwarnings("ignore:ColumnarScheduler.fork")
+def test_columnar_has_scheduler_parity():
+    """Test that the same calls on Scheduler and ColumnarScheduler give the same results."""
+    results = []
+    for scheduler, pet in _parity_engines():
+        events = []
+        scheduler.subscribe(lambda event, task: events.append((event, task.title)))
+        start_version = scheduler.version
+        steps = []
+
+        scheduler.update_task("t3", priority="high", duration_minutes=20)
+        scheduler.reschedule_task("t1", datetime(2026, 2, 16, 9, 0))
+        steps.append(_view([scheduler.pop_next()]))
+        batch = scheduler.complete_many(["t0", "t2", "missing"], now=datetime(2026, 2, 17, 7, 0))
+        steps.append((_view(batch.completed), _view(batch.created), batch.skipped_count))
+
+        occurrences = list(scheduler.get_upcoming_occurrences(3))
+        steps.append([(o.title, o.scheduled_time, o.is_virtual) for o in occurrences])
+        virtual = [o for o in occurrences if o.is_virtual]
+        scheduler.materialize(virtual[0], pet)
+        steps.append(_view([scheduler.complete_occurrence(virtual[1])]))
+        steps.append(_view([scheduler.complete_task_and_reschedule("t4")]))
+        steps.append(_view(scheduler.sort_by_time()))
+
+        steps.append(_view(scheduler.get_day_tasks(date(2026, 2, 17), pet)))
+        steps.append({day: _view(tasks) for day, tasks in scheduler.get_week(pet=pet).items()})
+        steps.append([(o.title, o.scheduled_time, o.is_virtual) for o in
+                      scheduler.iter_occurrences(datetime(2026, 2, 17), datetime(2026, 2, 20))])
+
+        fork = scheduler.fork()
+        fork.update_task("t1", title="Breakfast")
+        fork.complete_task_and_reschedule("t3")
+        steps.append(_view(scheduler.sort_by_time()))
+        fork.commit()
+        steps.append(_view(scheduler.sort_by_time()))
+        with pytest.raises(ValueError):
+            fork.commit()
+
+        stale = scheduler.fork()
+        scheduler.remove_task("t1")
+        with pytest.raises(ValueError):
+            stale.commit()
+
+        with pytest.raises(ValueError):
+            scheduler.update_task("t3", is_completed=True)
+        assert scheduler.rebuild_conflicts()
+        assert scheduler.version != start_version
+        steps.append(events)
+        results.append(steps)
+
+    expected, actual = results
+    for step, (want, got) in enumerate(zip(expected, actual)):
+        assert got == want, f"step {step}"
+
+
+def test_columnar_fork_warns_that_it_copies_the_schedule():
+    """Test that forking a ColumnarScheduler warns that the fork is a full copy."""
+    scheduler = ColumnarScheduler()
+    scheduler.add_tasks(_random_tasks(50))
+    with pytest.warns(UserWarning, match="copies all 50 tasks"):
+        fork = scheduler.fork()
+    fork.discard()
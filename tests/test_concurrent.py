@@ -0,0 +1,120 @@
+import sys
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Task
+from pawpal_concurrent import RWLock, ThreadSafeScheduler
+
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+def _task(task_id, when, recurrence_days=0):
+    return Task(title=task_id, description="", category="walk", scheduled_time=when,
+                task_id=task_id, recurrence_days=recurrence_days, duration_minutes=15)
+
+
+def test_rwlock_is_reentrant_and_refuses_upgrades():
+    """Test that nested locking works and a read lock cannot be upgraded."""
+    lock = RWLock()
+    with lock.write():
+        with lock.read():
+            with lock.write():
+                pass
+    with lock.read():
+        with lock.read():
+            assert lock.holds_read()
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
+    assert not lock.holds_read()
+    # Fully released: another thread can take the write lock
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (lock.acquire_write(), lock.release_write(), done.set()))
+    thread.start()
+    thread.join(timeout=2)
+    assert done.is_set()
+
+
+def test_rwlock_frees_the_writer_when_its_last_hold_is_a_read():
+    """Test that releasing the write lock before a nested read still lets other threads in."""
+    lock = RWLock()
+    lock.acquire_write()
+    lock.acquire_read()
+    lock.release_write()
+    lock.release_read()
+
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (lock.acquire_read(), lock.release_read(), done.set()),
+                              daemon=True)
+    thread.start()
+    thread.join(timeout=2)
+    assert done.is_set()
+
+
+def test_concurrent_writers_and_readers_stay_consistent():
+    """Test that readers see consistent indexes with bounded latency while writers add, complete and reschedule."""
+    scheduler = ThreadSafeScheduler(clock=lambda: NOW)
+    scheduler.add_tasks(_task(f"seed{i}", NOW + timedelta(minutes=10 * i), i % 3 == 0)
+                        for i in range(300))
+    stop = threading.Event()
+    errors, latencies, added = [], [], []
+
+    def writer(number):
+        rng = random.Random(number)
+        try:
+            for i in range(200):
+                action = rng.random()
+                if action < 0.4:
+                    scheduler.add_task(_task(f"w{number}-{i}",
+                                             NOW + timedelta(minutes=5 * rng.randrange(2000))))
+                    added.append(f"w{number}-{i}")
+                elif action < 0.7:
+                    scheduler.complete_task_and_reschedule(f"seed{rng.randrange(300)}")
+                else:
+                    scheduler.reschedule_task(f"seed{rng.randrange(300)}",
+                                              NOW + timedelta(minutes=5 * rng.randrange(2000)))
+        except Exception as exc:  # surfaced by the main thread
+            errors.append(exc)
+
+    def reader():
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                scheduler.peek_next(3)
+                scheduler.get_today_tasks()
+                latencies.append(time.perf_counter() - start)
+                with scheduler.reading():
+                    times = [t.scheduled_time for t in scheduler.sort_by_time()]
+                    assert times == sorted(times)
+                    assert len(times) == len(scheduler)
+                    assert all(c.first.scheduled_time <= c.second.scheduled_time
+                               for c in scheduler.detect_conflicts())
+        except Exception as exc:
+            errors.append(exc)
+
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert not errors, errors
+    assert all(scheduler.get_task(task_id) for task_id in added)
+    assert len(scheduler) == len(scheduler.all_tasks) == len(scheduler.sort_by_time()) >= 300 + len(added)
+    assert [t.scheduled_time for t in scheduler.sort_by_time()] == \
+        sorted(t.scheduled_time for t in scheduler.all_tasks)
+    # The incremental conflict index matches a full rebuild
+    assert scheduler.rebuild_conflicts()
+    latencies.sort()
+    assert latencies
+    assert latencies[int(0.99 * (len(latencies) - 1))] < 0.5
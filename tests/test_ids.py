@@ -0,0 +1,67 @@
+import sys
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Scheduler, Task
+from pawpal_ids import SequentialIdAllocator, SnowflakeIdAllocator, set_id_allocator
+
+
+def test_snowflake_ids_unique_and_ordered_with_a_stuck_clock():
+    """Test that snowflake IDs stay unique and increasing past 4096 per ms or a clock step back."""
+    times = iter([1_700_000_000_000_000_000] * 5000 + [1_690_000_000_000_000_000] * 10)
+    allocator = SnowflakeIdAllocator(node=7, clock=lambda: next(times))
+    ids = [allocator() for _ in range(5010)]
+
+    assert len(set(ids)) == 5010
+    assert ids == sorted(ids)
+    assert all(len(task_id) == 13 for task_id in ids)
+    ints = [SnowflakeIdAllocator.parse(task_id) for task_id in ids]
+    assert ints == sorted(ints)
+    assert all((value >> 12) & 0x3FF == 7 for value in ints)
+
+    with pytest.raises(ValueError):
+        SnowflakeIdAllocator(node=1024)
+
+
+def test_pluggable_allocator_feeds_task_defaults():
+    """Test that new tasks, including recurring rollovers, take IDs from the current allocator."""
+    previous = set_id_allocator(SequentialIdAllocator(prefix="s"))
+    try:
+        scheduler = Scheduler()
+        task = Task(title="Meds", description="", category="medication",
+                    scheduled_time=datetime(2026, 3, 1, 9, 0), recurrence_days=1)
+        scheduler.add_task(task)
+        new_task = scheduler.complete_task_and_reschedule(task.task_id)
+        assert (task.task_id, new_task.task_id) == ("s1", "s2")
+        # Existing string IDs still work side by side
+        scheduler.add_task(Task(title="Walk", description="", category="walk",
+                                scheduled_time=datetime(2026, 3, 1, 8, 0), task_id="a1b2c3d4"))
+        assert scheduler.get_task("a1b2c3d4").title == "Walk"
+    finally:
+        set_id_allocator(previous)
+
+
+def test_snowflake_ids_stay_unique_across_threads():
+    """Test that threads sharing one allocator never get duplicate IDs as the millisecond advances."""
+    ticks = iter(range(10**9))
+    allocator = SnowflakeIdAllocator(node=3, clock=lambda: 1_700_000_000_000_000_000 + next(ticks) * 50_000)
+    results = [[] for _ in range(8)]
+
+    def issue(out):
+        for _ in range(5000):
+            out.append(allocator())
+
+    threads = [threading.Thread(target=issue, args=(out,)) for out in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [task_id for out in results for task_id in out]
+    assert len(set(ids)) == len(ids) == 40000
+    assert all(out == sorted(out) for out in results)
@@ -0,0 +1,137 @@
+import sys
+import os
+import json
+from datetime import datetime, date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_io import export_file, import_file, import_rows
+
+
+def _sample_owner():
+    owner = Owner(name="Jordan", email="jordan@email.com", phone="123")
+    dog = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    cat = Pet(name="Luna", species="cat", breed="Siamese", date_of_birth=date(2021, 8, 15))
+    owner.add_pet(dog)
+    owner.add_pet(cat)
+    dog.add_task(Task(title="Walk", description="Morning walk", category="walk",
+                      scheduled_time=datetime(2026, 2, 15, 8, 0), priority="high",
+                      recurrence_days=1, duration_minutes=20, series_id="w0"))
+    cat.add_task(Task(title="Feed", description="Breakfast", category="feeding",
+                      scheduled_time=datetime(2026, 2, 15, 7, 45), is_completed=True))
+    return owner
+
+
+def test_round_trip_jsonl_and_csv(tmp_path):
+    """Test that exporting and re-importing preserves pets and tasks in both formats."""
+    owner = _sample_owner()
+    for name in ("export.jsonl", "export.csv"):
+        path = str(tmp_path / name)
+        assert export_file(owner, path) == 4
+
+        restored = Owner(name="Jordan", email="jordan@email.com", phone="123")
+        scheduler = Scheduler()
+        report = import_file(path, restored, scheduler, batch_size=1)
+
+        assert (report.rows, report.pets_added, report.tasks_added, report.error_count) == (4, 2, 2, 0)
+        assert [p.name for p in restored.pets] == ["Mochi", "Luna"]
+        assert restored.pets[0].tasks == owner.pets[0].tasks
+        assert restored.pets[1].tasks == owner.pets[1].tasks
+        assert len(scheduler) == 2
+
+
+def test_import_reports_invalid_rows(tmp_path):
+    """Test that bad rows are skipped and reported while valid rows are imported."""
+    owner = _sample_owner()
+    existing_id = owner.pets[0].tasks[0].task_id
+    scheduler = Scheduler()
+    for t in owner.get_all_tasks():
+        scheduler.add_task(t)
+
+    rows = [
+        {"kind": "task", "pet": "Mochi", "title": "Meds", "category": "medication",
+         "scheduled_time": "2026-02-15T09:00:00", "priority": "high"},
+        {"kind": "task", "pet": "Rex", "title": "Walk", "category": "walk",
+         "scheduled_time": "2026-02-15T09:00:00"},
+        {"kind": "task", "pet": "Mochi", "title": "Groom", "category": "grooming",
+         "scheduled_time": "2026-02-15T10:00:00", "priority": "urgent"},
+        {"kind": "task", "pet": "Mochi", "title": "Vet", "category": "appointment",
+         "scheduled_time": "not a time"},
+        {"kind": "task", "pet": "Mochi", "task_id": existing_id, "title": "Walk",
+         "category": "walk", "scheduled_time": "2026-02-16T08:00:00"},
+    ]
+    path = tmp_path / "rows.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in rows) + "\n")
+
+    report = import_file(str(path), owner, scheduler)
+
+    assert report.tasks_added == 1
+    assert report.error_count == 4
+    assert [n for n, _ in report.errors] == [2, 3, 4, 5]
+    assert "unknown pet 'Rex'" in report.errors[0][1]
+    assert [t.title for t in owner.pets[0].tasks] == ["Walk", "Meds"]
+    assert len(scheduler) == 3
+    assert report.rows_per_second > 0
+
+
+def test_import_rows_from_generator_in_batches():
+    """Test that rows streamed from a generator are attached across several batches."""
+    owner = Owner(name="Jordan", email="jordan@email.com", phone="123")
+    scheduler = Scheduler()
+
+    def rows():
+        yield {"kind": "pet", "pet": "Mochi", "species": "dog", "date_of_birth": "2020-05-10"}
+        for i in range(25):
+            yield {"pet": "Mochi", "title": f"Task {i}", "category": "walk",
+                   "scheduled_time": f"2026-02-15T{i % 24:02d}:00:00"}
+
+    report = import_rows(rows(), owner, scheduler, batch_size=10)
+
+    assert report.tasks_added == 25
+    assert len(owner.pets[0].tasks) == 25
+    assert scheduler.sort_by_time()[0].title == "Task 0"
+    assert len(scheduler) == 25
+
+
+def test_import_rejects_duplicate_task_ids_per_row():
+    """Test that task IDs already on the owner or earlier in the batch are reported, not raised."""
+    owner = _sample_owner()
+    existing_id = owner.pets[1].tasks[0].task_id
+    rows = [
+        {"pet": "Mochi", "task_id": "brush", "title": "Brush", "category": "grooming",
+         "scheduled_time": "2026-02-15T09:00:00"},
+        {"pet": "Luna", "task_id": "brush", "title": "Brush", "category": "grooming",
+         "scheduled_time": "2026-02-15T10:00:00"},
+        {"pet": "Mochi", "task_id": existing_id, "title": "Feed", "category": "feeding",
+         "scheduled_time": "2026-02-16T07:45:00"},
+    ]
+
+    report = import_rows(rows, owner)
+
+    assert report.tasks_added == 1
+    assert [n for n, _ in report.errors] == [2, 3]
+    assert all("Duplicate task_id" in message for _, message in report.errors)
+    assert [t.title for t in owner.pets[0].tasks] == ["Walk", "Brush"]
+
+
+def test_import_file_counts_malformed_lines_as_row_errors(tmp_path):
+    """Test that invalid JSON and non-object lines are reported per row while the rest is imported."""
+    owner = _sample_owner()
+    path = tmp_path / "tasks.jsonl"
+    path.write_text(
+        '{"pet": "Mochi", "task_id": "brush", "title": "Brush", "category": "grooming", '
+        '"scheduled_time": "2026-02-15T09:00:00"}\n'
+        '[1, 2]\n'
+        '"x"\n'
+        '{"pet": "Mochi", "title": \n'
+        '{"pet": "Luna", "task_id": "play", "title": "Play", "category": "play", '
+        '"scheduled_time": "2026-02-15T10:00:00"}\n',
+        encoding="utf-8"
+    )
+
+    report = import_file(str(path), owner)
+
+    assert report.rows == 5 and report.tasks_added == 2
+    assert [n for n, _ in report.errors] == [2, 3, 4]
+    assert "invalid JSON" in report.errors[2][1]
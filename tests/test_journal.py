@@ -0,0 +1,139 @@
+import sys
+import os
+from datetime import datetime, date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_io import import_rows
+from pawpal_journal import Journal, read_journal, recover, replay
+
+NOW = datetime(2026, 3, 1, 8, 0)
+
+
+def _setup():
+    owner = Owner(name="Jordan", email="jordan@example.com", phone="123")
+    dog = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    owner.add_pet(dog)
+    dog.add_task(Task(title="Walk", description="", category="walk", task_id="walk",
+                      scheduled_time=NOW + timedelta(hours=1), recurrence_days=1, duration_minutes=30))
+    scheduler = Scheduler(clock=lambda: NOW)
+    scheduler.register_owner(owner)
+    return owner, dog, scheduler
+
+
+def _state(scheduler, owners):
+    tasks = [(t.task_id, t.title, t.scheduled_time, t.is_completed, str(t.priority))
+             for t in scheduler.sort_by_time()]
+    pets = {(o.name, p.name): [t.task_id for t in p.tasks] for o in owners for p in o.pets}
+    return tasks, pets
+
+
+def test_journal_records_changes_and_feeds_subscribers_deltas():
+    """Test that scheduler changes become numbered entries that subscribers receive incrementally."""
+    owner, dog, scheduler = _setup()
+    journal = Journal(retain=2)
+    journal.attach(scheduler)
+    seen = []
+    journal.subscribe(seen.append)
+
+    feed = Task(title="Feed", description="", category="feeding", task_id="feed",
+                scheduled_time=NOW + timedelta(hours=2))
+    dog.add_task(feed)
+    scheduler.add_task(feed)
+    scheduler.reschedule_task("feed", NOW + timedelta(hours=3))
+    scheduler.update_task("feed", priority="high")
+    next_walk = scheduler.complete_task_and_reschedule("walk")
+
+    assert [(e.seq, e.event) for e in seen] == \
+        [(1, "add"), (2, "reschedule"), (3, "update"), (4, "complete"), (5, "add")]
+    assert seen[0].data["pet"] == "Mochi" and seen[0].data["owner"] == "Jordan"
+    assert seen[4].task_id == next_walk.task_id and seen[4].data["pet"] == "Mochi"
+    assert [e.seq for e in journal.entries_since(3)] == [4, 5]
+    assert journal.entries_since(5) == []
+
+    caught_up = []
+    journal.subscribe(caught_up.append, since=4)
+    scheduler.remove_task("feed")
+    assert [(e.seq, e.event) for e in caught_up] == [(5, "add"), (6, "remove")]
+    with pytest.raises(ValueError):
+        journal.entries_since(0)
+
+
+def test_recover_replays_journal_over_checkpoint(tmp_path):
+    """Test that a crashed session is rebuilt from its checkpoint snapshot plus the journal."""
+    journal_path, snapshot_path = str(tmp_path / "pawpal.journal"), str(tmp_path / "pawpal.snap")
+    owner, dog, scheduler = _setup()
+    journal = Journal(journal_path, sync_every=2)
+    journal.attach(scheduler)
+
+    feed = Task(title="Feed", description="", category="feeding", task_id="feed",
+                scheduled_time=NOW + timedelta(hours=2))
+    dog.add_task(feed)
+    scheduler.add_task(feed)
+    journal.checkpoint(snapshot_path, [owner])
+    scheduler.complete_task_and_reschedule("walk")
+    scheduler.update_task("feed", title="Breakfast", duration_minutes=15)
+    scheduler.remove_task("feed")
+    dog.remove_task("feed")
+    meds = Task(title="Meds", description="", category="medication", task_id="meds",
+                scheduled_time=NOW + timedelta(hours=4), priority="high")
+    dog.add_task(meds)
+    scheduler.add_task(meds)
+    journal.sync()
+    # Simulate a crash in the middle of writing the next entry
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('[99,"add","tor')
+
+    assert [e.event for e in read_journal(journal_path)] == ["complete", "add", "update", "remove", "add"]
+    recovered, owners = recover(snapshot_path, journal_path, clock=lambda: NOW)
+    assert _state(recovered, owners) == _state(scheduler, [owner])
+    # Replaying again changes nothing
+    assert replay(read_journal(journal_path), recovered, owners) == 0
+    assert Journal(journal_path).last_seq == 6
+
+
+def test_reopened_torn_journal_keeps_appending_cleanly(tmp_path):
+    """Test that reopening a journal after a crash drops the torn line so later entries replay."""
+    journal_path = str(tmp_path / "pawpal.journal")
+    owner, dog, scheduler = _setup()
+    journal = Journal(journal_path)
+    journal.attach(scheduler)
+    scheduler.reschedule_task("walk", NOW + timedelta(hours=2))
+    journal.sync()
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('[2,"add","tor')
+
+    # The next session reopens the journal and keeps going
+    journal.detach()
+    reopened = Journal(journal_path)
+    assert reopened.last_seq == 1
+    reopened.attach(scheduler)
+    for task_id, hours in (("feed", 3), ("meds", 4)):
+        task = Task(title=task_id, description="", category="feeding", task_id=task_id,
+                    scheduled_time=NOW + timedelta(hours=hours))
+        dog.add_task(task)
+        scheduler.add_task(task)
+    reopened.close()
+
+    assert [e.seq for e in read_journal(journal_path)] == [1, 2, 3]
+    fresh = Scheduler(clock=lambda: NOW)
+    fresh.add_task(Task(title="Walk", description="", category="walk", task_id="walk",
+                        scheduled_time=NOW + timedelta(hours=1), recurrence_days=1, duration_minutes=30))
+    assert replay(read_journal(journal_path), fresh) == 3
+    assert [t.task_id for t in fresh.sort_by_time()] == ["walk", "feed", "meds"]
+
+
+def test_imported_tasks_are_journaled_with_their_pet():
+    """Test that tasks added by import_rows are recorded with their pet and owner."""
+    owner, dog, scheduler = _setup()
+    journal = Journal()
+    journal.attach(scheduler)
+    rows = [{"pet": "Mochi", "task_id": f"imported{i}", "title": "Play", "category": "enrichment",
+             "scheduled_time": (NOW + timedelta(hours=i)).isoformat()} for i in range(3)]
+
+    assert import_rows(rows, owner, scheduler).tasks_added == 3
+    assert [(e.event, e.data["pet"], e.data["owner"]) for e in journal.entries_since(0)] == \
+        [("add", "Mochi", "Jordan")] * 3
@@ -1,7 +1,8 @@
 import sys
 import os
 import pytest
-from datetime import datetime, date
+import random
+from datetime import datetime, date, timedelta
 
 # Ensure project root is on sys.path so tests can import the module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -73,9 +74,10 @@ def test_conflict_detection():
     conflicts = scheduler.detect_conflicts()
 
     assert len(conflicts) == 1
+    assert {conflicts[0].first.title, conflicts[0].second.title} == {"Walk", "Feed"}
     # ensure both task titles are mentioned in the conflict message
-    assert "Walk" in conflicts[0]
-    assert "Feed" in conflicts[0]
+    assert "Walk" in str(conflicts[0])
+    assert "Feed" in str(conflicts[0])
 
 
 def test_mark_complete():
@@ -181,3 +183,595 @@ def test_non_recurring_task_no_auto_creation():
     assert new_task is None
     assert len(scheduler.all_tasks) == 1
     assert task.is_completed
+
+
+def test_get_task_and_remove_by_id():
+    """Test that tasks can be looked up and removed by ID through the scheduler index."""
+    scheduler = Scheduler()
+    walk = Task(
+        title="Walk",
+        description="Morning walk",
+        category="walk",
+        scheduled_time=datetime(2026, 2, 15, 9, 0),
+    )
+    feed = Task(
+        title="Feed",
+        description="Breakfast",
+        category="feeding",
+        scheduled_time=datetime(2026, 2, 15, 8, 0),
+    )
+    scheduler.add_task(walk)
+    scheduler.add_task(feed)
+
+    assert scheduler.get_task(walk.task_id) is walk
+    assert scheduler.get_task("missing") is None
+
+    scheduler.remove_task(walk.task_id)
+
+    assert scheduler.get_task(walk.task_id) is None
+    assert scheduler.all_tasks == [feed]
+    # Completing a removed task is a no-op
+    assert scheduler.complete_task_and_reschedule(walk.task_id) is None
+    assert not walk.is_completed
+
+
+def test_duplicate_task_id_rejected():
+    """Test that two different tasks cannot share a task ID in one scheduler."""
+    scheduler = Scheduler()
+    first = Task(
+        title="Walk",
+        description="Morning walk",
+        category="walk",
+        scheduled_time=datetime(2026, 2, 15, 9, 0),
+        task_id="abc",
+    )
+    second = Task(
+        title="Feed",
+        description="Breakfast",
+        category="feeding",
+        scheduled_time=datetime(2026, 2, 15, 8, 0),
+        task_id="abc",
+    )
+    scheduler.add_task(first)
+    scheduler.add_task(first)  # re-adding the same task is harmless
+
+    with pytest.raises(ValueError):
+        scheduler.add_task(second)
+    assert len(scheduler) == 1
+
+
+def test_time_index_range_queries():
+    """Test that range queries and day views use scheduled times, including reschedules."""
+    scheduler = Scheduler()
+    now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    today_task = Task(title="Lunch", description="", category="feeding", scheduled_time=now)
+    tomorrow_task = Task(
+        title="Walk", description="", category="walk", scheduled_time=now + timedelta(days=1)
+    )
+    later_task = Task(
+        title="Vet", description="", category="appointment", scheduled_time=now + timedelta(days=10)
+    )
+    for t in (later_task, tomorrow_task, today_task):
+        scheduler.add_task(t)
+
+    assert scheduler.sort_by_time() == [today_task, tomorrow_task, later_task]
+    assert scheduler.get_today_tasks() == [today_task]
+    assert scheduler.get_upcoming_tasks(1) == [today_task, tomorrow_task]
+    assert scheduler.tasks_between(now, now + timedelta(days=1)) == [today_task]
+
+    scheduler.reschedule_task(later_task.task_id, now - timedelta(hours=1))
+    assert scheduler.sort_by_time() == [later_task, today_task, tomorrow_task]
+    assert scheduler.get_today_tasks() == [later_task, today_task]
+
+    scheduler.remove_task(today_task.task_id)
+    assert scheduler.get_today_tasks() == [later_task]
+
+
+def test_update_task_reindexes_and_bumps_version():
+    """Test that edits keep conflicts and priority order in sync and change the version."""
+    scheduler = Scheduler(clock=lambda: datetime(2026, 3, 1, 7, 0))
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 3, 1, 8, 0), duration_minutes=15, priority="low")
+    feed = Task(title="Feed", description="", category="feeding",
+                scheduled_time=datetime(2026, 3, 1, 8, 30), priority="medium")
+    scheduler.add_tasks([walk, feed])
+    version = scheduler.version
+    assert scheduler.detect_conflicts() == []
+
+    scheduler.update_task(walk.task_id, duration_minutes=45, priority="high")
+    assert scheduler.version != version
+    assert [(c.first, c.second) for c in scheduler.detect_conflicts()] == [(walk, feed)]
+    assert scheduler.peek_next() == [walk]
+
+    version = scheduler.version
+    scheduler.sort_by_time()
+    assert scheduler.version == version
+
+    with pytest.raises(ValueError):
+        scheduler.update_task(walk.task_id, is_completed=True)
+    assert scheduler.update_task("missing", title="x") is None
+
+
+def test_conflict_detection_uses_durations_and_dates():
+    """Test that overlapping durations conflict while back-to-back tasks and other days do not."""
+    owner = Owner(name="TestOwner", email="test@example.com", phone="123")
+    dog = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+    cat = Pet(name="Luna", species="cat", breed="Siamese", date_of_birth=date(2021, 1, 1))
+    owner.add_pet(dog)
+    owner.add_pet(cat)
+
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 2, 15, 9, 0), duration_minutes=30)
+    groom = Task(title="Groom", description="", category="grooming",
+                 scheduled_time=datetime(2026, 2, 15, 9, 15), duration_minutes=30)
+    feed = Task(title="Feed", description="", category="feeding",
+                scheduled_time=datetime(2026, 2, 15, 9, 40), duration_minutes=10)
+    next_day = Task(title="Walk", description="", category="walk",
+                    scheduled_time=datetime(2026, 2, 16, 9, 0), duration_minutes=30)
+    dog.add_task(walk)
+    dog.add_task(next_day)
+    cat.add_task(groom)
+    cat.add_task(feed)
+
+    scheduler = Scheduler()
+    for t in owner.get_all_tasks():
+        scheduler.add_task(t)
+
+    conflicts = scheduler.detect_conflicts()
+    assert [(c.first, c.second) for c in conflicts] == [(walk, groom), (groom, feed)]
+    assert conflicts[0].overlap_start == datetime(2026, 2, 15, 9, 15)
+    assert conflicts[0].overlap_end == datetime(2026, 2, 15, 9, 30)
+
+    # A task starting exactly when another ends is not a conflict
+    scheduler.reschedule_task(feed.task_id, datetime(2026, 2, 15, 9, 45))
+    assert [(c.first, c.second) for c in scheduler.detect_conflicts()] == [(walk, groom)]
+
+    assert scheduler.detect_conflicts(scope=dog) == []
+    assert scheduler.detect_conflicts(scope=cat) == []
+    assert len(scheduler.detect_conflicts(scope=owner)) == 1
+
+
+def test_incremental_conflicts_match_full_rebuild():
+    """Test that conflicts maintained on add/remove/reschedule and bulk adds match a full sweep."""
+    rng = random.Random(42)
+    scheduler = Scheduler()
+    base = datetime(2026, 2, 15, 8, 0)
+    task_ids = []
+
+    def new_task(i):
+        return Task(
+            title=f"Task {i}",
+            description="",
+            category="walk",
+            scheduled_time=base + timedelta(minutes=5 * rng.randrange(200)),
+            duration_minutes=rng.choice([0, 10, 30, 90]),
+        )
+
+    for i in range(300):
+        action = rng.random()
+        if action < 0.05:
+            # Large enough next to the schedule to take the bulk path
+            batch = [new_task(f"{i}.{n}") for n in range(10)]
+            scheduler.add_tasks(batch)
+            task_ids.extend(task.task_id for task in batch)
+        elif action < 0.6 or not task_ids:
+            task = new_task(i)
+            scheduler.add_task(task)
+            task_ids.append(task.task_id)
+        elif action < 0.8:
+            scheduler.remove_task(task_ids.pop(rng.randrange(len(task_ids))))
+        else:
+            scheduler.reschedule_task(
+                rng.choice(task_ids), base + timedelta(minutes=5 * rng.randrange(200))
+            )
+
+    cached = [(c.first.task_id, c.second.task_id) for c in scheduler.detect_conflicts()]
+    assert cached
+    assert scheduler.rebuild_conflicts()
+    assert [(c.first.task_id, c.second.task_id) for c in scheduler.detect_conflicts()] == cached
+
+
+def test_priority_queue_with_injected_clock():
+    """Test that overdue tasks come first, then priority, then time, using a fixed clock."""
+    now = datetime(2026, 2, 15, 12, 0)
+    scheduler = Scheduler(clock=lambda: now)
+    overdue_low = Task(title="Brush", description="", category="grooming",
+                       scheduled_time=datetime(2026, 2, 15, 8, 0), priority="low")
+    overdue_high = Task(title="Meds", description="", category="medication",
+                        scheduled_time=datetime(2026, 2, 15, 9, 0), priority="high")
+    later_high = Task(title="Vet", description="", category="appointment",
+                      scheduled_time=datetime(2026, 2, 15, 15, 0), priority="high")
+    soon_medium = Task(title="Walk", description="", category="walk",
+                       scheduled_time=datetime(2026, 2, 15, 13, 0), priority="medium",
+                       recurrence_days=1)
+    done = Task(title="Feed", description="", category="feeding",
+                scheduled_time=datetime(2026, 2, 15, 7, 0), priority="high", is_completed=True)
+    for t in (soon_medium, done, overdue_low, later_high, overdue_high):
+        scheduler.add_task(t)
+
+    expected = [overdue_high, overdue_low, later_high, soon_medium]
+    # Completed tasks are never overdue, so they sort with the upcoming group
+    assert scheduler.get_tasks_by_priority() == [overdue_high, overdue_low, done, later_high, soon_medium]
+    assert scheduler.peek_next(3) == expected[:3]
+
+    # Tasks completed directly on the Task are skipped
+    overdue_high.mark_complete()
+    assert scheduler.pop_next() is overdue_low
+    assert overdue_low.is_completed
+    assert scheduler.peek_next(10) == [later_high, soon_medium]
+
+    # Popping a recurring task rolls it over into the queue
+    scheduler.remove_task(later_high.task_id)
+    assert scheduler.pop_next() is soon_medium
+    next_walk = scheduler.peek_next(10)
+    assert len(next_walk) == 1
+    assert next_walk[0].scheduled_time == datetime(2026, 2, 16, 13, 0)
+
+
+def test_lazy_recurrence_expansion():
+    """Test that recurring tasks are projected over a window without creating Tasks."""
+    now = datetime(2026, 2, 15, 6, 0)
+    scheduler = Scheduler(clock=lambda: now)
+    pet = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 2, 15, 8, 0), recurrence_days=1)
+    vet = Task(title="Vet", description="", category="appointment",
+               scheduled_time=datetime(2026, 2, 17, 10, 0))
+    meds = Task(title="Meds", description="", category="medication",
+                scheduled_time=datetime(2026, 1, 5, 9, 0), recurrence_days=7)
+    for t in (walk, vet, meds):
+        pet.add_task(t)
+        scheduler.add_task(t)
+
+    occurrences = list(scheduler.get_upcoming_occurrences(2))
+    assert [(o.title, o.scheduled_time, o.is_virtual) for o in occurrences] == [
+        ("Walk", datetime(2026, 2, 15, 8, 0), False),
+        ("Walk", datetime(2026, 2, 16, 8, 0), True),
+        ("Meds", datetime(2026, 2, 16, 9, 0), True),
+        ("Walk", datetime(2026, 2, 17, 8, 0), True),
+        ("Vet", datetime(2026, 2, 17, 10, 0), False),
+    ]
+    assert len(scheduler) == 3
+
+    # A year-long horizon is still just a generator over three series
+    assert sum(1 for o in scheduler.get_upcoming_occurrences(365) if o.title == "Walk") == 366
+
+    completed = scheduler.complete_occurrence(occurrences[1], pet)
+    assert completed.is_completed
+    assert completed.recurrence_days == 0
+    assert scheduler.get_task(completed.task_id) is completed
+    assert completed in pet.tasks
+
+    after = list(scheduler.get_upcoming_occurrences(2))
+    assert [(o.title, o.is_virtual) for o in after] == [
+        ("Walk", False), ("Walk", False), ("Meds", True), ("Walk", True), ("Vet", False)
+    ]
+
+
+def test_rollover_reuses_occurrences_materialized_early():
+    """Test that completing a series head never duplicates an occurrence that was materialized early."""
+    start = datetime(2026, 2, 15, 8, 0)
+    for batched in (False, True):
+        scheduler = Scheduler(clock=lambda: start - timedelta(hours=1))
+        pet = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+        walk = Task(title="Walk", description="", category="walk", scheduled_time=start, recurrence_days=1)
+        pet.add_task(walk)
+        scheduler.add_task(walk)
+        day2, day3 = [o for o in scheduler.iter_occurrences(start, start + timedelta(days=3)) if o.is_virtual]
+        early = scheduler.materialize(day2, pet)
+        scheduler.complete_occurrence(day3, pet)
+
+        if batched:
+            assert scheduler.complete_many([walk.task_id]).created == [early]
+        else:
+            assert scheduler.complete_task_and_reschedule(walk.task_id) is early
+        assert early.recurrence_days == 1
+        # The day-3 occurrence was already done, so the series moves on to day 4
+        following = scheduler.complete_task_and_reschedule(early.task_id, pet)
+        assert following.scheduled_time == start + timedelta(days=3)
+        times = [t.scheduled_time for t in scheduler.sort_by_time()]
+        assert times == [start + timedelta(days=d) for d in range(4)]
+        assert [t.scheduled_time for t in pet.tasks] == times
+
+
+def test_same_title_tasks_of_other_pets_are_not_taken_as_occurrences():
+    """Test that a recurring series only adopts or hides occurrences materialized from it."""
+    start = datetime(2026, 2, 15, 8, 0)
+    for batched in (False, True):
+        owner = Owner(name="TestOwner", email="test@example.com", phone="123")
+        buddy = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+        luna = Pet(name="Luna", species="cat", breed="Siamese", date_of_birth=date(2021, 1, 1))
+        owner.add_pet(buddy)
+        owner.add_pet(luna)
+        feed = Task(title="Feed", description="", category="feeding", scheduled_time=start, recurrence_days=1)
+        other = Task(title="Feed", description="", category="feeding", scheduled_time=start + timedelta(days=1))
+        buddy.add_task(feed)
+        luna.add_task(other)
+        scheduler = Scheduler(clock=lambda: start - timedelta(hours=1))
+        scheduler.register_owner(owner)
+
+        # Luna's one-off does not hide Buddy's projected occurrence at the same time
+        window = list(scheduler.iter_occurrences(start + timedelta(days=1), start + timedelta(days=2)))
+        assert [(o.task, o.is_virtual) for o in window] == [(other, False), (feed, True)]
+
+        if batched:
+            following = scheduler.complete_many([feed.task_id], now=start).created[0]
+        else:
+            following = scheduler.complete_task_and_reschedule(feed.task_id)
+        assert following is not other
+        assert following.scheduled_time == start + timedelta(days=1)
+        assert following in buddy.tasks
+        assert other.recurrence_days == 0
+        assert luna.tasks == [other]
+
+
+def test_summarize_dashboard_aggregates():
+    """Test overdue, per-pet daily counts and completion rates from one summary call."""
+    now = datetime(2026, 2, 15, 12, 0)
+    owner = Owner(name="TestOwner", email="test@example.com", phone="123")
+    dog = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+    owner.add_pet(dog)
+    meds = Task(title="Meds", description="", category="medication",
+                scheduled_time=datetime(2026, 2, 15, 8, 0), priority="high")
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 2, 15, 9, 0), priority="high", is_completed=True)
+    walk2 = Task(title="Walk", description="", category="walk",
+                 scheduled_time=datetime(2026, 2, 16, 9, 0))
+    stray = Task(title="Clean", description="", category="cleaning",
+                 scheduled_time=datetime(2026, 3, 30, 9, 0))
+    for t in (meds, walk, walk2):
+        dog.add_task(t)
+    scheduler = Scheduler(clock=lambda: now)
+    for t in (meds, walk, walk2, stray):
+        scheduler.add_task(t)
+
+    summary = scheduler.summarize(owner, days=14)
+
+    assert summary.overdue_high_priority == [meds]
+    assert summary.daily_counts == {"Buddy": {date(2026, 2, 15): 2, date(2026, 2, 16): 1}}
+    assert summary.completion_rate == {"medication": 0.0, "walk": 0.5, "cleaning": 0.0}
+
+
+def test_owner_registry_finds_pets_without_caller_help():
+    """Test the task -> pet and name -> pet registries and rollover without passing a pet."""
+    owner = Owner(name="TestOwner", email="test@example.com", phone="123")
+    dog = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+    cat = Pet(name="Luna", species="cat", breed="Siamese", date_of_birth=date(2021, 1, 1))
+    owner.add_pet(dog)
+    owner.add_pet(cat)
+    meds = Task(title="Meds", description="", category="medication",
+                scheduled_time=datetime(2026, 3, 1, 9, 0), recurrence_days=1)
+    feed = Task(title="Feed", description="", category="feeding",
+                scheduled_time=datetime(2026, 3, 1, 8, 0))
+    dog.add_task(meds)
+    cat.add_task(feed)
+
+    assert owner.get_pet("Luna") is cat
+    assert owner.find_pet_for_task(feed.task_id) is cat
+    assert list(owner.iter_tasks()) == [meds, feed]
+
+    scheduler = Scheduler()
+    scheduler.register_owner(owner)
+    new_task = scheduler.complete_task_and_reschedule(meds.task_id)
+    assert dog.tasks == [meds, new_task]
+    assert owner.find_pet_for_task(new_task.task_id) is dog
+
+    cat.remove_task(feed.task_id)
+    assert owner.find_pet_for_task(feed.task_id) is None
+    owner.remove_pet("Buddy")
+    assert owner.get_pet("Buddy") is None
+    assert owner.find_pet_for_task(meds.task_id) is None
+    with pytest.raises(ValueError):
+        owner.add_pet(Pet(name="Luna", species="cat", breed="Tabby", date_of_birth=date(2022, 1, 1)))
+
+
+def test_scheduler_registers_equal_owners_separately_and_tracks_their_pets():
+    """Test that equal-valued owners are both registered and find_pet follows later pet changes."""
+    first = Owner(name="Sam", email="sam@example.com", phone="123")
+    second = Owner(name="Sam", email="sam@example.com", phone="123")
+    assert first == second
+    scheduler = Scheduler()
+    scheduler.register_owner(first)
+    scheduler.register_owner(second)
+    scheduler.register_owner(second)
+
+    dog = Pet(name="Rex", species="dog", breed="Boxer", date_of_birth=date(2020, 1, 1))
+    second.add_pet(dog)
+    walk = Task(title="Walk", description="", category="walk", scheduled_time=datetime(2026, 3, 1, 9, 0))
+    dog.add_task(walk)
+    assert scheduler.find_pet(walk.task_id) is dog
+    dog.remove_task(walk.task_id)
+    assert scheduler.find_pet(walk.task_id) is None
+    dog.add_task(walk)
+    second.remove_pet("Rex")
+    assert scheduler.find_pet(walk.task_id) is None
+
+
+def test_unregister_owner_removes_only_that_owners_tasks():
+    """Test that unregistering an owner unschedules their tasks and stops tracking their pets."""
+    first = Owner(name="Sam", email="sam@example.com", phone="123")
+    second = Owner(name="Ali", email="ali@example.com", phone="456")
+    for owner, pet_name in ((first, "Rex"), (second, "Luna")):
+        owner.add_pet(Pet(name=pet_name, species="dog", breed="Boxer", date_of_birth=date(2020, 1, 1)))
+    walk = Task(title="Walk", description="", category="walk", scheduled_time=datetime(2026, 3, 1, 9, 0))
+    feed = Task(title="Feed", description="", category="feeding", scheduled_time=datetime(2026, 3, 1, 8, 0))
+    first.pets[0].add_task(walk)
+    second.pets[0].add_task(feed)
+    scheduler = Scheduler()
+    scheduler.register_owner(first)
+    scheduler.register_owner(second)
+
+    scheduler.unregister_owner(first)
+    assert [t.task_id for t in scheduler.all_tasks] == [feed.task_id]
+    assert scheduler.find_pet(walk.task_id) is None
+    assert scheduler.find_pet(feed.task_id) is second.pets[0]
+    first.pets[0].add_task(Task(title="Play", description="", category="play",
+                                scheduled_time=datetime(2026, 3, 1, 10, 0), task_id="play"))
+    assert scheduler.find_pet("play") is None
+
+
+def test_day_buckets_follow_changes_and_filter_by_pet():
+    """Test day and week views across bulk adds, reschedules, removals and rollover."""
+    scheduler = Scheduler(clock=lambda: datetime(2026, 3, 2, 7, 0))
+    owner = Owner(name="TestOwner", email="test@example.com", phone="123")
+    dog = Pet(name="Buddy", species="dog", breed="Beagle", date_of_birth=date(2020, 1, 1))
+    cat = Pet(name="Luna", species="cat", breed="Siamese", date_of_birth=date(2021, 1, 1))
+    owner.add_pet(dog)
+    owner.add_pet(cat)
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 3, 2, 9, 0), recurrence_days=1)
+    feed = Task(title="Feed", description="", category="feeding",
+                scheduled_time=datetime(2026, 3, 2, 8, 0))
+    vet = Task(title="Vet", description="", category="appointment",
+               scheduled_time=datetime(2026, 3, 5, 10, 0))
+    dog.add_task(walk)
+    dog.add_task(vet)
+    cat.add_task(feed)
+    scheduler.register_owner(owner)
+
+    assert scheduler.get_today_tasks() == [feed, walk]
+    assert scheduler.get_today_tasks(pet=dog) == [walk]
+    assert scheduler.get_upcoming_tasks(3, pet=dog) == [walk, vet]
+
+    next_walk = scheduler.complete_task_and_reschedule(walk.task_id)
+    scheduler.reschedule_task(vet.task_id, datetime(2026, 3, 3, 7, 0))
+    scheduler.remove_task(feed.task_id)
+    week = scheduler.get_week(pet=dog)
+    assert list(week) == [date(2026, 3, 2) + timedelta(days=i) for i in range(7)]
+    assert week[date(2026, 3, 2)] == [walk]
+    assert week[date(2026, 3, 3)] == [vet, next_walk]
+    assert week[date(2026, 3, 5)] == []
+    assert scheduler.get_day_tasks(date(2026, 3, 2)) == [walk]
+
+
+def test_fork_what_if_shares_parent_and_commits_deltas():
+    """Test that a fork answers queries with its edits applied without touching the parent until commit."""
+    now = datetime(2026, 3, 1, 8, 0)
+    owner = Owner(name="Jordan", email="jordan@example.com", phone="123")
+    dog = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    owner.add_pet(dog)
+    walk = Task(title="Walk", description="", category="walk", task_id="walk",
+                scheduled_time=datetime(2026, 3, 1, 9, 0), duration_minutes=30, recurrence_days=1)
+    feed = Task(title="Feed", description="", category="feeding", task_id="feed",
+                scheduled_time=datetime(2026, 3, 1, 9, 30), duration_minutes=10)
+    vet = Task(title="Vet", description="", category="appointment", task_id="vet",
+               scheduled_time=datetime(2026, 3, 1, 11, 0), duration_minutes=60, priority="high")
+    for task in (walk, feed, vet):
+        dog.add_task(task)
+    scheduler = Scheduler(clock=lambda: now)
+    scheduler.register_owner(owner)
+
+    fork = scheduler.fork()
+    fork.reschedule_task("walk", datetime(2026, 3, 1, 9, 15))
+    fork.remove_task("vet")
+    fork.add_task(Task(title="Groom", description="", category="grooming", task_id="groom",
+                       scheduled_time=datetime(2026, 3, 1, 9, 35), duration_minutes=15), dog)
+
+    assert [t.task_id for t in fork.sort_by_time()] == ["walk", "feed", "groom"]
+    assert [(c.first.task_id, c.second.task_id) for c in fork.detect_conflicts(dog)] == \
+        [("walk", "feed"), ("walk", "groom"), ("feed", "groom")]
+    assert [t.task_id for t in fork.get_today_tasks(dog)] == ["walk", "feed", "groom"]
+    assert fork.peek_next(1)[0].task_id == "walk"
+    assert len(fork) == 3 and fork.get_task("vet") is None
+    # Only the edited task was copied; the parent is unchanged
+    assert fork.get_task("feed") is feed and fork.get_task("walk") is not walk
+    assert walk.scheduled_time == datetime(2026, 3, 1, 9, 0)
+    assert [t.task_id for t in scheduler.sort_by_time()] == ["walk", "feed", "vet"]
+    assert scheduler.detect_conflicts() == []
+
+    fork.commit()
+    assert [t.task_id for t in scheduler.sort_by_time()] == ["walk", "feed", "groom"]
+    assert walk.scheduled_time == datetime(2026, 3, 1, 9, 15)
+    assert dog.get_task("groom") is not None
+    assert scheduler.rebuild_conflicts()
+    with pytest.raises(ValueError):
+        fork.remove_task("feed")
+
+    stale = scheduler.fork()
+    stale.complete_task_and_reschedule("walk")
+    scheduler.remove_task("feed")
+    with pytest.raises(ValueError):
+        stale.commit()
+
+
+def test_fork_memory_scales_with_edits_not_schedule_size():
+    """Test that dozens of forks with a few edits each cost far less than copying the schedule."""
+    import tracemalloc
+    start = datetime(2026, 3, 1, 8, 0)
+    scheduler = Scheduler(clock=lambda: start)
+    scheduler.add_tasks(
+        Task(title=f"Task {i}", description="", category="walk", task_id=f"t{i}",
+             scheduled_time=start + timedelta(minutes=15 * i), duration_minutes=10)
+        for i in range(5000)
+    )
+    tracemalloc.start()
+    forks = []
+    for n in range(30):
+        fork = scheduler.fork()
+        for i in range(5):
+            fork.reschedule_task(f"t{n * 5 + i}", start + timedelta(minutes=15 * n * 5 + 5))
+        forks.append(fork)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert used < 1_000_000
+    assert len(forks[0].sort_by_time()) == 5000
+    assert len(forks[0].detect_conflicts()) > 0
+
+
+def test_priority_enum_and_slotted_models():
+    """Test that priorities become Priority members that still behave like their strings."""
+    from pawpal_system import Priority
+    task = Task(title="Meds", description="", category="".join(["medi", "cation"]),
+                scheduled_time=datetime(2026, 3, 1, 9, 0), task_id="m1", priority="high")
+    assert task.priority is Priority.HIGH and task.priority == "high"
+    assert f"{task.priority}" == "high" and task.priority.rank == 3
+    assert task.category is sys.intern("medication")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(ValueError):
+        Task(title="x", description="", category="walk",
+             scheduled_time=datetime(2026, 3, 1), priority="urgent")
+
+    scheduler = Scheduler(clock=lambda: datetime(2026, 3, 1, 12, 0))
+    scheduler.add_task(task)
+    scheduler.add_task(Task(title="Walk", description="", category="walk", task_id="w1",
+                            scheduled_time=datetime(2026, 3, 1, 8, 0), priority="low"))
+    scheduler.update_task("w1", priority="medium")
+    assert scheduler.get_task("w1").priority is Priority.MEDIUM
+    assert [t.task_id for t in scheduler.sort_by_priority()] == ["m1", "w1"]
+    assert [t.task_id for t in scheduler.get_tasks_by_priority()] == ["m1", "w1"]
+
+
+def test_complete_many_catches_up_overdue_recurring_tasks():
+    """Test that batch completion jumps recurring tasks straight to their next future occurrence."""
+    now = datetime(2026, 3, 1, 12, 0)
+    owner = Owner(name="Jordan", email="jordan@example.com", phone="123")
+    dog = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    owner.add_pet(dog)
+    walk = Task(title="Walk", description="", category="walk", task_id="walk",
+                scheduled_time=datetime(2026, 2, 1, 8, 0), recurrence_days=1, priority="high")
+    meds = Task(title="Meds", description="", category="medication", task_id="meds",
+                scheduled_time=datetime(2026, 2, 20, 9, 0), recurrence_days=7)
+    vet = Task(title="Vet", description="", category="appointment", task_id="vet",
+               scheduled_time=datetime(2026, 2, 28, 10, 0))
+    later = Task(title="Groom", description="", category="grooming", task_id="groom",
+                 scheduled_time=datetime(2026, 3, 2, 10, 0), recurrence_days=3)
+    for task in (walk, meds, vet, later):
+        dog.add_task(task)
+    scheduler = Scheduler(clock=lambda: now)
+    scheduler.register_owner(owner)
+
+    batch = scheduler.complete_many(["walk", "meds", "vet", "groom", "walk", "missing"],
+                                    log_skipped=True)
+
+    assert [t.task_id for t in batch.completed] == ["walk", "meds", "vet", "groom"]
+    assert [t.scheduled_time for t in batch.created] == [
+        datetime(2026, 3, 2, 8, 0), datetime(2026, 3, 6, 9, 0), datetime(2026, 3, 5, 10, 0)
+    ]
+    assert batch.skipped_count == 28 + 1
+    walk_run = batch.skipped[0]
+    assert (walk_run.task_id, walk_run.count) == ("walk", 28)
+    assert next(walk_run.times()) == datetime(2026, 2, 2, 8, 0)
+    assert list(walk_run.times())[-1] == datetime(2026, 3, 1, 8, 0)
+    assert all(t in dog.tasks for t in batch.created)
+    assert [t.title for t in scheduler.peek_next(5)] == ["Walk", "Groom", "Meds"]
+    assert scheduler.rebuild_conflicts()
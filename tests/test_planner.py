@@ -0,0 +1,76 @@
+import sys
+import os
+import random
+from datetime import datetime, date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_planner import plan_day
+
+
+def _owner(tasks):
+    owner = Owner(name="Jordan", email="jordan@example.com", phone="123")
+    pet = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    owner.add_pet(pet)
+    for task in tasks:
+        pet.add_task(task)
+    return owner
+
+
+def _task(title, minutes, priority, hour=8, category="general"):
+    return Task(title=title, description="", category=category,
+                scheduled_time=datetime(2026, 3, 2, hour, 0),
+                priority=priority, duration_minutes=minutes)
+
+
+def test_plan_day_beats_greedy_and_honours_appointments():
+    """Test that the optimizer keeps appointments fixed and finds the best fit around them."""
+    vet = _task("Vet", 60, "high", hour=9, category="appointment")
+    # 8:00-11:00 minus the vet visit leaves two 60-minute slots.
+    # Greedy by value density takes the 40-minute task first and wastes room;
+    # the optimum is the two 60-minute tasks.
+    walk = _task("Walk", 60, "high")
+    groom = _task("Groom", 60, "high")
+    play = _task("Play", 40, "medium")
+    owner = _owner([vet, walk, groom, play])
+    window = (datetime(2026, 3, 2, 8, 0), datetime(2026, 3, 2, 11, 0))
+
+    plan = plan_day(owner, [window])
+
+    assert plan.optimal
+    assert [e.task.title for e in plan.entries] == ["Walk", "Vet", "Groom"]
+    vet_entry = plan.entries[1]
+    assert vet_entry.start == vet.scheduled_time
+    assert "Fixed appointment" in vet_entry.reason
+    assert [t.title for t, _ in plan.skipped] == ["Play"]
+    assert len(plan.explain()) == 4
+
+    scheduler = Scheduler()
+    scheduler.add_tasks(owner.get_all_tasks())
+    assert plan.apply(scheduler) == 1
+    assert groom.scheduled_time == datetime(2026, 3, 2, 10, 0)
+    # Only the skipped task is left where it was, overlapping the walk
+    assert [(c.first, c.second) for c in scheduler.detect_conflicts()] == [(walk, play)]
+
+
+def test_plan_day_hundreds_of_candidates_within_budget():
+    """Test that a large candidate set returns a valid plan within the latency budget."""
+    rng = random.Random(7)
+    tasks = [
+        _task(f"Task {i}", rng.choice([5, 10, 15, 20, 30, 45]), rng.choice(["low", "medium", "high"]))
+        for i in range(300)
+    ]
+    windows = [
+        (datetime(2026, 3, 2, 7, 0), datetime(2026, 3, 2, 9, 0)),
+        (datetime(2026, 3, 2, 17, 0), datetime(2026, 3, 2, 20, 0)),
+    ]
+
+    plan = plan_day(_owner(tasks), windows, latency_budget_ms=20)
+
+    assert plan.elapsed_ms < 1000
+    assert len(plan.entries) + len(plan.skipped) == 300
+    assert sum(e.task.duration_minutes for e in plan.entries) <= 300
+    for a, b in zip(plan.entries, plan.entries[1:]):
+        assert a.end <= b.start
+    assert all(any(s <= e.start and e.end <= w for s, w in windows) for e in plan.entries)
@@ -0,0 +1,73 @@
+import sys
+import os
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Scheduler, Task
+from pawpal_concurrent import ThreadSafeScheduler
+import pawpal_profiling
+
+
+def test_profiling_records_calls_and_restores_methods():
+    """Test that instrumentation counts calls while enabled and leaves no wrappers behind."""
+    original = Scheduler.sort_by_time
+    pawpal_profiling.reset()
+    scheduler = Scheduler()
+    with pawpal_profiling.profiled():
+        assert Scheduler.sort_by_time is not original
+        for hour in (9, 8):
+            scheduler.add_task(Task(title="Walk", description="", category="walk",
+                                    scheduled_time=datetime(2026, 3, 1, hour, 0)))
+        scheduler.sort_by_time()
+        scheduler.sort_by_time()
+
+    assert Scheduler.sort_by_time is original
+    stats = pawpal_profiling.snapshot()
+    assert stats["Scheduler.add_task"].calls == 2
+    assert stats["Scheduler.sort_by_time"].calls == 2
+    assert stats["Scheduler.sort_by_time"].tasks_touched == 4
+    assert sum(stats["Scheduler.sort_by_time"].histogram) == 2
+
+    # Calls made while disabled are not recorded
+    scheduler.sort_by_time()
+    assert pawpal_profiling.snapshot()["Scheduler.sort_by_time"].calls == 2
+    assert "Scheduler.sort_by_time" in pawpal_profiling.format_snapshot()
+
+
+def test_profiling_sees_calls_through_thread_safe_scheduler():
+    """Test that methods called through ThreadSafeScheduler's locking wrappers are recorded."""
+    pawpal_profiling.reset()
+    scheduler = ThreadSafeScheduler()
+    with pawpal_profiling.profiled():
+        scheduler.add_task(Task(title="Walk", description="", category="walk",
+                                scheduled_time=datetime(2026, 3, 1, 9, 0)))
+        scheduler.sort_by_time()
+
+    stats = pawpal_profiling.snapshot()
+    assert stats["Scheduler.add_task"].calls == 1
+    assert stats["Scheduler.sort_by_time"].tasks_touched == 1
+
+
+def test_profiling_times_generators_while_they_are_iterated():
+    """Test that a generator method is recorded once exhausted, with the time spent producing its items."""
+    class Slow:
+        def items(self, count):
+            for i in range(count):
+                time.sleep(0.01)
+                yield i
+
+    pawpal_profiling.reset()
+    with pawpal_profiling.profiled([Slow]):
+        items = Slow().items(3)
+        assert "Slow.items" not in pawpal_profiling.snapshot()
+        assert list(items) == [0, 1, 2]
+        # Stopping early still records the items produced so far
+        for _ in Slow().items(5):
+            break
+
+    stats = pawpal_profiling.snapshot()["Slow.items"]
+    assert stats.calls == 2
+    assert stats.tasks_touched == 4
+    assert stats.total_seconds >= 0.04
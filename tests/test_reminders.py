@@ -0,0 +1,114 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Task, Scheduler
+from pawpal_reminders import ReminderDispatcher
+
+
+def _task(title, when, **kwargs):
+    return Task(title=title, description="", category="walk", scheduled_time=when, **kwargs)
+
+
+def test_dispatcher_follows_scheduler_changes():
+    """Test that reminders fire when due and track adds, removals, completions and reschedules."""
+    scheduler = Scheduler()
+    now = datetime.now()
+    scheduler.add_task(_task("Overdue", now - timedelta(minutes=5)))
+    scheduler.add_task(_task("Done", now - timedelta(minutes=5), is_completed=True))
+    fired = []
+
+    async def notify(task):
+        fired.append(task.title)
+
+    async def scenario():
+        dispatcher = ReminderDispatcher(scheduler, notify)
+        runner = asyncio.create_task(dispatcher.run())
+        await asyncio.sleep(0.01)
+        assert fired == ["Overdue"]
+
+        soon = datetime.now() + timedelta(milliseconds=50)
+        scheduler.add_task(_task("Soon", soon))
+        removed = _task("Removed", soon)
+        scheduler.add_task(removed)
+        scheduler.remove_task(removed.task_id)
+        walk = _task("Walk", soon, recurrence_days=1)
+        scheduler.add_task(walk)
+        scheduler.complete_task_and_reschedule(walk.task_id)
+        moved = _task("Moved", datetime.now() + timedelta(hours=1))
+        scheduler.add_task(moved)
+        scheduler.reschedule_task(moved.task_id, datetime.now() + timedelta(milliseconds=20))
+
+        # Only the rolled-over walk (tomorrow) is left waiting
+        await asyncio.sleep(0.15)
+        assert fired == ["Overdue", "Moved", "Soon"]
+        assert dispatcher.pending_count == 1
+
+        dispatcher.stop()
+        await runner
+
+    asyncio.run(scenario())
+    # The dispatcher unsubscribes when it stops
+    assert scheduler._listeners == []
+
+
+def test_dispatcher_handles_many_pending_reminders():
+    """Test that 100k pending reminders load quickly and only the due one fires."""
+    scheduler = Scheduler()
+    tomorrow = datetime.now() + timedelta(days=1)
+    scheduler.add_tasks(
+        _task(f"Task {i}", tomorrow + timedelta(seconds=i), task_id=f"t{i}") for i in range(100_000)
+    )
+    fired = []
+
+    async def notify(task):
+        fired.append(task.task_id)
+
+    async def scenario():
+        dispatcher = ReminderDispatcher(scheduler, notify)
+        runner = asyncio.create_task(dispatcher.run())
+        await asyncio.sleep(0)
+        scheduler.add_task(_task("Now", datetime.now(), task_id="now"))
+        await asyncio.sleep(0.05)
+        assert fired == ["now"]
+        assert dispatcher.pending_count == 100_000
+        dispatcher.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+
+def test_dispatcher_accepts_changes_from_other_threads():
+    """Test that changes from another thread wake the loop and stale heap entries are compacted."""
+    scheduler = Scheduler()
+    later = datetime.now() + timedelta(hours=1)
+    task = _task("Walk", later)
+    scheduler.add_task(task)
+    fired = []
+
+    async def notify(task):
+        fired.append(task.title)
+
+    dispatcher = ReminderDispatcher(scheduler, notify)
+    loop_thread = threading.Thread(target=asyncio.run, args=(dispatcher.run(),), daemon=True)
+    loop_thread.start()
+    time.sleep(0.05)
+
+    # Each move is earlier, so the stale entries sit below the heap's top
+    for seconds in range(1, 1000):
+        scheduler.reschedule_task(task.task_id, later - timedelta(seconds=seconds))
+    scheduler.add_task(_task("Now", datetime.now()))
+    time.sleep(0.1)
+    assert fired == ["Now"]
+    assert dispatcher.pending_count == 1
+    assert len(dispatcher._heap) < 200
+
+    dispatcher.stop()
+    loop_thread.join(1)
+    assert not loop_thread.is_alive()
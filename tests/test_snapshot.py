@@ -0,0 +1,65 @@
+import sys
+import os
+from datetime import datetime, date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_snapshot import Snapshot, write_snapshot
+
+
+def _owner():
+    owner = Owner(name="Jordan", email="jordan@example.com", phone="123")
+    dog = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    cat = Pet(name="Luna", species="cat", breed="Siamese", date_of_birth=date(2021, 8, 15))
+    owner.add_pet(dog)
+    owner.add_pet(cat)
+    dog.add_task(Task(title="Walk", description="Around the park 🐾", category="walk",
+                      scheduled_time=datetime(2026, 3, 2, 9, 0), task_id="w1",
+                      duration_minutes=30, recurrence_days=1, priority="high", series_id="w0"))
+    dog.add_task(Task(title="Feed", description="", category="feeding",
+                      scheduled_time=datetime(2026, 3, 1, 8, 0), task_id="f1", is_completed=True))
+    cat.add_task(Task(title="Feed", description="", category="feeding",
+                      scheduled_time=datetime(2026, 3, 2, 9, 15), task_id="f2", priority="low"))
+    return owner
+
+
+def test_snapshot_round_trip_and_lazy_queries(tmp_path):
+    """Test that a snapshot restores owners, pets and tasks and answers lookups lazily."""
+    owner = _owner()
+    scheduler = Scheduler()
+    scheduler.register_owner(owner)
+    loose = Task(title="Order food", description="", category="shopping",
+                 scheduled_time=datetime(2026, 3, 3, 12, 0), task_id="x1")
+    scheduler.add_task(loose)
+    path = str(tmp_path / "state.snap")
+    assert write_snapshot(path, [owner], scheduler) == 4
+
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == 4
+        assert snapshot.get_task("f2").title == "Feed"
+        assert snapshot.get_task("missing") is None
+        day = snapshot.tasks_between(datetime(2026, 3, 2), datetime(2026, 3, 3))
+        assert [t.task_id for t in day] == ["w1", "f2"]
+        # Only the tasks asked for have been built
+        assert len(snapshot._tasks) == 2
+        assert snapshot.get_task("w1") is day[0]
+
+        restored = snapshot.to_scheduler()
+        assert snapshot.load_owners() == [owner]
+        assert [t.task_id for t in restored.sort_by_time()] == ["f1", "w1", "f2", "x1"]
+        assert restored.get_task("w1").description == "Around the park 🐾"
+        assert [(c.first.task_id, c.second.task_id) for c in restored.detect_conflicts()] == \
+            [("w1", "f2")]
+        next_walk = restored.complete_task_and_reschedule("w1")
+        assert restored.find_pet(next_walk.task_id).name == "Mochi"
+
+
+def test_snapshot_rejects_foreign_files(tmp_path):
+    """Test that files without the snapshot header are refused."""
+    path = tmp_path / "not.snap"
+    path.write_bytes(b"hello" * 40)
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
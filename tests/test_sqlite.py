@@ -0,0 +1,192 @@
+import sys
+import os
+import random
+import sqlite3
+import pytest
+from datetime import datetime, date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_sqlite import SCHEMA, SQLiteStore, SQLiteScheduler
+
+
+def _ids(tasks):
+    return [t.task_id for t in tasks]
+
+
+def _build_owner(task_count, seed=3):
+    rng = random.Random(seed)
+    owner = Owner(name="Jordan", email="jordan@email.com", phone="123")
+    pets = [
+        Pet(name=name, species="dog", breed="Mixed", date_of_birth=date(2020, 5, 10))
+        for name in ("Mochi", "Luna")
+    ]
+    for pet in pets:
+        owner.add_pet(pet)
+    base = datetime(2026, 2, 15, 0, 0)
+    for i in range(task_count):
+        rng.choice(pets).add_task(Task(
+            title=f"Task {i}",
+            description="",
+            category=rng.choice(["walk", "feeding"]),
+            scheduled_time=base + timedelta(minutes=15 * rng.randrange(300)),
+            priority=rng.choice(["low", "medium", "high"]),
+            is_completed=rng.random() < 0.2,
+            duration_minutes=rng.choice([0, 15, 45]),
+            series_id=rng.choice([None, "s1"]),
+        ))
+    return owner
+
+
+def test_sqlite_queries_match_scheduler(tmp_path):
+    """Test that SQL-backed queries return the same results as the in-memory Scheduler."""
+    now = datetime(2026, 2, 16, 12, 0)
+    owner = _build_owner(300)
+    store = SQLiteStore(str(tmp_path / "pawpal.db"))
+    store.save_owner(owner)
+    sql = SQLiteScheduler(store, owner="Jordan", clock=lambda: now)
+
+    scheduler = Scheduler(clock=lambda: now)
+    for pet in owner.pets:
+        for t in pet.tasks:
+            scheduler.add_task(t)
+
+    assert len(sql) == len(scheduler)
+    assert _ids(sql.sort_by_time()) == _ids(scheduler.sort_by_time())
+    assert _ids(sql.get_tasks_by_priority()) == _ids(scheduler.get_tasks_by_priority())
+    assert _ids(sql.peek_next(5)) == _ids(scheduler.peek_next(5))
+    assert _ids(sql.get_today_tasks()) == _ids(scheduler.get_today_tasks())
+    assert _ids(sql.get_upcoming_tasks(1)) == _ids(scheduler.get_upcoming_tasks(1))
+    for scope in (None, owner, owner.pets[0]):
+        assert [
+            (c.first.task_id, c.second.task_id) for c in sql.detect_conflicts(scope)
+        ] == [
+            (c.first.task_id, c.second.task_id) for c in scheduler.detect_conflicts(scope)
+        ]
+
+    # State survives reopening the database
+    store.close()
+    reopened = SQLiteStore(str(tmp_path / "pawpal.db"))
+    loaded = reopened.load_owner("Jordan")
+    assert [p.name for p in loaded.pets] == ["Mochi", "Luna"]
+    assert [_ids(p.tasks) for p in loaded.pets] == [_ids(p.tasks) for p in owner.pets]
+    assert [p.tasks for p in loaded.pets] == [p.tasks for p in owner.pets]
+
+
+def test_sqlite_mutations():
+    """Test add, reschedule, recurring completion and removal through SQL."""
+    store = SQLiteStore()
+    owner = Owner(name="Jordan", email="jordan@email.com", phone="123")
+    dog = Pet(name="Mochi", species="dog", breed="Shiba Inu", date_of_birth=date(2020, 5, 10))
+    owner.add_pet(dog)
+    store.save_owner(owner)
+    sql = SQLiteScheduler(store, owner="Jordan")
+
+    walk = Task(title="Walk", description="", category="walk",
+                scheduled_time=datetime(2026, 2, 15, 8, 0), recurrence_days=1)
+    sql.add_task(walk, dog)
+    sql.reschedule_task(walk.task_id, datetime(2026, 2, 15, 9, 0))
+    assert sql.get_task(walk.task_id).scheduled_time == datetime(2026, 2, 15, 9, 0)
+
+    new_task = sql.complete_task_and_reschedule(walk.task_id)
+    assert sql.get_task(walk.task_id).is_completed
+    assert new_task.scheduled_time == datetime(2026, 2, 16, 9, 0)
+    # The next occurrence stays attached to the same pet
+    assert _ids(store.load_owner("Jordan").pets[0].tasks) == [walk.task_id, new_task.task_id]
+
+    with pytest.raises(ValueError):
+        sql.add_task(walk)
+
+    sql.remove_task(walk.task_id)
+    assert sql.get_task(walk.task_id) is None
+    assert len(sql) == 1
+
+
+def test_saving_an_owner_deletes_removed_pets_and_tasks(tmp_path):
+    """Test that removing tasks and pets in memory, then saving, removes them from the database."""
+    owner = _build_owner(40)
+    store = SQLiteStore(str(tmp_path / "pawpal.db"))
+    store.save_owner(owner)
+
+    mochi, luna = owner.pets
+    dropped = mochi.tasks[0]
+    mochi.remove_task(dropped.task_id)
+    moved = mochi.tasks[0]
+    mochi.remove_task(moved.task_id)
+    luna.add_task(moved)
+    owner.remove_pet("Luna")
+    store.save_owner(owner)
+
+    loaded = store.load_owner("Jordan")
+    assert [p.name for p in loaded.pets] == ["Mochi"]
+    assert loaded.pets[0].tasks == mochi.tasks
+    assert SQLiteScheduler(store).get_task(dropped.task_id) is None
+    assert len(SQLiteScheduler(store)) == len(mochi.tasks)
+
+
+def test_sqlite_scheduler_views_updates_and_pop_next_match_scheduler():
+    """Test update_task, pet-filtered day/week views and pop_next against the in-memory Scheduler."""
+    now = datetime(2026, 2, 16, 12, 0)
+    owner = _build_owner(120)
+    store = SQLiteStore()
+    store.save_owner(owner)
+    sql = SQLiteScheduler(store, owner=owner, clock=lambda: now)
+    scheduler = Scheduler(clock=lambda: now)
+    scheduler.register_owner(owner)
+
+    target = owner.pets[0].tasks[0].task_id
+    changes = dict(title="Vet", priority="high", scheduled_time=datetime(2026, 2, 16, 7, 0))
+    assert sql.update_task(target, **changes) == scheduler.update_task(target, **changes)
+    with pytest.raises(ValueError):
+        sql.update_task(target, is_completed=True)
+
+    for pet in (None,) + tuple(owner.pets):
+        assert _ids(sql.get_today_tasks(pet)) == _ids(scheduler.get_today_tasks(pet))
+        assert _ids(sql.get_upcoming_tasks(1, pet)) == _ids(scheduler.get_upcoming_tasks(1, pet))
+        assert {day: _ids(tasks) for day, tasks in sql.get_week(pet=pet).items()} == {
+            day: _ids(tasks) for day, tasks in scheduler.get_week(pet=pet).items()
+        }
+
+    for _ in range(3):
+        popped = sql.pop_next()
+        assert popped == scheduler.pop_next()
+        assert popped.is_completed
+
+
+def test_owners_with_the_same_name_are_stored_separately(tmp_path):
+    """Test that two owners sharing a name keep their own rows, pets and tasks."""
+    first = _build_owner(10, seed=1)
+    second = _build_owner(10, seed=2)
+    store = SQLiteStore(str(tmp_path / "pawpal.db"))
+    first_id = store.save_owner(first)
+    second_id = store.save_owner(second)
+    assert first_id != second_id
+    assert store.save_owner(first) == first_id
+
+    assert store.load_owner(first_id).pets == first.pets
+    assert store.load_owner(second_id).pets == second.pets
+    with pytest.raises(ValueError):
+        store.load_owner("Jordan")
+    assert len(SQLiteScheduler(store)) == first.task_count + second.task_count
+
+
+def test_opening_a_database_with_unique_owner_names_keeps_its_data(tmp_path):
+    """Test that a database from before owners had surrogate keys is migrated without losing pets."""
+    path = str(tmp_path / "pawpal.db")
+    old = sqlite3.connect(path)
+    old.executescript(
+        SCHEMA.replace("name TEXT NOT NULL,\n    email", "name TEXT NOT NULL UNIQUE,\n    email")
+    )
+    old.execute("INSERT INTO owners (name, email, phone) VALUES ('Jordan', 'jordan@email.com', '123')")
+    old.execute(
+        "INSERT INTO pets (owner_id, name, species, breed, date_of_birth) "
+        "VALUES (1, 'Mochi', 'dog', 'Shiba Inu', '2020-05-10')"
+    )
+    old.commit()
+    old.close()
+
+    store = SQLiteStore(path)
+    assert [p.name for p in store.load_owner("Jordan").pets] == ["Mochi"]
+    store.save_owner(Owner(name="Jordan", email="other@email.com", phone="456"))
+    assert store.conn.execute("SELECT COUNT(*) FROM owners").fetchone()[0] == 2